@@ -0,0 +1,63 @@
+# Times parsing of generated sprites with a growing number of statements
+# and list items. Parsing should scale linearly, so the time per line
+# should stay about the same as the file grows.
+#
+#     python benchmarks/list_productions.py [max lines]
+from argparse import ArgumentParser
+import tempfile
+import time
+import sys
+import os
+
+def generate_sprite(line_count):
+    lines = ["scratch.on_flag() {", "    x: num = 0;"]
+    lines.extend("    x += 1;" for _ in range(line_count // 2))
+
+    # One long list literal for the rest of the lines
+    item_count = line_count - len(lines)
+    lines.append("    items[] = [")
+    lines.extend(f"        {i}," for i in range(item_count - 1))
+    lines.append(f"        {item_count - 1}")
+    lines.append("    ];")
+    lines.append("}")
+
+    return "\n".join(lines)
+
+def time_parse(source):
+    from scrybe import filestate
+    from scrybe.scriptparser import parse_file
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "sprite.sbs")
+        with open(file_path, "w") as handle:
+            handle.write(source)
+
+        filestate.open_file(file_path)
+        start_time = time.perf_counter()
+        ast = parse_file()
+        elapsed = time.perf_counter() - start_time
+        filestate.close_file()
+
+    return elapsed, ast
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("lines", nargs="?", type=int, default=50_000, help="Largest sprite size in lines")
+    arguments = parser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+    line_count = 1_000
+    sizes = []
+    while line_count < arguments.lines:
+        sizes.append(line_count)
+        line_count *= 5
+    sizes.append(arguments.lines)
+
+    print(f"{'lines':>8} {'seconds':>9} {'us/line':>9}")
+    for size in sizes:
+        elapsed, _ = time_parse(generate_sprite(size))
+        print(f"{size:>8} {elapsed:>9.3f} {elapsed / size * 1e6:>9.1f}")
+
+if __name__ == "__main__":
+    main()
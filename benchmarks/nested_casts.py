@@ -0,0 +1,79 @@
+# Times building the scripts of a generated sprite whose expressions are
+# wrapped in nested `tonum`/`tostr` casts. Casting only changes the type
+# Scrybe sees, so the time per cast should not grow with the nesting depth.
+#
+#     python benchmarks/nested_casts.py [max depth] [statements]
+from argparse import ArgumentParser
+import tempfile
+import time
+import os
+
+def generate_expression(depth):
+    expression = "x + 1"
+    for _ in range(depth):
+        expression = f"tonum(tostr({expression})) + 1"
+
+    return expression
+
+def generate_sprite(depth, statement_count):
+    lines = ["scratch.on_flag() {", "    x: num = 0;"]
+    lines.extend(f"    x = {generate_expression(depth)};" for _ in range(statement_count))
+    lines.append("}")
+
+    return "\n".join(lines)
+
+def time_build(source):
+    from scrybe import filestate
+    from scrybe.builder import ProjectBuilder
+    from scrybe.context import CompilationContext, activate
+    from scrybe.files import ProjectFiles
+    from scrybe.scriptparser import parse_file
+
+    running_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            os.mkdir("sprites")
+            with open("sprites/casts.sbs", "w") as handle:
+                handle.write(source)
+
+            with activate(CompilationContext(ProjectFiles(os.curdir))):
+                projectbuilder = ProjectBuilder(ProjectFiles(os.curdir))
+
+                filestate.open_file("sprites/casts.sbs")
+                projectbuilder.add_sprite(parse_file(), "casts.sbs")
+                filestate.close_file()
+
+                start_time = time.perf_counter()
+                projectbuilder.build()
+                elapsed = time.perf_counter() - start_time
+
+        finally:
+            os.chdir(running_directory)
+
+    return elapsed
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("depth", nargs="?", type=int, default=64, help="Deepest nesting of casts")
+    parser.add_argument("statements", nargs="?", type=int, default=100, help="Statements per sprite")
+    arguments = parser.parse_args()
+
+    from scrybe.logger import logger
+    logger.log_level = "error"
+
+    depths = []
+    depth = 4
+    while depth < arguments.depth:
+        depths.append(depth)
+        depth *= 2
+    depths.append(arguments.depth)
+
+    print(f"{'depth':>6} {'casts':>7} {'seconds':>9} {'us/cast':>9}")
+    for depth in depths:
+        cast_count = depth * 2 * arguments.statements
+        elapsed = time_build(generate_sprite(depth, arguments.statements))
+        print(f"{depth:>6} {cast_count:>7} {elapsed:>9.3f} {elapsed / cast_count * 1e6:>9.1f}")
+
+if __name__ == "__main__":
+    main()
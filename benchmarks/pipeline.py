@@ -0,0 +1,233 @@
+# Generates a synthetic project and times every stage of compiling it:
+# lexing, parsing, adding the targets, building the scripts and saving.
+# Results are printed (or written) as JSON so runs of different versions
+# can be compared.
+#
+#     python benchmarks/pipeline.py [-sprites N] [-statements N] [-depth N] ...
+from argparse import ArgumentParser
+import tempfile
+import platform
+import json
+import time
+import sys
+import os
+
+# A plain square so the targets have a costume to save
+COSTUME = '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><rect width="10" height="10"/></svg>'
+
+STAGES = ("lex", "parse", "setup", "add_targets", "build", "save")
+
+# `(((v0 + v1) - v2) * v3) ...` with `depth` operations
+def generate_expression(depth, variable_count, offset=0):
+    operators = ("+", "-", "*")
+    expression = f"v{offset % variable_count}"
+    for i in range(depth):
+        expression = f"({expression} {operators[i % 3]} v{(offset + i + 1) % variable_count})"
+
+    return expression
+
+def generate_declarations(variable_count, indent="    "):
+    return [f"{indent}v{i}: num = {i};" for i in range(variable_count)]
+
+def generate_statements(parameters, seed):
+    depth = parameters["depth"]
+    variable_count = parameters["variables"]
+    function_count = parameters["functions"]
+
+    lines = []
+    for i in range(parameters["statements"]):
+        target = f"v{(seed + i) % variable_count}"
+        match i % 4:
+            case 0: lines.append(f"    {target} = {generate_expression(depth, variable_count, i)};")
+            case 1: lines.append(f"    if ({generate_expression(depth, variable_count, i)} > g{i % parameters['globals']}) {{ {target} += 1; }}")
+            case 2 if function_count: lines.append(f"    {target} = f{i % function_count}({target}, v{i % variable_count});")
+            case _: lines.append(f"    {target} += {generate_expression(depth, variable_count, i)};")
+
+    return lines
+
+def generate_setup(parameters):
+    lines = ['project "Benchmark";']
+    lines.extend(f"g{i}: num = {i};" for i in range(parameters["globals"]))
+
+    return "\n".join(lines)
+
+def generate_stage(parameters):
+    lines = ['#costume "costume.svg"', "scratch.on_flag() {"]
+    lines.extend(f'    scratch.broadcast("message{i}");' for i in range(parameters["broadcasts"]))
+    lines.append("}")
+
+    return "\n".join(lines)
+
+def generate_sprite(parameters, sprite_index):
+    lines = ['#costume "costume.svg"']
+
+    for i in range(parameters["functions"]):
+        lines.append(f"num function f{i}(a, b) {{")
+        lines.extend(generate_declarations(parameters["variables"]))
+        lines.append(f"    return a + b * {generate_expression(parameters['depth'], parameters['variables'], i)};")
+        lines.append("}")
+
+    lines.append("scratch.on_flag() {")
+    lines.extend(generate_declarations(parameters["variables"]))
+    lines.extend(generate_statements(parameters, sprite_index))
+    lines.append("}")
+
+    for i in range(parameters["broadcasts"]):
+        lines.append(f'scratch.on_broadcast("message{i}") {{')
+        lines.extend(generate_declarations(parameters["variables"]))
+        lines.append(f"    v0 = {generate_expression(parameters['depth'], parameters['variables'], i)};")
+        lines.append("}")
+
+    return "\n".join(lines)
+
+def generate_project(directory, parameters):
+    os.makedirs(os.path.join(directory, "sprites"))
+
+    files = {
+        "setup.sbc":    generate_setup(parameters),
+        "stage.sbs":    generate_stage(parameters),
+        "costume.svg":  COSTUME,
+        **{
+            f"sprites/sprite{i}.sbs": generate_sprite(parameters, i)
+            for i in range(parameters["sprites"])
+        }
+    }
+
+    for file_path, content in files.items():
+        with open(os.path.join(directory, file_path), "w") as handle:
+            handle.write(content)
+
+    return sum(content.count("\n") + 1 for file_path, content in files.items() if file_path.endswith((".sbc", ".sbs")))
+
+# Runs one compilation of the project in the current directory, optimized at `level`
+# Returns {<stage>: <seconds>, ...}
+def time_stages(level):
+    from scrybe.context import CompilationContext, activate
+    from scrybe.files import ProjectFiles
+
+    # A new context starts with no opened files and fresh IDs
+    with activate(CompilationContext(ProjectFiles(os.curdir))):
+        return _time_stages(level)
+
+def _time_stages(level):
+    from scrybe import filestate
+    from scrybe.builder import ProjectBuilder
+    from scrybe.files import ProjectFiles
+    from scrybe.optimizer import PassManager
+    from scrybe.scriptparser import parse_file as parse_script
+    from scrybe.scriptparser.lexer import lexer
+    from scrybe.setupparser import parse_file as parse_setup
+
+    script_paths = ["stage.sbs", *sorted(f"sprites/{name}" for name in os.listdir("sprites"))]
+    timings = dict.fromkeys(STAGES, 0.0)
+
+    for file_path in script_paths:
+        filestate.open_file(file_path)
+        lexer.input(filestate.read_file())
+        lexer.lineno = 1
+
+        start_time = time.perf_counter()
+        while lexer.token(): pass
+        timings["lex"] += time.perf_counter() - start_time
+
+        filestate.close_file()
+
+    asts = {}
+    for file_path in script_paths:
+        filestate.open_file(file_path)
+
+        start_time = time.perf_counter()
+        asts[file_path] = parse_script()
+        timings["parse"] += time.perf_counter() - start_time
+
+        filestate.close_file()
+
+    projectbuilder = ProjectBuilder(ProjectFiles(os.curdir))
+    # The passes run while building, like they do in the compiler
+    projectbuilder.optimizer = PassManager(level)
+
+    filestate.open_file("setup.sbc")
+    start_time = time.perf_counter()
+    projectbuilder.apply_setup(parse_setup())
+    timings["setup"] = time.perf_counter() - start_time
+    filestate.close_file()
+
+    for file_path, ast in asts.items():
+        filestate.open_file(file_path)
+
+        start_time = time.perf_counter()
+        if file_path == "stage.sbs":
+            projectbuilder.add_stage(ast)
+        else:
+            projectbuilder.add_sprite(ast, os.path.basename(file_path))
+        timings["add_targets"] += time.perf_counter() - start_time
+
+        filestate.close_file()
+
+    start_time = time.perf_counter()
+    projectbuilder.build()
+    timings["build"] = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    projectbuilder.save("benchmark.sb3")
+    timings["save"] = time.perf_counter() - start_time
+
+    return timings
+
+def main():
+    from scrybe.optimizer import DEFAULT_LEVEL, OPTIMIZATION_LEVELS
+
+    parser = ArgumentParser()
+    parser.add_argument("-sprites", type=int, default=10, help="Number of sprites")
+    parser.add_argument("-statements", type=int, default=200, help="Statements in the main script of each sprite")
+    parser.add_argument("-depth", type=int, default=8, help="Operations per expression")
+    parser.add_argument("-variables", type=int, default=10, help="Variables declared in each scope")
+    parser.add_argument("-globals", type=int, default=5, help="Global variables in the setup file")
+    parser.add_argument("-functions", type=int, default=5, help="Functions per sprite")
+    parser.add_argument("-broadcasts", type=int, default=5, help="Broadcasts sent by the stage and received by every sprite")
+    parser.add_argument("-O", type=int, default=DEFAULT_LEVEL, choices=OPTIMIZATION_LEVELS, dest="optimization", help="Optimization level")
+    parser.add_argument("-repeat", type=int, default=3, help="Number of timed compilations")
+    parser.add_argument("-output", help="File to write the JSON results to (defaults to standard output)")
+    arguments = parser.parse_args()
+
+    from scrybe.logger import logger
+    logger.log_level = "error"
+
+    parameters = {
+        name: getattr(arguments, name)
+        for name in ("sprites", "statements", "depth", "variables", "globals", "functions", "broadcasts", "optimization")
+    }
+    parameters["variables"] = max(parameters["variables"], 2)
+    parameters["globals"] = max(parameters["globals"], 1)
+
+    running_directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        line_count = generate_project(directory, parameters)
+
+        os.chdir(directory)
+        try:
+            runs = [time_stages(parameters["optimization"]) for _ in range(arguments.repeat)]
+        finally:
+            os.chdir(running_directory)
+
+    # The fastest run is the least disturbed by everything else on the machine
+    best = {stage: min(run[stage] for run in runs) for stage in STAGES}
+    results = {
+        "parameters": parameters,
+        "lines":      line_count,
+        "python":     platform.python_version(),
+        "stages":     best,
+        "total":      sum(best.values()),
+        "runs":       runs
+    }
+
+    output = json.dumps(results, indent=4)
+    if arguments.output:
+        with open(arguments.output, "w") as handle:
+            handle.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+    main()
@@ -1,96 +1,248 @@
-from .builder import ProjectBuilder
-from .logger import log_prefixes, logger, debug, info, warn, error
-from . import filestate
+from .buildcache import BuildCache
+from .compiler import Compiler
+from .files import ProjectFiles
+from .logger import log_prefixes, logger, debug, info, error, CompileError
+from .optimizer import PassManager, PASS_NAMES, OPTIMIZATION_LEVELS, DEFAULT_LEVEL
+from . import profiler
+from . import batch
 from argparse import ArgumentParser
+import json
+import time
+import sys
 import os
 import glob
 
+COMMANDS = ("watch", "batch", "serve")
+
 def get_arguments():
-    parser = ArgumentParser()
-    parser.add_argument("path", help="Relative path to the project directory")
-    parser.add_argument("filename", nargs="?", help="Name of the output file with .sb3 extension")
-    parser.add_argument("-log", choices=log_prefixes.keys(), default="info", help="Logging level")
+    # `scrybe <path>` builds once, `scrybe <command> <path>` runs a command
+    argv = sys.argv[1:]
+    command = argv.pop(0) if argv and argv[0] in COMMANDS else "build"
+
+    parser = ArgumentParser(prog="scrybe" if command == "build" else f"scrybe {command}")
+    if command == "serve":
+        parser.add_argument("-stdio", action="store_true", help="Answer requests on standard input instead of HTTP")
+        parser.add_argument("-host", default="127.0.0.1", help="Address to listen on")
+        parser.add_argument("-port", type=int, default=8017, help="Port to listen on")
+        parser.add_argument("-workers", type=int, default=4, help="Number of requests handled at once")
+        parser.add_argument("-log", choices=log_prefixes.keys(), default="error", help="Logging level")
+        parser.add_argument("-nocolor", action="store_false", dest="color", help="Disable colored output")
+
+        args = parser.parse_args(argv)
+        args.command = command
+        if args.workers < 1:
+            error("The number of workers must be at least 1", exit=True)
+
+        return args
+
+    if command == "batch":
+        parser.add_argument("paths", nargs="*", help="Relative paths to the project directories")
+        parser.add_argument("-manifest", help="File listing one project directory per line")
+        parser.add_argument("-output", default=".", help="Directory to write the .sb3 files to")
+        parser.add_argument("-report", help="File to write the JSON report to (defaults to standard output)")
+        parser.add_argument("-log", choices=log_prefixes.keys(), default="error", help="Logging level")
+        parser.add_argument("-jobs", type=int, default=1, help="Number of processes used to compile projects")
+    else:
+        parser.add_argument("path", help="Relative path to the project directory")
+        parser.add_argument("filename", nargs="?", help="Name of the output file with .sb3 extension")
+        parser.add_argument("-log", choices=log_prefixes.keys(), default="info", help="Logging level")
+        parser.add_argument("-open", action="store_true", help="Open the output file after building")
+        parser.add_argument("-jobs", type=int, default=1, help="Number of processes used to parse sprites")
+        parser.add_argument("-cache", help="Cache directory for incremental builds (defaults to .scrybe_cache in the project)")
     parser.add_argument("-nocolor", action="store_false", dest="color", help="Disable colored output")
-    parser.add_argument("-open", action="store_true", help="Open the output file after building")
-
-    args = parser.parse_args()
+    parser.add_argument("-incremental", action="store_true", help="Reuse cached ASTs and scripts of unchanged files")
+    parser.add_argument("-compression", type=int, default=5, choices=range(10), metavar="{0-9}", help="Deflate level of the output file")
+    parser.add_argument("-storemedia", action="store_true", help="Store PNG, JPEG, GIF, WebP and MP3 files without compressing them again")
+    parser.add_argument("-compact", action="store_true", help="Write the smallest project.json, without escaping non-ASCII characters")
+    parser.add_argument("-O", type=int, default=DEFAULT_LEVEL, choices=OPTIMIZATION_LEVELS, dest="optimization", help="Optimization level")
+    parser.add_argument("-enable", action="append", default=[], choices=PASS_NAMES, metavar="PASS", help=f"Run an optimization pass regardless of the level ({", ".join(PASS_NAMES)})")
+    parser.add_argument("-disable", action="append", default=[], choices=PASS_NAMES, metavar="PASS", help="Skip an optimization pass regardless of the level")
+    if command != "batch":
+        parser.add_argument("-profile", action="store_true", help="Print the time and peak memory of each build phase")
+        parser.add_argument("-trace", help="Write a cProfile .prof file or a Chrome trace .json file of the build (implies -profile)")
+    if command == "watch":
+        parser.add_argument("-interval", type=float, default=0.5, help="Seconds between checks for changed files")
+
+    args = parser.parse_args(argv)
+    args.command = command
+
+    if args.jobs < 1:
+        error("The number of jobs must be at least 1", exit=True)
+
+    if command == "batch":
+        if args.manifest:
+            if not os.path.exists(args.manifest):
+                error(f'The provided manifest ("{args.manifest}") does not exist', exit=True)
+            args.paths.extend(batch.read_manifest(args.manifest))
+
+        if not args.paths:
+            error("No projects to compile", exit=True)
+
+        return args
+
+    if args.trace:
+        if not args.trace.endswith((".prof", ".json")):
+            error("The trace file must have a .prof or .json extension", exit=True)
+        args.profile = True
 
     if not os.path.exists(args.path):
         error(f'The provided path ("{args.path}") does not exist', exit=True)
 
     return args
 
-def main():
-    arguments = get_arguments()
-    project_path    = arguments.path
-    output_filename = arguments.filename
-    log_level       = arguments.log
-    color           = arguments.color
-    open_after      = arguments.open
-
-    logger.log_level = log_level
-    logger.color     = color
-
-    from .setupparser import parse_file as parse_setup
-    from .scriptparser import parse_file as parse_script
-
-    # Makes accessing file paths easier
-    debug(f'Changing running directory to {project_path}')
-    running_directory = os.getcwd()
-    os.chdir(project_path)
+def build_project(arguments, cache=None):
+    if not arguments.profile:
+        return _build_project(arguments, cache)
 
-    directory_name = os.path.basename(os.getcwd())
-    projectbuilder = ProjectBuilder(directory_name)
+    profiler.start(use_cprofile=bool(arguments.trace) and arguments.trace.endswith(".prof"))
+    try:
+        result = _build_project(arguments, cache)
+    finally:
+        profiler.stop()
 
-    debug("Applying setup")
-    if os.path.exists("setup.sbc"):
-        filestate.open_file("setup.sbc")
-        projectbuilder.apply_setup(parse_setup())
-        filestate.close_file()
-
-        info("Setup applied")
-    else:
-        warn("Setup file not found")
+    profiler.report()
+    if arguments.trace:
+        profiler.write_output(arguments.trace)
+        info(f'Profile written to "{arguments.trace}"')
 
-    debug("Adding stage")
-    if os.path.exists("stage.sbs"):
-        filestate.open_file("stage.sbs")
-        projectbuilder.add_stage(parse_script())
-        filestate.close_file()
+    return result
 
-    else:
-        warn("Stage not found")
+def _build_project(arguments, cache):
+    optimizer = PassManager(arguments.optimization, arguments.enable, arguments.disable)
+    compiler = Compiler(ProjectFiles(arguments.path), cache, arguments.jobs, optimizer)
+    projectbuilder = compiler.compile()
 
-    debug("Searching for sprite folder")
-    if not os.path.exists("sprites"):
-        warn("Sprites folder not found")
+    debug("Saving project")
+    with profiler.phase("Save"):
+        filename = compiler.save(arguments.filename, arguments.compression, arguments.storemedia, arguments.compact)
+    info(f'Project saved as "{filename}"')
 
+    return projectbuilder, filename
+
+# Modification times of every file a build of the project depends on
+def get_snapshot(project_path, asset_globs):
+    patterns = ["setup.sbc", "stage.sbs", "sprites/*.sbs", *asset_globs]
+    snapshot = {}
+
+    for pattern in patterns:
+        for file in glob.glob(os.path.join(project_path, pattern)):
+            try:
+                snapshot[file] = os.stat(file).st_mtime_ns
+            except OSError:
+                continue # Deleted between globbing and checking
+
+    return snapshot
+
+# Rebuild the project whenever one of its files changes, keeping the
+# parsers, translation tables and (optional) build cache loaded
+def watch(arguments, cache):
+    project_path = os.path.abspath(arguments.path)
+    asset_globs = []
+    snapshot = None
+    opened = False
+
+    info(f'Watching "{arguments.path}" for changes (press Ctrl+C to stop)')
+    try:
+        while True:
+            new_snapshot = get_snapshot(project_path, asset_globs)
+            if new_snapshot == snapshot:
+                time.sleep(arguments.interval)
+                continue
+
+            try:
+                start_time = time.perf_counter()
+                projectbuilder, filename = build_project(arguments, cache)
+                info(f"Rebuilt in {time.perf_counter() - start_time:.2f}s")
+
+                asset_globs = projectbuilder.asset_globs
+                if arguments.open and not opened:
+                    os.startfile(filename)
+                    opened = True
+
+            # Show compilation errors and keep watching
+            except CompileError as exception:
+                print(exception, file=sys.stderr)
+
+            # Pick up files matched by new asset globs, but keep the modification times
+            # from before the build so changes made while building trigger a rebuild
+            snapshot = {**get_snapshot(project_path, asset_globs), **new_snapshot}
+
+    except KeyboardInterrupt:
+        info("Stopped watching")
+
+# Compile many projects in this process (or a pool of them) and report how each went
+def compile_batch(arguments):
+    output_paths = [batch.get_output_path(path, arguments.output) for path in arguments.paths]
+    duplicates = {path for path in output_paths if output_paths.count(path) > 1}
+    if duplicates:
+        error(f"Several projects would be saved as {', '.join(sorted(duplicates))}", exit=True)
+
+    os.makedirs(arguments.output, exist_ok=True)
+    options = {
+        "incremental":  arguments.incremental,
+        "compression":  arguments.compression,
+        "storemedia":   arguments.storemedia,
+        "compact":      arguments.compact,
+        "optimization": arguments.optimization,
+        "enable":       arguments.enable,
+        "disable":      arguments.disable
+    }
+
+    start_time = time.perf_counter()
+    results = batch.compile_projects(arguments.paths, arguments.output, options, arguments.jobs)
+    succeeded = sum(result["success"] for result in results)
+
+    report = json.dumps({
+        "projects":  results,
+        "succeeded": succeeded,
+        "failed":    len(results) - succeeded,
+        "seconds":   time.perf_counter() - start_time
+    }, indent=4)
+
+    if arguments.report:
+        with open(arguments.report, "w") as handle:
+            handle.write(report + "\n")
+        info(f'Report written to "{arguments.report}"')
     else:
-        debug("Gathering sprites")
-        sprite_paths = glob.glob("sprites/*.sbs")
-        if not sprite_paths:
-            warn("Sprites folder exists but contains no sprites")
-
-        debug("Adding sprites")
-        for filepath in sprite_paths:
-            debug(f'Adding sprite from "{filepath}"')
-
-            filestate.open_file(filepath)
-            sprite_name = projectbuilder.add_sprite(parse_script(), os.path.basename(filepath))
-            filestate.close_file()
+        print(report)
 
-            info(f'Added sprite "{sprite_name}"')
+    if succeeded < len(results):
+        sys.exit(1)
 
-    debug("Building project")
-    projectbuilder.build()
-    info("Project built")
-
-    debug("Saving project")
-    os.chdir(running_directory)
-    filename = projectbuilder.save(output_filename)
-    info(f'Project saved as "{filename}"')
+def main():
+    arguments = get_arguments()
 
-    if open_after:
+    logger.log_level = arguments.log
+    logger.color     = arguments.color
+
+    if arguments.command == "serve":
+        from . import server # Lazy import, only needed here
+        if arguments.stdio:
+            server.serve_stdio(arguments.workers)
+        else:
+            server.serve_http(arguments.host, arguments.port, arguments.workers)
+        return
+
+    # Every project in a batch has its own cache
+    if arguments.command == "batch":
+        compile_batch(arguments)
+        return
+
+    cache = None
+    if arguments.incremental:
+        cache_directory = arguments.cache or os.path.join(arguments.path, ".scrybe_cache")
+        cache = BuildCache(os.path.abspath(cache_directory))
+
+    if arguments.command == "watch":
+        watch(arguments, cache)
+        return
+
+    try:
+        _, filename = build_project(arguments, cache)
+    except CompileError as exception:
+        sys.exit(str(exception))
+
+    if arguments.open:
         os.startfile(filename)
 
 if __name__ == "__main__":
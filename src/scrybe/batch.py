@@ -0,0 +1,85 @@
+from .buildcache import BuildCache
+from .logger import logger, remove_colors, initialize_worker, CompileError
+from argparse import Namespace
+import traceback
+import time
+import os
+
+# Projects listed in a manifest file, one directory per line relative to the
+# manifest. Blank lines and lines starting with # are ignored
+def read_manifest(file_path):
+    directory = os.path.dirname(file_path)
+    with open(file_path) as handle:
+        lines = [line.strip() for line in handle]
+
+    return [os.path.join(directory, line) for line in lines if line and not line.startswith("#")]
+
+def get_output_path(project_path, output_directory):
+    project_name = os.path.basename(os.path.normpath(project_path))
+    return os.path.join(output_directory, f"{project_name}.sb3")
+
+# Build one project in this process and describe how it went
+# Returns {"path", "output", "success", "seconds", "error"}
+def compile_project(project_path, output_path, options):
+    from .__main__ import build_project # Lazy import, __main__ imports this module
+
+    arguments = Namespace(
+        path         = project_path,
+        filename     = os.path.abspath(output_path),
+        jobs         = 1,
+        compression  = options["compression"],
+        storemedia   = options["storemedia"],
+        compact      = options["compact"],
+        optimization = options["optimization"],
+        enable       = options["enable"],
+        disable      = options["disable"],
+        profile      = False,
+        trace        = None
+    )
+    cache = None
+    if options["incremental"]:
+        cache = BuildCache(os.path.abspath(os.path.join(project_path, ".scrybe_cache")))
+
+    result = {
+        "path":    project_path,
+        "output":  output_path,
+        "success": False,
+        "seconds": 0.0,
+        "error":   None
+    }
+
+    start_time = time.perf_counter()
+    try:
+        if not os.path.isdir(project_path):
+            result["error"] = "Project directory not found"
+        else:
+            build_project(arguments, cache)
+            result["success"] = True
+
+    except CompileError as exception:
+        result["error"] = remove_colors(str(exception))
+
+    except Exception:
+        result["error"] = traceback.format_exc()
+
+    result["seconds"] = time.perf_counter() - start_time
+    return result
+
+# Compile every project, in a process pool if `jobs` is more than 1
+# Returns the results of `compile_project` in the same order as `project_paths`
+def compile_projects(project_paths, output_directory, options, jobs=1):
+    output_paths = [get_output_path(project_path, output_directory) for project_path in project_paths]
+    all_options = [options] * len(project_paths)
+
+    if jobs == 1 or len(project_paths) == 1:
+        return list(map(compile_project, project_paths, output_paths, all_options))
+
+    from concurrent.futures import ProcessPoolExecutor # Lazy import, it's slow to load
+
+    # Each worker loads its own parsers once and compiles many projects with them
+    with ProcessPoolExecutor(
+        max_workers = jobs,
+        initializer = initialize_worker,
+        initargs    = (logger.log_level, logger.color)
+    ) as executor:
+        return list(executor.map(compile_project, project_paths, output_paths, all_options))
@@ -0,0 +1,171 @@
+from .logger import debug
+from .renaming import rename_ids
+import hashlib
+import pickle
+import os
+
+# Bump this whenever the AST or the built output changes shape so
+# stale entries from older versions of Scrybe are never reused
+CACHE_VERSION = 4
+
+def hash_source(source):
+    return hashlib.sha256(source.encode()).hexdigest()
+
+# Prefix every block and local variable/list ID of a serialized target so
+# a cached copy can't collide with IDs generated for targets built later
+def namespace_ids(scripts, namespace):
+    block_IDs = set(map(str, scripts["blocks"]))  # Block IDs may still be integers
+    data_IDs = set(scripts["variables"]) | set(scripts["lists"])
+
+    rename_block = lambda ID: f"{namespace}-{ID}" if str(ID) in block_IDs else ID
+    rename_data = lambda ID: f"{namespace}-{ID}" if ID in data_IDs else ID
+
+    return rename_ids(scripts, rename_block, rename_data)
+
+class BuildCache:
+    def __init__(self, directory):
+        self.directory = directory
+        # Fingerprint of everything a target's scripts depend on besides its
+        # own source (the setup file, the optimization passes and the cache version)
+        self.fingerprint = None
+
+        # Entries: {
+        #     <relative filepath>: {
+        #         "version":     <cache version>,
+        #         "hash":        <source hash>,
+        #         "ast":         <parsed AST>,
+        #         "fingerprint": <fingerprint when the scripts were built>,
+        #         "scripts":     <serialized variables, lists and blocks>,
+        #         "broadcasts":  <names of the broadcasts the scripts use>
+        #     },
+        #     ...
+        # }
+        self.entries = {}
+        self.modified = set()
+
+        # Asset hashes: {
+        #     <absolute filepath>: (<modification time>, <size>, <md5 checksum>),
+        #     ...
+        # }
+        self.asset_hashes = None # Loaded when first needed
+        self.assets_modified = False
+
+    def set_dependencies(self, setup_source, passes=""):
+        self.fingerprint = hash_source(f"{CACHE_VERSION}:{passes}:{setup_source or ''}")
+
+    # Anything else the scripts depend on, like what the optimizer found out about the other targets
+    def add_dependencies(self, description):
+        self.fingerprint = hash_source(f"{self.fingerprint}:{description}")
+
+    def _entry_path(self, file_path):
+        return os.path.join(self.directory, hashlib.md5(file_path.encode()).hexdigest() + ".pickle")
+
+    def _load_entry(self, file_path):
+        if file_path in self.entries:
+            return self.entries[file_path]
+
+        try:
+            with open(self._entry_path(file_path), "rb") as handle:
+                entry = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            entry = None
+
+        if entry is not None and entry.get("version") != CACHE_VERSION:
+            entry = None
+
+        self.entries[file_path] = entry
+        return entry
+
+    def _get_valid_entry(self, file_path, source):
+        entry = self._load_entry(file_path)
+        if entry is None or entry["hash"] != hash_source(source):
+            return None
+
+        return entry
+
+    def has_ast(self, file_path, source):
+        return self._get_valid_entry(file_path, source) is not None
+
+    def get_ast(self, file_path, source):
+        entry = self._get_valid_entry(file_path, source)
+        if entry is None:
+            return None
+
+        debug(f'  Reusing cached AST of "{file_path}"')
+        return entry["ast"]
+
+    def set_ast(self, file_path, source, ast):
+        self.entries[file_path] = {
+            "version":     CACHE_VERSION,
+            "hash":        hash_source(source),
+            "ast":         ast,
+            "fingerprint": None,
+            "scripts":     None,
+            "broadcasts":  []
+        }
+        self.modified.add(file_path)
+
+    def get_scripts(self, file_path, source):
+        entry = self._get_valid_entry(file_path, source)
+        if entry is None or entry["scripts"] is None or entry["fingerprint"] != self.fingerprint:
+            return None
+
+        return entry
+
+    def set_scripts(self, file_path, source, scripts, broadcasts):
+        entry = self._get_valid_entry(file_path, source)
+        if entry is None:
+            return
+
+        entry["fingerprint"] = self.fingerprint
+        entry["scripts"] = namespace_ids(scripts, hash_source(file_path)[:8])
+        entry["broadcasts"] = sorted(broadcasts)
+        self.modified.add(file_path)
+
+    def _load_asset_hashes(self):
+        if self.asset_hashes is not None:
+            return
+
+        try:
+            with open(os.path.join(self.directory, "assets.pickle"), "rb") as handle:
+                contents = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            contents = None
+
+        if contents is not None and contents["version"] == CACHE_VERSION:
+            self.asset_hashes = contents["hashes"]
+        else:
+            self.asset_hashes = {}
+
+    # The md5 checksum of an asset, if the file hasn't changed since it was cached
+    def get_asset_hash(self, file_path, stat):
+        self._load_asset_hashes()
+
+        cached = self.asset_hashes.get(file_path)
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            return None
+
+        return cached[2]
+
+    def set_asset_hash(self, file_path, stat, md5):
+        self._load_asset_hashes()
+
+        self.asset_hashes[file_path] = (stat.st_mtime_ns, stat.st_size, md5)
+        self.assets_modified = True
+
+    def save(self):
+        if not self.modified and not self.assets_modified:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        for file_path in self.modified:
+            with open(self._entry_path(file_path), "wb") as handle:
+                pickle.dump(self.entries[file_path], handle)
+
+        if self.assets_modified:
+            with open(os.path.join(self.directory, "assets.pickle"), "wb") as handle:
+                pickle.dump({"version": CACHE_VERSION, "hashes": self.asset_hashes}, handle)
+            self.assets_modified = False
+
+        debug(f"Wrote {len(self.modified)} cache entr{"y" if len(self.modified) == 1 else "ies"}")
+        self.modified.clear()
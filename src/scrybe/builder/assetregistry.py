@@ -0,0 +1,89 @@
+from ScratchGen.asset import Asset
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import os
+
+def _hash_file(files, file_path):
+    with files.open_binary(file_path) as handle:
+        return hashlib.file_digest(handle, "md5").hexdigest()
+
+# Asset whose checksum is known, or being computed in the registry's thread
+# pool. Its data is never kept in memory: the .sb3 writer copies it straight
+# from the file
+class RegisteredAsset(Asset):
+    def __init__(self, file_path, md5, files):
+        self.name = os.path.splitext(os.path.basename(file_path))[0]
+        self.file_path = file_path # Relative to the project's files
+        self.format = os.path.splitext(self.file_path)[1][1:]
+
+        self._md5 = md5 # Checksum or future checksum
+        self.files = files
+
+    @property
+    def md5(self):
+        if isinstance(self._md5, Future):
+            self._md5 = self._md5.result()
+
+        return self._md5
+
+    @property
+    def md5ext(self):
+        return f"{self.md5}.{self.format}"
+
+    def open(self):
+        return self.files.open_binary(self.file_path)
+
+    @property
+    def data(self):
+        with self.open() as handle:
+            return handle.read()
+
+# Project-wide store of costumes and sounds. Every file is hashed once, no
+# matter how many targets use it, in a thread pool so reading the files
+# overlaps with parsing. With a build cache, files that haven't changed
+# since the last build aren't hashed again
+class AssetRegistry:
+    def __init__(self, files):
+        self.files = files
+        # Globs: {<glob expression>: [<matching file paths>], ...}
+        self.globs = {}
+        # Assets: {<absolute file path>: <asset object>, ...}
+        self.assets = {}
+        # Pending: {<absolute file path>: (<future checksum>, <file stat>), ...}
+        self.pending = {}
+        self.executor = None
+
+    def expand(self, expression):
+        if expression not in self.globs:
+            self.globs[expression] = self.files.glob(expression)
+
+        return self.globs[expression]
+
+    # Returns the asset right away; its checksum may still be computed in the background
+    def get(self, file_path, cache=None):
+        absolute_path = self.files.path(file_path)
+        if absolute_path in self.assets:
+            return self.assets[absolute_path]
+
+        stat = cache and self.files.stat(file_path)
+        md5 = cache and cache.get_asset_hash(absolute_path, stat)
+        if not md5:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(thread_name_prefix="scrybe-assets")
+
+            md5 = self.executor.submit(_hash_file, self.files, file_path)
+            self.pending[absolute_path] = (md5, stat)
+
+        self.assets[absolute_path] = RegisteredAsset(file_path, md5, self.files)
+        return self.assets[absolute_path]
+
+    # Wait for every checksum being computed and remember them in the cache
+    def wait(self, cache=None):
+        for file_path, (future, stat) in self.pending.items():
+            md5 = future.result()
+            if cache: cache.set_asset_hash(file_path, stat, md5)
+
+        self.pending.clear()
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
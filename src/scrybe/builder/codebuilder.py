@@ -30,8 +30,8 @@ class CodeBuilder(ABC):
         ...
 
     def translate_index(self, expression):
-        target = self.translate_expression(expression["target"])
-        index = self.translate_expression(expression["index"])
+        target = self.translate_expression(expression.target)
+        index = self.translate_expression(expression.index)
 
         Types.check_types([[Types.LIST], [Types.STRING]], [target],
             "Index target must be a string/list, not a {}")
@@ -45,7 +45,7 @@ class CodeBuilder(ABC):
         return LetterOf(index, target)
 
     def translate_concatenation(self, expression):
-        operand_1, operand_2 = map(self.translate_expression, expression["operands"])
+        operand_1, operand_2 = map(self.translate_expression, expression.operands)
 
         Types.check_types(
             [[Types.STRING, Types.STRING]],
@@ -58,8 +58,8 @@ class CodeBuilder(ABC):
         return Join(operand_1, operand_2)
 
     def translate_numerical_operation(self, expression):
-        operation = expression["operation"]
-        operands = list(map(self.translate_expression, expression["operands"]))
+        operation = expression.operation
+        operands = list(map(self.translate_expression, expression.operands))
 
         if len(operands) == 1:
             Types.check_types([[Types.NUMBER]], [operands[0]],
@@ -74,8 +74,8 @@ class CodeBuilder(ABC):
         return translations.numerical_operations[operation](*operands)
 
     def translate_comparison_operation(self, expression):
-        condition = expression["condition"]
-        comparand_1, comparand_2 = map(self.translate_expression, expression["operands"])
+        condition = expression.condition
+        comparand_1, comparand_2 = map(self.translate_expression, expression.operands)
 
         possible_types = [[Types.NUMBER, Types.NUMBER]]
         if condition in ("==", "!="):
@@ -88,10 +88,10 @@ class CodeBuilder(ABC):
         return translations.comparison_operations[condition](comparand_1, comparand_2)
 
     def translate_logical_operation(self, expression):
-        condition = expression["condition"]
+        condition = expression.condition
         # Don't translate boolean literals yet because they are handled
         # in a special way during translation to avoid unnecessary operations
-        comparands = [i if isinstance(i, bool) else self.translate_expression(i) for i in expression["comparands"]]
+        comparands = [i if isinstance(i, bool) else self.translate_expression(i) for i in expression.comparands]
 
         if condition == "in":
             Types.check_types([[Types.LIST], [Types.STRING]], [comparands[1]],
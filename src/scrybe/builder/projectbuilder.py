@@ -2,16 +2,20 @@ from ScratchGen import Project
 from ScratchGen.constants import *
 from .setupbuilder import SetupBuilder
 from .scriptbuilder import ScriptBuilder
+from .symboltable import SymbolTable
+from .assetregistry import AssetRegistry
 from ..logger import debug, warn, code_error, set_lexpos
 from ..types import Types
 from .. import filestate
-from glob import glob
-import os
+from .. import profiler
+from ..sb3writer import write_project
 
 class ProjectBuilder:
-    def __init__(self, directory_name):
+    # `files` are the project's files (see `files.py`), which assets are found in
+    def __init__(self, files):
         self.project = Project(agent="Scrybe")
-        self.filename = f"{directory_name}.sb3"
+        self.files = files
+        self.filename = f"{files.name}.sb3"
 
         # Broadcasts: {
         #     <broadcast name>: {
@@ -21,20 +25,20 @@ class ProjectBuilder:
         #    ...
         # }
         self.broadcasts = {}
-        # Variables: {
-        #     "global": {
-        #         <variable name>: <variable object>  <- Single variable schema
-        #         ...
-        #     },
+        # Symbol tables: {
+        #     "global": <symbol table>,
         #     "local": {
-        #         "stage":   {<variable schemas>},
-        #         "sprites": {<variable schemas>}
+        #         "stage":   <symbol table>,
+        #         "sprites": {
+        #             <sprite name>: <symbol table>,
+        #             ...
+        #         }
         #     }
         # }
-        self.variables = {
-            "global": {},
+        self.symbols = {
+            "global": SymbolTable("g"),
             "local": {
-                "stage":   {},
+                "stage":   SymbolTable("b"),
                 "sprites": {}
             }
         }
@@ -58,38 +62,60 @@ class ProjectBuilder:
         # }
         self.sprites = {}
 
+        # Every costume/sound path or glob expression used by the targets
+        self.asset_globs = []
+        self.assets = AssetRegistry(files)
+
+        # Optional build cache for incremental builds
+        self.cache = None
+        # Optional pass manager that optimizes the statements of each target before it's built
+        self.optimizer = None
+        # Names of the broadcasts used by the target currently being built
+        self.used_broadcasts = set()
+
     def apply_setup(self, setup_ast):
-        file_declaration = setup_ast["file declaration"] or {}
-        self.filename = file_declaration.get("filename",
-            os.path.basename(os.getcwd()) + ".sb3")
+        file_declaration = setup_ast.file_declaration
+        if file_declaration:
+            self.filename = file_declaration.filename
+        else:
+            self.filename = f"{self.files.name}.sb3"
+
+        SetupBuilder(self, setup_ast.variables).build()
 
-        SetupBuilder(self, setup_ast["variables"]).build()
+    def get_symbol_table(self, target):
+        if target._is_stage:
+            return self.symbols["local"]["stage"]
+        return self.symbols["local"]["sprites"][target.name]
 
-    # `variable_name` should already be scope formatted
-    def add_variable(self, variable_name, variable_type, variable_value, is_const=False, target=None):
+    # Declares `variable_name` in the current scope of `symbols` and names the
+    # Scratch variable after that scope. Without a symbol table, `variable_name`
+    # is used as is and the variable can't be referred to from the source
+    def add_variable(self, variable_name, variable_type, variable_value, is_const=False, target=None, symbols=None):
         target = target or self.project.stage
+        scratch_name = symbols.encode(variable_name) if symbols else variable_name
 
         function = target.createList if variable_type == Types.LIST else target.createVariable
-        variable_object = function(variable_name, variable_value)
+        variable_object = function(scratch_name, variable_value)
         variable_object.type = variable_type
         variable_object.constant = is_const
         variable_type = repr(variable_type)
 
-        if variable_name.startswith("g_") or variable_name.startswith("br_"):
-            self.variables["global"][variable_name] = variable_object
-            debug(f'    Created global {variable_type} "{variable_name}" ')
+        if symbols:
+            symbols.declare(variable_name, variable_object)
+
+        if scratch_name.startswith("g_") or scratch_name.startswith("br_"):
+            # Globals get stable IDs so cached targets can keep referring to them
+            variable_object.id = "global"
+            debug(f'    Created global {variable_type} "{scratch_name}" ')
         else:
-            if target._is_stage:
-                self.variables["local"]["stage"][variable_name] = variable_object
-            else:
-                self.variables["local"]["sprites"][target.name][variable_name] = variable_object
-            debug(f'    Created local {variable_type} "{variable_name}" ')
+            debug(f'    Created local {variable_type} "{scratch_name}" ')
 
         return variable_object
 
     def get_broadcast(self, broadcast_name):
         if broadcast_name not in self.broadcasts:
             broadcast_object = self.project.createBroadcast(broadcast_name)
+            broadcast_object.id = f"broadcast-{broadcast_name}"
             variable_object = self.add_variable(f"br_{broadcast_name}", "variable", "")
 
             self.broadcasts[broadcast_name] = {
@@ -98,11 +124,12 @@ class ProjectBuilder:
             }
             debug(f'    Created new broadcast "{broadcast_name}"')
 
+        self.used_broadcasts.add(broadcast_name)
         return self.broadcasts[broadcast_name]
 
     def add_sprite(self, sprite_ast, filename):
         declarations = self.get_declarations(
-            sprite_ast["declarations"], filename, False
+            sprite_ast.declarations, filename, False
         )
 
         sprite = self.project.createSprite(
@@ -120,8 +147,8 @@ class ProjectBuilder:
         self.add_assets(declarations["costume"], "costume", sprite)
         self.add_assets(declarations["sound"], "sound", sprite)
 
-        self.variables["local"]["sprites"][sprite.name] = {}
-        self.scripts["sprites"][sprite.name] = sprite_ast["statements"]
+        self.symbols["local"]["sprites"][sprite.name] = SymbolTable("s")
+        self.scripts["sprites"][sprite.name] = sprite_ast.statements
         self.sprites[sprite.name] = {
             "object":   sprite,
             "filename": filename
@@ -131,13 +158,13 @@ class ProjectBuilder:
 
     def add_stage(self, stage_ast):
         declarations = self.get_declarations(
-            stage_ast["declarations"], "stage.sbs", True
+            stage_ast.declarations, "stage.sbs", True
         )
 
         self.add_assets(declarations["costume"], "backdrop", self.project.stage)
         self.add_assets(declarations["sound"], "sound", self.project.stage)
 
-        self.scripts["stage"] = stage_ast["statements"]
+        self.scripts["stage"] = stage_ast.statements
 
     # This would be a constant top-level tuple but "filename" has to be set each time
     def generate_declaration_info(self, filename):
@@ -175,10 +202,10 @@ class ProjectBuilder:
 
         for declaration_name, _, sprite_specific, check_function in declaration_info:
             for declaration in declaration_statements:
-                set_lexpos(declaration["lexpos"])
-                declaration_value = declaration["value"]
+                set_lexpos(declaration.lexpos)
+                declaration_value = declaration.value
 
-                if declaration["property"] != f"#{declaration_name}": continue
+                if declaration.property != f"#{declaration_name}": continue
 
                 if sprite_specific and is_stage:
                     code_error("This declaration can only be used in a sprite")
@@ -195,28 +222,42 @@ class ProjectBuilder:
         return declarations
 
     def add_assets(self, path_list, type, target):
-        function = target.addSound if type == "sound" else target._addCostume
+        target_assets = target._assets["sounds" if type == "sound" else "images"]
 
         # `path_list` is a list of filepaths and/or glob expressions
-        for expression in path_list:
-            for file in glob(expression):
-                function(file)
-                debug(f'  Added asset "{file}"')
+        if not path_list: return
+        self.asset_globs.extend(path_list)
+        with profiler.phase(f"Find {type}s of {target.name}"):
+            for expression in path_list:
+                for file in self.assets.expand(expression):
+                    target_assets.append(self.assets.get(file, self.cache))
+                    debug(f'  Added asset "{file}"')
 
     def get_declaration(self, declarations, property, default_value=None):
         for declaration in declarations:
-            if declaration["property"] == property:
-                return declaration["value"]
+            if declaration.property == property:
+                return declaration.value
 
         return default_value
 
     def build(self):
+        with profiler.phase("Hash assets"):
+            self.assets.wait(self.cache)
+
+        if self.optimizer:
+            with profiler.phase("Analyze project"):
+                analyses = self.optimizer.prepare(self)
+            if self.cache: self.cache.add_dependencies(analyses)
+
         if self.scripts["stage"]:
             statements = self.scripts["stage"]
             target = self.project.stage
 
-            filestate.current_entry = "stage.sbs"
-            ScriptBuilder(self, statements, target).build()
+            filestate.select_file("stage.sbs")
+            with profiler.phase("Optimize stage"):
+                statements = self.optimize(statements)
+            with profiler.phase("Build stage"):
+                ScriptBuilder(self, statements, target).build()
             debug("  Built scripts in stage")
 
         else:
@@ -229,12 +270,45 @@ class ProjectBuilder:
             statements = self.scripts["sprites"][sprite_name]
             target = sprite_object
 
-            filestate.current_entry = f"sprites/{sprite_filename}"
-            ScriptBuilder(self, statements, target).build()
+            file_path = f"sprites/{sprite_filename}"
+            filestate.select_file(file_path)
+            source = filestate.read_file()
+
+            cache_entry = self.cache and self.cache.get_scripts(file_path, source)
+            if cache_entry:
+                self.reuse_scripts(target, cache_entry)
+                debug(f'  Reused cached scripts of sprite "{sprite_name}"')
+                continue
+
+            self.used_broadcasts = set()
+            with profiler.phase(f'Optimize sprite "{sprite_name}"'):
+                statements = self.optimize(statements)
+            with profiler.phase(f'Build sprite "{sprite_name}"'):
+                ScriptBuilder(self, statements, target).build()
             debug(f'  Built scripts in sprite "{sprite_name}"')
 
-    def save(self, filename=None):
+            if self.cache:
+                serialized = target._serialize()
+                scripts = {key: serialized[key] for key in ("variables", "lists", "blocks")}
+                self.cache.set_scripts(file_path, source, scripts, self.used_broadcasts)
+
+    def optimize(self, statements):
+        if not self.optimizer:
+            return statements
+
+        return self.optimizer.optimize(statements, self)
+
+    def reuse_scripts(self, target, cache_entry):
+        # Broadcasts live in the stage, so they still have to be created
+        for broadcast_name in cache_entry["broadcasts"]:
+            self.get_broadcast(broadcast_name)
+
+        # Splice the cached variables, lists and blocks into the target's output
+        serialize = target._serialize
+        target._serialize = lambda: {**serialize(), **cache_entry["scripts"]}
+
+    def save(self, filename=None, compresslevel=5, store_media=False, compact=False):
         filename = filename or self.filename
-        self.project.save(filename)
+        write_project(self.project, filename, compresslevel, store_media, compact)
 
         return filename
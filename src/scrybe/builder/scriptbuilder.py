@@ -2,6 +2,7 @@ from ScratchGen.block import Boolean
 from ScratchGen.blocks import *
 from .codebuilder import CodeBuilder
 from .. import translations
+from .. import nodes
 from ..logger import debug, code_error, set_lexpos
 from ..types import Types
 from inspect import signature
@@ -12,11 +13,7 @@ class ScriptBuilder(CodeBuilder):
         self.statements = statements
         self.target = target
         self.is_sprite = not self.target._is_stage
-        self.variable_prefix = "s" if self.is_sprite else "b"
-
-        self._scope_ID = 0
-        self._scope_stack = [0]
-        self.current_scope_ID = 0
+        self.symbols = projectbuilder.get_symbol_table(target)
 
         # Functions: {
         #     <function name>: {
@@ -35,6 +32,32 @@ class ScriptBuilder(CodeBuilder):
 
         self.is_clone_variable = None
 
+        # Translation and application functions keyed by AST node class
+        self.expression_translators = {
+            nodes.Index:               self.translate_index,
+            nodes.FunctionCall:        self.translate_function_call,
+            nodes.Concatenation:       self.translate_concatenation,
+            nodes.NumericalOperation:  self.translate_numerical_operation,
+            nodes.ComparisonOperation: self.translate_comparison_operation,
+            nodes.LogicalOperation:    self.translate_logical_operation,
+            nodes.GetAttribute:        self.translate_attribute,
+            nodes.Variable:            self.translate_variable
+        }
+        self.statement_appliers = {
+            nodes.DeclareVariable:   self.apply_declare_variable,
+            nodes.DeclareConstant:   self.apply_declare_constant,
+            nodes.SetVariable:       self.apply_set_variable,
+            nodes.InPlaceAssignment: self.apply_in_place_assignment,
+            nodes.FunctionCall:      self.apply_function_call,
+            nodes.If:                self.apply_if,
+            nodes.IfElse:            self.apply_if_else,
+            nodes.While:             self.apply_while,
+            nodes.Forever:           self.apply_forever,
+            nodes.Repeat:            self.apply_repeat,
+            nodes.For:               self.apply_for,
+            nodes.Return:            self.apply_return
+        }
+
     # Expression translation
 
     def translate_expression(self, expression):
@@ -45,49 +68,44 @@ class ScriptBuilder(CodeBuilder):
         if isinstance(expression, list):
             return list(map(self.translate_expression, expression))
 
-        if not isinstance(expression, dict):
+        if not isinstance(expression, nodes.Node):
             # Handle all other literals
             return expression
 
-        set_lexpos(expression["lexpos"])
+        set_lexpos(expression.lexpos)
+        return self.expression_translators[type(expression)](expression)
 
-        match expression["type"]:
-            case "index":                translation_function = self.translate_index
-            case "function call":        translation_function = self.translate_function_call
-            case "concatenation":        translation_function = self.translate_concatenation
-            case "numerical operation":  translation_function = self.translate_numerical_operation
-            case "comparison operation": translation_function = self.translate_comparison_operation
-            case "logical operation":    translation_function = self.translate_logical_operation
+    def translate_variable(self, expression):
+        # Boolean variables have to have a boolean shape
+        variable_object = self.resolve_data_name(expression.name)
+        return Equals(variable_object, 1) if variable_object.type == Types.BOOLEAN else variable_object
 
-            case "get attribute":        translation_function = self.translate_attribute
-            case "variable":
-                # Boolean variables have to have a boolean shape
-                variable_object = self.resolve_data_name(expression["variable"])
-                return Equals(variable_object, 1) if variable_object.type == Types.BOOLEAN else variable_object
-
-        return translation_function(expression)
+    # The user-defined variable/list an attribute is accessed on, if any
+    def get_attribute_owner(self, expression):
+        if isinstance(expression, nodes.GetAttribute) and isinstance(expression.object, nodes.Variable):
+            return self.resolve_data_name(expression.object.name, allow_nonexistent=True)
 
     def translate_variable_attribute(self, expression, type, arguments=[]):
-        variable_object = self.resolve_data_name(expression["object"])
+        variable_object = self.get_attribute_owner(expression)
         variable_type = repr(variable_object.type)
-        attribute = expression["attribute"]
+        attribute = expression.attribute
 
         dictionary = getattr(translations, f"{variable_type}_{type}s")
 
         callable_object = dictionary.get(attribute)
         if not callable_object:
             # Set lex position of attribute (+ 1 for the period)
-            set_lexpos(expression["lexpos"] + len(expression["object"]) + 1)
+            set_lexpos(expression.lexpos + len(expression.object.name) + 1)
             code_error(f"{variable_type.title()} {type} not found")
 
         return callable_object(*arguments, variable_object)
 
     def translate_attribute(self, expression):
         # Check if attribute is of a list/variable
-        if self.resolve_data_name(expression["object"], allow_nonexistent=True):
+        if self.get_attribute_owner(expression):
             return self.translate_variable_attribute(expression, "field")
 
-        if expression["object"] == "this" and expression["attribute"] == "is_clone":
+        if expression.object == "this" and expression.attribute == "is_clone":
             if not self.is_sprite: code_error("This attribute can only be used in a sprite")
             if not self.is_clone_variable: self.add_is_sprite_check()
             return self.is_clone_variable
@@ -99,12 +117,12 @@ class ScriptBuilder(CodeBuilder):
         )()
 
     def translate_function_call(self, expression):
-        function = expression["function"]
-        arguments = list(map(self.translate_expression, expression["arguments"]))
+        function = expression.function
+        arguments = list(map(self.translate_expression, expression.arguments))
 
         # Check if is a custom function
-        if function["type"] == "variable" and function["variable"] in self.functions:
-            function_name = function["variable"]
+        if isinstance(function, nodes.Variable) and function.name in self.functions:
+            function_name = function.name
             dict_entry = self.functions[function_name]
 
             if dict_entry["output"] is None:
@@ -118,7 +136,7 @@ class ScriptBuilder(CodeBuilder):
             return output_object
 
         # Check if method is of a list/variable
-        if "object" in function and self.resolve_data_name(function["object"], allow_nonexistent=True):
+        if self.get_attribute_owner(function):
             return self.translate_variable_attribute(function, "method", arguments)
 
         callable_object = self.get_builtin(
@@ -141,7 +159,7 @@ class ScriptBuilder(CodeBuilder):
         resolution_attempt = resolution_function(obj)
         if not resolution_attempt:
             if allow_nonexistent: return None
-            if "lexpos" in obj: set_lexpos(obj["lexpos"])
+            if isinstance(obj, nodes.Node): set_lexpos(obj.lexpos)
             code_error(f"{type_name.title()} not found")
 
         callable_object, sprite_specific = resolution_attempt
@@ -151,46 +169,19 @@ class ScriptBuilder(CodeBuilder):
         return callable_object
 
     def add_variable(self, variable_name, variable_type, variable_value, is_const=False):
-        prefix = self.variable_prefix
-        current_scope = self.current_scope_ID
-        if current_scope > 0:
-            prefix += str(current_scope)
-
-        variable_name = f"{prefix}_{variable_name}"
-
         return self.projectbuilder.add_variable(
             variable_name, variable_type, variable_value,
-            is_const, self.target
+            is_const, self.target, self.symbols
         )
 
     def resolve_data_name(self, data_name, allow_nonexistent=False):
-        variables = self.projectbuilder.variables
-
-        # Check global variables first
-        global_variables = variables["global"]
-        if f"g_{data_name}" in global_variables:
-            return global_variables[f"g_{data_name}"]
-
-        # Then, check target-wise local variables
-        if self.is_sprite:
-            local_variables = variables["local"]["sprites"][self.target.name]
-        else:
-            local_variables = variables["local"]["stage"]
+        # Globals take precedence over the target's own variables
+        variable_object = self.projectbuilder.symbols["global"].resolve(data_name)
+        if variable_object is None:
+            variable_object = self.symbols.resolve(data_name)
 
-        if f"{self.variable_prefix}_{data_name}" in local_variables:
-            return local_variables[f"{self.variable_prefix}_{data_name}"]
-
-        # Lastly, check scoped variables
-        for encoded_name, variable_object in local_variables.items():
-            if any(encoded_name.startswith(i) for i in ("g_", "s_", "b_", "fo_", "bfo_")):
-                continue
-
-            encoded_scope, name = encoded_name.split("_", maxsplit=1)
-            scope_ID = int(encoded_scope[1:])
-
-            if name == data_name and scope_ID in [self.current_scope_ID, *self._scope_stack]:
-                # `scope_ID` can either be the current scope ID or in the stack
-                return variable_object
+        if variable_object is not None:
+            return variable_object
 
         # Variable wasn't found, either error or implicitly return None
         if not allow_nonexistent:
@@ -213,20 +204,8 @@ class ScriptBuilder(CodeBuilder):
         self.add_to_stack(modify_scope)
 
         for statement in statements:
-            set_lexpos(statement["lexpos"])
-
-            match statement["type"]:
-                case "declare variable":    application_function = self.apply_declare_variable
-                case "set variable":        application_function = self.apply_set_variable
-                case "in-place assignment": application_function = self.apply_in_place_assignment
-                case "function call":       application_function = self.apply_function_call
-                case "if":                  application_function = self.apply_if
-                case "if-else":             application_function = self.apply_if_else
-                case "while":               application_function = self.apply_while
-                case "for":                 application_function = self.apply_for
-                case "return":              application_function = self.apply_return
-
-            application_function(statement)
+            set_lexpos(statement.lexpos)
+            self.statement_appliers[type(statement)](statement)
 
         return self.remove_from_stack(modify_scope)
 
@@ -240,46 +219,57 @@ class ScriptBuilder(CodeBuilder):
         else:
             self.current_script.append(SetVariable(variable_object, variable_value))
 
+    def get_default_value(self, variable_type):
+        match variable_type:
+            case Types.NUMBER:  return 0
+            case Types.STRING:  return ""
+            case Types.BOOLEAN: return False
+            case Types.GENERAL: return ""
+            case Types.LIST:    return []
+
     def apply_declare_variable(self, statement):
-        variable_name = statement["variable"]["variable"]
+        variable_name = statement.variable.name
         if self.resolve_data_name(variable_name, allow_nonexistent=True):
             code_error("Cannot redeclare a variable")
 
-        declared_type = statement["variable type"]
-        variable_value = statement["value"]
-        # Get default value
-        match declared_type:
-            case Types.NUMBER:  default_value = 0
-            case Types.STRING:  default_value = ""
-            case Types.BOOLEAN: default_value = False
-            case Types.GENERAL: default_value = ""
-            case Types.LIST:    default_value = []
+        declared_type = statement.variable_type
+        variable_value = statement.value
+        default_value = self.get_default_value(declared_type)
         if variable_value is None:
             variable_value = default_value
         variable_value = self.translate_expression(variable_value)
-        is_const = statement["constant"]
+        is_const = statement.constant
 
         variable_object = self.add_variable(variable_name, declared_type, default_value, is_const)
         self.apply_variable_setter(variable_object, variable_value)
 
+    def apply_declare_constant(self, statement):
+        variable_name = statement.variable.name
+        if self.resolve_data_name(variable_name, allow_nonexistent=True):
+            code_error("Cannot redeclare a variable")
+
+        self._check_assignment_types(statement.variable_type, statement.value)
+        # Declared so the name can't be reused, though nothing refers to it
+        self.symbols.declare(variable_name, statement)
+
     def apply_set_variable(self, statement):
-        to_assign = statement["variable"]
-        set_lexpos(to_assign["lexpos"])
+        to_assign = statement.variable
+        set_lexpos(to_assign.lexpos)
 
-        variable_value = self.translate_expression(statement["value"])
+        variable_value = self.translate_expression(statement.value)
 
         # For things like `this.size = 50`
-        if to_assign["type"] == "get attribute":
+        if isinstance(to_assign, nodes.GetAttribute):
             builtin = self.get_builtin(to_assign, translations.resolve_setter, "attribute")
             self.current_script.append(builtin(variable_value))
             return
 
-        if to_assign["type"] == "index":
-            target = self.translate_expression(to_assign["target"])
+        if isinstance(to_assign, nodes.Index):
+            target = self.translate_expression(to_assign.target)
             if target.constant:
                 code_error("Cannot assign to constant")
-            index = self.translate_expression(to_assign["index"])
-            value = self.translate_expression(statement["value"])
+            index = self.translate_expression(to_assign.index)
+            value = self.translate_expression(statement.value)
 
             Types.check_types([[Types.LIST], [Types.STRING]], [target],
                 "Index target must be a string/list, not a {}")
@@ -292,7 +282,7 @@ class ScriptBuilder(CodeBuilder):
             return
 
         # User-defined variables
-        variable_name = to_assign["variable"]
+        variable_name = to_assign.name
         variable_object = self.resolve_data_name(variable_name, allow_nonexistent=True)
         if not variable_object:
             code_error("Cannot assign to undeclared variable")
@@ -304,14 +294,14 @@ class ScriptBuilder(CodeBuilder):
     # TODO: Refactor this after implementing variable registry
     # Also, `my_list[0] += my_list` should not work
     def apply_in_place_assignment(self, statement):
-        operation_type = statement["operation"][:-1] # Cut off the trailing equals sign
+        operation_type = statement.operation[:-1] # Cut off the trailing equals sign
         operation = Join if operation_type == ".." else translations.numerical_operations[operation_type]
 
-        to_assign = statement["variable"]
-        operand = self.translate_expression(statement["operand"])
+        to_assign = statement.variable
+        operand = self.translate_expression(statement.operand)
 
-        if to_assign["type"] == "variable":
-            variable_object = self.resolve_data_name(to_assign["variable"])
+        if isinstance(to_assign, nodes.Variable):
+            variable_object = self.resolve_data_name(to_assign.name)
             if variable_object.constant:
                 code_error("Cannot assign to constant")
             new_value = operation(variable_object, operand)
@@ -319,11 +309,11 @@ class ScriptBuilder(CodeBuilder):
             self._check_assignment_types(Types.get_type(variable_object), new_value)
             self.current_script.append(SetVariable(variable_object, new_value))
 
-        if to_assign["type"] == "index":
-            list_object = self.resolve_data_name(to_assign["target"]["variable"])
+        if isinstance(to_assign, nodes.Index):
+            list_object = self.resolve_data_name(to_assign.target.name)
             if list_object.constant:
                 code_error("Cannot assign to constant")
-            index = self.translate_expression(to_assign["index"]) + 1
+            index = self.translate_expression(to_assign.index) + 1
 
             Types.check_types([[Types.LIST]], [list_object],
                 "Index target must be a list, not a {}")
@@ -331,7 +321,7 @@ class ScriptBuilder(CodeBuilder):
             new_value = operation(list_item, operand)
             self.current_script.append(ReplaceInList(index, list_object, new_value))
 
-        if to_assign["type"] == "get attribute":
+        if isinstance(to_assign, nodes.GetAttribute):
             # For things like `this.x += 10`
             setter_function = self.get_builtin(to_assign, translations.resolve_setter, "attribute")
             reporter_object = translations.resolve_reporter(to_assign)[0]()
@@ -341,8 +331,8 @@ class ScriptBuilder(CodeBuilder):
             self.current_script.append(setter_function(new_value))
 
     def apply_function_call(self, statement):
-        function = statement["function"]
-        arguments = list(map(self.translate_expression, statement["arguments"]))
+        function = statement.function
+        arguments = list(map(self.translate_expression, statement.arguments))
         callable_object = None
 
         # Check builtin functions
@@ -355,9 +345,9 @@ class ScriptBuilder(CodeBuilder):
         if callable_object:
             self.check_argument_count(callable_object, len(arguments))
 
-        elif self.functions.get(function.get("variable")):
+        elif isinstance(function, nodes.Variable) and function.name in self.functions:
             # Check custom functions
-            dict_entry = self.functions[function["variable"]]
+            dict_entry = self.functions[function.name]
 
             # You may invoke a function with a return type as a statement
             # because I don't really see any downsides to it
@@ -368,15 +358,15 @@ class ScriptBuilder(CodeBuilder):
             self.argument_error_message(0, parameter_count, len(arguments))
 
         # Check variable/list functions
-        if not callable_object and self.resolve_data_name(function.get("object", None), allow_nonexistent=True):
+        if not callable_object and self.get_attribute_owner(function):
             self.current_script.append(
                 self.translate_variable_attribute(function, "function", arguments))
             return
 
         if (
-            function["type"] == "get attribute" and
-            function["object"] == "scratch" and
-            function["attribute"].startswith("broadcast")
+            isinstance(function, nodes.GetAttribute) and
+            function.object == "scratch" and
+            function.attribute.startswith("broadcast")
         ):
             # Set broadcast message variable to the second argument,
             # or an empty string to reset it. Then add the rest
@@ -426,39 +416,40 @@ class ScriptBuilder(CodeBuilder):
             ))
 
     def apply_if(self, statement):
-        condition = self.get_control_flow_condition(statement["expression"])
-        body = self.build_inner_statements(statement["body"])
+        condition = self.get_control_flow_condition(statement.expression)
+        body = self.build_inner_statements(statement.body)
 
         self.current_script.append(If(condition, *body))
 
     def apply_if_else(self, statement):
-        condition = self.get_control_flow_condition(statement["expression"])
-        body_1 = self.build_inner_statements(statement["body 1"])
-        body_2 = self.build_inner_statements(statement["body 2"])
+        condition = self.get_control_flow_condition(statement.expression)
+        body_1 = self.build_inner_statements(statement.body_1)
+        body_2 = self.build_inner_statements(statement.body_2)
 
         self.current_script.append(If(condition, *body_1).Else(*body_2))
 
     def apply_while(self, statement):
-        expression = statement["expression"]
-        body = self.build_inner_statements(statement["body"])
+        body = self.build_inner_statements(statement.body)
+        condition = self.get_control_flow_condition(statement.expression)
 
-        if expression is True:
-            # Optimize to a "forever" loop if expression is just `true`
-            self.current_script.append(Forever(*body))
-        else:
-            condition = self.get_control_flow_condition(expression)
-            self.current_script.append(RepeatUntil(translations._scrybe_not(condition), *body))
+        self.current_script.append(RepeatUntil(translations._scrybe_not(condition), *body))
+
+    def apply_forever(self, statement):
+        body = self.build_inner_statements(statement.body)
+
+        self.current_script.append(Forever(*body))
 
     def apply_for(self, statement):
-        initializer_statement = statement["initializer"]
-        expression = statement["expression"]
-        post_iteration_statement = statement["post-iteration"]
-        body = statement["body"]
+        initializer_statement = statement.initializer
+        expression = statement.expression
+        post_iteration_statement = statement.post_iteration
+        body = statement.body
 
         # The iteration variable must be set in the next scope
         self.enter_scope()
 
-        self.apply_declare_variable(initializer_statement)
+        # Either `i: num = 0` or `i = 0`
+        self.statement_appliers[type(initializer_statement)](initializer_statement)
         statements = self.build_inner_statements(
             [*body, post_iteration_statement],
             modify_scope = False # Avoid changing the current scope
@@ -468,10 +459,22 @@ class ScriptBuilder(CodeBuilder):
 
         self.exit_scope()
 
+    def apply_repeat(self, statement):
+        # Scoped like the `for` loop it replaces
+        self.enter_scope()
+
+        if statement.initializer:
+            self.statement_appliers[type(statement.initializer)](statement.initializer)
+        times = self.translate_expression(statement.times)
+        statements = self.build_inner_statements(statement.body, modify_scope=False)
+        self.current_script.append(Repeat(times, *statements))
+
+        self.exit_scope()
+
     def apply_return(self, statement):
         if self.current_function_building:
             # Returning from a function
-            return_expression = statement["expression"]
+            return_expression = statement.expression
             if return_expression is not None:
                 function_output_variable = self.functions[self.current_function_building]["output"]
                 return_expression = self.translate_expression(return_expression)
@@ -493,25 +496,31 @@ class ScriptBuilder(CodeBuilder):
         self.current_script.append(Stop(THIS_SCRIPT))
 
     def apply_local_variable(self, statement):
-        value = statement["value"]
+        if isinstance(statement, nodes.DeclareConstant):
+            self.symbols.declare(statement.variable.name, statement)
+            return
+
+        value = statement.value
+        if value is None: value = self.get_default_value(statement.variable_type)
         if not isinstance(value, bool): value = self.translate_expression(value)
 
         if isinstance(value, Block) or isinstance(value, list) and any(isinstance(i, Block) for i in value):
-            set_lexpos(statement["value"]["lexpos"])
+            if isinstance(statement.value, nodes.Node): set_lexpos(statement.value.lexpos)
             code_error("Top-level assignment values must be literals")
         else:
             self.add_variable(
-                statement["variable"]["variable"],
-                statement["variable type"],
-                value
+                statement.variable.name,
+                statement.variable_type,
+                value,
+                statement.constant
             )
 
     def build_function(self, function):
-        function_type = function["return type"]
-        function_name = function["name"]
-        function_parameters = function["parameters"]
-        function_warp = function["warp"]
-        function_body = function["body"]
+        function_type = function.return_type
+        function_name = function.name
+        function_parameters = function.parameters
+        function_warp = function.warp
+        function_body = function.body
 
         # A function name of `reverse_text` with two parameters
         # is named "reverse_text %s %s"
@@ -532,7 +541,9 @@ class ScriptBuilder(CodeBuilder):
 
         if function_type is not None:
             output_variable_name = f"fo_{function_name}" if self.is_sprite else f"bfo_{function_name}"
-            output_variable = self.projectbuilder.add_variable(output_variable_name, function_type, "", self.target)
+            output_variable = self.projectbuilder.add_variable(
+                output_variable_name, function_type, "", target=self.target
+            )
         else:
             output_variable = None
         self.functions[function_name] = {"output": output_variable} # Add to functions dictionary first
@@ -553,13 +564,13 @@ class ScriptBuilder(CodeBuilder):
         self.exit_scope()
 
     def build_hat(self, hat):
-        set_lexpos(hat["lexpos"])
+        set_lexpos(hat.lexpos)
 
-        hat_event = hat["event"]
-        hat_arguments = hat["arguments"]
-        hat_body = hat["body"]
+        hat_event = hat.event
+        hat_arguments = hat.arguments
+        hat_body = hat.body
 
-        if hat_event["attribute"] == "on_keyrelease":
+        if isinstance(hat_event, nodes.GetAttribute) and hat_event.attribute == "on_keyrelease":
             key = self.translate_expression(hat_arguments[0])
             self.scripts.append([
                 WhenKeyPressed(key),
@@ -574,7 +585,7 @@ class ScriptBuilder(CodeBuilder):
 
         if hat_class.__name__ == "WhenBroadcastReceived": # Is this Pythonic?
             broadcast_name = hat_arguments[0]
-            message_argument = hat_arguments[1]["variable"] if len(hat_arguments) > 1 else None
+            message_argument = hat_arguments[1].name if len(hat_arguments) > 1 else None
 
             dict_entry = self.projectbuilder.get_broadcast(broadcast_name)
             broadcast_object = dict_entry["broadcast"]
@@ -612,9 +623,9 @@ class ScriptBuilder(CodeBuilder):
     def build(self):
         statements = self.statements
 
-        local_variables = [i for i in statements if i["type"] == "assignment"]
-        function_decs   = [i for i in statements if i["type"] == "function declaration"]
-        hat_decs        = [i for i in statements if i["type"] == "hat"]
+        local_variables = [i for i in statements if isinstance(i, (nodes.DeclareVariable, nodes.DeclareConstant))]
+        function_decs   = [i for i in statements if isinstance(i, nodes.FunctionDeclaration)]
+        hat_decs        = [i for i in statements if isinstance(i, nodes.Hat)]
 
         for i in local_variables: self.apply_local_variable(i)
         debug(f"  Added {len(local_variables)} targetwide variable{"" if len(local_variables) == 1 else "s"}")
@@ -642,10 +653,7 @@ class ScriptBuilder(CodeBuilder):
         return result
 
     def enter_scope(self):
-        self._scope_ID += 1
-        self._scope_stack.append(self._scope_ID)
-        self.current_scope_ID = self._scope_stack[-1]
+        self.symbols.enter_scope()
 
     def exit_scope(self):
-        del self._scope_stack[-1]
-        self.current_scope_ID = self._scope_stack[-1]
+        self.symbols.exit_scope()
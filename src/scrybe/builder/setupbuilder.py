@@ -1,12 +1,22 @@
 from .codebuilder import CodeBuilder
+from .. import nodes
 from ..logger import set_lexpos, code_error
 
 class SetupBuilder(CodeBuilder):
     def __init__(self, projectbuilder, statements):
         self.projectbuilder = projectbuilder
         self.statements = statements
-
-        self.variables = {}
+        self.symbols = projectbuilder.symbols["global"]
+
+        # Translation functions keyed by AST node class
+        self.expression_translators = {
+            nodes.Index:               self.translate_index,
+            nodes.Concatenation:       self.translate_concatenation,
+            nodes.NumericalOperation:  self.translate_numerical_operation,
+            nodes.ComparisonOperation: self.translate_comparison_operation,
+            nodes.LogicalOperation:    self.translate_logical_operation,
+            nodes.Variable:            self.translate_variable
+        }
 
     # Expression translation
 
@@ -14,36 +24,28 @@ class SetupBuilder(CodeBuilder):
         if isinstance(expression, list):
             return list(map(self.translate_expression, expression))
 
-        if not isinstance(expression, dict):
+        if not isinstance(expression, nodes.Node):
             # Handle all other literals
             return expression
 
-        set_lexpos(expression["lexpos"])
-
-        match expression["type"]:
-            case "index":                translation_function = self.translate_index
-            case "concatenation":        translation_function = self.translate_concatenation
-            case "numerical operation":  translation_function = self.translate_numerical_operation
-            case "comparison operation": translation_function = self.translate_comparison_operation
-            case "logical operation":    translation_function = self.translate_logical_operation
+        set_lexpos(expression.lexpos)
+        return self.expression_translators[type(expression)](expression)
 
-            case "variable":             return self.resolve_data_name(expression["variable"])
-
-        return translation_function(expression)
+    def translate_variable(self, expression):
+        return self.resolve_data_name(expression.name)
 
     # Defined (global) variables
 
     def add_variable(self, variable_name, variable_type, variable_value):
-        self.variables[variable_name] = self.projectbuilder.add_variable(
-            f"g_{variable_name}", variable_type, variable_value,
-            self.projectbuilder.project.stage
+        return self.projectbuilder.add_variable(
+            variable_name, variable_type, variable_value,
+            symbols = self.symbols
         )
 
-        return self.variables[variable_name]
-
     def resolve_data_name(self, data_name, allow_nonexistent=False):
-        if data_name in self.variables:
-            return self.variables[data_name].value
+        variable_object = self.symbols.resolve(data_name)
+        if variable_object is not None:
+            return variable_object.value
 
         if not allow_nonexistent:
             code_error("Variable not found")
@@ -52,11 +54,11 @@ class SetupBuilder(CodeBuilder):
 
     def build_inner_statements(self):
         for declaration in self.statements:
-            set_lexpos(declaration["lexpos"])
+            set_lexpos(declaration.lexpos)
 
-            variable_name = declaration["name"]
-            variable_type = declaration["type"]
-            variable_value = self.translate_expression(declaration["value"])
+            variable_name = declaration.name
+            variable_type = declaration.variable_type
+            variable_value = self.translate_expression(declaration.value)
 
             if self.resolve_data_name(variable_name, allow_nonexistent=True):
                 code_error("Cannot redeclare globals")
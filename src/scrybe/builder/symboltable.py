@@ -0,0 +1,44 @@
+# Variables of one target (or the globals), looked up by their name in the
+# source. Every name keeps a stack of the variables declared with it, so a
+# lookup is a single dictionary access and leaving a scope pops whatever was
+# declared inside it
+class SymbolTable:
+    def __init__(self, prefix):
+        self.prefix = prefix # Prefix of the Scratch names, e.g. "s" for sprites
+
+        # Symbols: {
+        #     <variable name>: [<outermost variable object>, ..., <innermost variable object>],
+        #     ...
+        # }
+        self.symbols = {}
+        # Scopes: [
+        #     (<scope ID>, [<names declared in the scope>]),
+        #     ...
+        # ]
+        self.scopes = [(0, [])]
+        self._scope_ID = 0
+
+    def enter_scope(self):
+        self._scope_ID += 1
+        self.scopes.append((self._scope_ID, []))
+
+    def exit_scope(self):
+        _, declared_names = self.scopes.pop()
+        for name in declared_names:
+            stack = self.symbols[name]
+            stack.pop()
+            if not stack: del self.symbols[name]
+
+    # Name of the Scratch variable for `name` in the current scope,
+    # e.g. "s_foo" in the outermost scope of a sprite and "s3_foo" in scope 3
+    def encode(self, name):
+        scope_ID = self.scopes[-1][0]
+        return f"{self.prefix}{scope_ID or ""}_{name}"
+
+    def declare(self, name, variable_object):
+        self.symbols.setdefault(name, []).append(variable_object)
+        self.scopes[-1][1].append(name)
+
+    def resolve(self, name):
+        stack = self.symbols.get(name)
+        return stack[-1] if stack else None
@@ -0,0 +1,171 @@
+from .builder import ProjectBuilder
+from .context import CompilationContext, activate
+from .files import VirtualFiles
+from .logger import debug, info, warn
+from .optimizer import PassManager
+from . import filestate
+from . import profiler
+import io
+import os
+
+# Compiles one project from its files (see `files.py`). Every compiler has
+# its own context (see `context.py`) with the opened files, error position,
+# parsers and IDs, so compilers can run in several threads at once. Errors in
+# the source code raise `CompileError`. `optimizer` is the pass manager that
+# optimizes the scripts (see `optimizer`), at the default level if not given
+class Compiler:
+    def __init__(self, files, cache=None, jobs=1, optimizer=None):
+        self.files = files
+        self.cache = cache
+        self.jobs = jobs
+        self.optimizer = optimizer or PassManager()
+
+        self.context = CompilationContext(files)
+        self.projectbuilder = None
+
+    # Parse the currently opened file, reusing its cached AST if it hasn't changed
+    def parse_current_file(self, parse_function):
+        if not self.cache:
+            return parse_function()
+
+        file_path = filestate.current_file()
+        source = filestate.read_file()
+
+        ast = self.cache.get_ast(file_path, source)
+        if ast is None:
+            ast = parse_function()
+            self.cache.set_ast(file_path, source, ast)
+
+        return ast
+
+    # Parse sprites in parallel ahead of time, skipping ones with a cached AST
+    # Returns a dictionary of {<sprite filepath>: <AST>}
+    def parse_sprites(self, sprite_paths):
+        from .scriptparser import parse_files
+
+        to_parse = []
+        for filepath in sprite_paths:
+            if self.cache and self.cache.has_ast(filestate.normalize_path(filepath), self.files.read(filepath)):
+                continue
+
+            to_parse.append(filepath)
+
+        debug(f"Parsing {len(to_parse)} sprite{"" if len(to_parse) == 1 else "s"} with {self.jobs} jobs")
+        with profiler.phase(f"Parse {len(to_parse)} sprites ({self.jobs} jobs)"):
+            return dict(zip(to_parse, parse_files(self.files.root, to_parse, self.jobs)))
+
+    # Returns the project builder with the built project
+    def compile(self):
+        with activate(self.context):
+            return self._compile()
+
+    def _compile(self):
+        with profiler.phase("Load parsers"):
+            from .setupparser import parse_file as parse_setup
+            from .scriptparser import parse_file as parse_script
+
+        files = self.files
+        cache = self.cache
+
+        projectbuilder = ProjectBuilder(files)
+        projectbuilder.cache = cache
+        projectbuilder.optimizer = self.optimizer
+        self.projectbuilder = projectbuilder
+
+        debug("Applying setup")
+        if files.exists("setup.sbc"):
+            filestate.open_file("setup.sbc")
+            if cache: cache.set_dependencies(filestate.read_file(), self.optimizer.fingerprint)
+            with profiler.phase("Parse setup.sbc"):
+                setup_ast = self.parse_current_file(parse_setup)
+            with profiler.phase("Apply setup"):
+                projectbuilder.apply_setup(setup_ast)
+            filestate.close_file()
+
+            info("Setup applied")
+        else:
+            if cache: cache.set_dependencies(None, self.optimizer.fingerprint)
+            warn("Setup file not found")
+
+        debug("Adding stage")
+        if files.exists("stage.sbs"):
+            filestate.open_file("stage.sbs")
+            with profiler.phase("Parse stage.sbs"):
+                stage_ast = self.parse_current_file(parse_script)
+            projectbuilder.add_stage(stage_ast)
+            filestate.close_file()
+
+        else:
+            warn("Stage not found")
+
+        debug("Searching for sprite folder")
+        if not files.exists("sprites"):
+            warn("Sprites folder not found")
+
+        else:
+            debug("Gathering sprites")
+            # Sorted, since the order of the files decides the order of the sprites
+            sprite_paths = files.glob("sprites/*.sbs")
+            if not sprite_paths:
+                warn("Sprites folder exists but contains no sprites")
+
+            # Worker processes read the sprites from the disk
+            parsed_sprites = {}
+            if self.jobs > 1 and len(sprite_paths) > 1 and files.root is not None:
+                parsed_sprites = self.parse_sprites(sprite_paths)
+
+            debug("Adding sprites")
+            for filepath in sprite_paths:
+                debug(f'Adding sprite from "{filepath}"')
+
+                filestate.open_file(filepath)
+                if filepath in parsed_sprites:
+                    sprite_ast = parsed_sprites[filepath]
+                    if cache: cache.set_ast(filestate.current_file(), filestate.read_file(), sprite_ast)
+                else:
+                    with profiler.phase(f"Parse {filestate.current_file()}"):
+                        sprite_ast = self.parse_current_file(parse_script)
+                sprite_name = projectbuilder.add_sprite(sprite_ast, os.path.basename(filepath))
+                filestate.close_file()
+
+                info(f'Added sprite "{sprite_name}"')
+
+        debug("Building project")
+        projectbuilder.build()
+        info("Project built")
+        self.optimizer.report()
+
+        if cache:
+            debug("Saving build cache")
+            cache.save()
+
+        return projectbuilder
+
+    # Write the compiled project to an .sb3 file, named after the project by default
+    def save(self, filename=None, compresslevel=5, store_media=False, compact=False):
+        with activate(self.context):
+            return self.projectbuilder.save(filename, compresslevel, store_media, compact)
+
+    # The compiled project as the contents of an .sb3 file
+    def to_bytes(self, compresslevel=5, store_media=False, compact=False):
+        output = io.BytesIO()
+        self.save(output, compresslevel, store_media, compact)
+
+        return output.getvalue()
+
+# Compile a project held in memory, without touching the disk, changing the
+# running directory or exiting. `sources` are the source files by their path in
+# the project, such as "setup.sbc", "stage.sbs" and "sprites/cat.sbs", and
+# `assets` are the costume and sound files as bytes. Writes the .sb3 file to
+# `output` (any binary file-like object) and returns it, or returns the .sb3
+# file's contents without `output`. Errors in the sources raise `CompileError`.
+# `optimizer` is an optional pass manager, as for `Compiler`
+def compile_sources(sources, assets=None, name="project", output=None, compresslevel=5, compact=False, optimizer=None):
+    compiler = Compiler(VirtualFiles(sources, assets, name), optimizer=optimizer)
+    compiler.compile()
+
+    if output is None:
+        return compiler.to_bytes(compresslevel, compact=compact)
+
+    compiler.save(output, compresslevel, compact=compact)
+    return output
@@ -0,0 +1,65 @@
+from .files import ProjectFiles
+from ScratchGen import ids
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import copy
+import os
+
+# Everything a compilation keeps track of while it runs. Each thread (or
+# other context) compiles with its own, so several projects can be compiled
+# at the same time without sharing files, error positions, parsers or IDs
+class CompilationContext:
+    def __init__(self, files):
+        self.files = files
+
+        # File entries: {<relative filepath>: <file content>, ...}
+        self.file_entries = {}
+        self.current_entry = None
+
+        # Position in the current file that errors are reported at
+        self.lexpos = None
+        # Warnings: [{"file": <relative filepath or None>, "message": <text>}, ...]
+        self.warnings = []
+
+        # ScratchGen's ID counters: {<purpose>: <last ID>, ...}
+        self.IDs = {}
+
+        # Parsers: {<shared parser ID>: (<parser>, <lexer>), ...}
+        self.parsers = {}
+
+    # Copies of a shared parser and lexer for this context. The grammar tables
+    # are shared, only the parsing state is this context's own
+    def get_parser(self, parser, lexer):
+        if id(parser) not in self.parsers:
+            self.parsers[id(parser)] = (copy(parser), lexer.clone())
+
+        return self.parsers[id(parser)]
+
+_current = ContextVar("scrybe_context", default=None)
+
+# Used outside of any compilation, with files relative to the running directory
+_default = CompilationContext(ProjectFiles(os.curdir))
+
+def get_context():
+    return _current.get() or _default
+
+@contextmanager
+def activate(context):
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+# ScratchGen numbers IDs with a module-level dictionary of counters, which it
+# looks up each time it generates an ID. Replacing it with this view of the
+# current context's counters keeps the IDs of concurrent compilations apart
+class _ContextIDs(MutableMapping):
+    def __getitem__(self, purpose):         return get_context().IDs[purpose]
+    def __setitem__(self, purpose, value):  get_context().IDs[purpose] = value
+    def __delitem__(self, purpose):         del get_context().IDs[purpose]
+    def __iter__(self):                     return iter(get_context().IDs)
+    def __len__(self):                      return len(get_context().IDs)
+
+ids.id_dict = _ContextIDs()
@@ -0,0 +1,72 @@
+from fnmatch import fnmatchcase
+import glob
+import io
+import os
+
+# The files of a project directory, which a compilation reads its sources
+# and assets from. Paths are relative to the project directory, so nothing
+# depends on the running directory of the process
+class ProjectFiles:
+    def __init__(self, root):
+        self.root = root
+        self.name = os.path.basename(os.path.abspath(root))
+
+    # Absolute path of a file, which identifies it in the build cache
+    def path(self, file_path):
+        return os.path.abspath(os.path.join(self.root, file_path))
+
+    def exists(self, file_path):
+        return os.path.exists(os.path.join(self.root, file_path))
+
+    def read(self, file_path):
+        with open(os.path.join(self.root, file_path)) as handle:
+            return handle.read()
+
+    def open_binary(self, file_path):
+        return open(os.path.join(self.root, file_path), "rb")
+
+    def stat(self, file_path):
+        return os.stat(os.path.join(self.root, file_path))
+
+    # Sorted, since glob's order depends on the filesystem
+    def glob(self, expression):
+        return sorted(glob.glob(expression, root_dir=self.root))
+
+# Files held in memory, for compiling without touching the disk
+# Sources: {<relative filepath>: <source code>, ...}
+# Assets:  {<relative filepath>: <file content as bytes>, ...}
+class VirtualFiles:
+    def __init__(self, sources, assets=None, name="project"):
+        self.root = None # Not on the disk
+        self.name = name
+        self.files = {self.path(path): content for path, content in {**(assets or {}), **sources}.items()}
+
+    def path(self, file_path):
+        return os.path.normpath(file_path).replace("\\", "/")
+
+    # Directories exist if they contain a file
+    def exists(self, file_path):
+        file_path = self.path(file_path)
+        return file_path in self.files or any(path.startswith(f"{file_path}/") for path in self.files)
+
+    def read(self, file_path):
+        content = self.files[self.path(file_path)]
+        return content.decode() if isinstance(content, bytes) else content
+
+    def open_binary(self, file_path):
+        content = self.files[self.path(file_path)]
+        return io.BytesIO(content.encode() if isinstance(content, str) else content)
+
+    # Same matching as `glob.glob`: wildcards don't cross directories
+    # and only match hidden files if the pattern starts with a dot
+    def glob(self, expression):
+        pattern = self.path(expression).split("/")
+
+        def matches(path):
+            parts = path.split("/")
+            return len(parts) == len(pattern) and all(
+                fnmatchcase(part, part_pattern) and (part_pattern.startswith(".") or not part.startswith("."))
+                for part, part_pattern in zip(parts, pattern)
+            )
+
+        return sorted(path for path in self.files if matches(path))
@@ -1,37 +1,37 @@
 from .logger import debug
+from .context import get_context
 
-# File entries: {
-#     <relative filepath>: {
-#         "handle":  <file handle>,
-#         "content": <file content>
-#     },
-#     ...
-# }
-file_entries = {}
-current_entry = None
+# The files of the current compilation (see `context.py`) that have been opened,
+# and the one being compiled, which errors are reported in
 
-def open_file(file_path):
-    global file_entries, current_entry
+def reset():
+    context = get_context()
+    context.file_entries = {}
+    context.current_entry = None
+
+def normalize_path(file_path):
+    return file_path.replace("\\", "/")
 
-    file_path = file_path.replace("\\", "/")
-    file_handle = open(file_path)
-    file_content = file_handle.read()
+def open_file(file_path):
+    context = get_context()
 
-    file_entries[file_path] = {
-        "handle":  file_handle,
-        "content": file_content
-    }
+    file_path = normalize_path(file_path)
+    context.file_entries[file_path] = context.files.read(file_path)
 
-    current_entry = file_path
+    context.current_entry = file_path
     debug(f'  Opened file "{file_path}"')
 
+# Make a file that was opened earlier the current one again
+def select_file(file_path):
+    get_context().current_entry = normalize_path(file_path)
+
+def current_file():
+    return get_context().current_entry
+
 def read_file():
-    global file_entries, current_entry
+    context = get_context()
 
-    return file_entries[current_entry]["content"]
+    return context.file_entries[context.current_entry]
 
 def close_file():
-    global file_entries, current_entry
-
-    file_entries[current_entry]["handle"].close()
-    current_entry = None
+    get_context().current_entry = None
@@ -1,3 +1,4 @@
+from .context import get_context
 from colorama import Fore, Style
 import sys
 
@@ -11,29 +12,38 @@ log_prefixes = {
 
 MAX_PREVIOUS_ERROR_LINES = 3
 
+def remove_colors(text):
+    for color in all_colors:
+        text = text.replace(color, "")
+
+    return text
+
+# Raised for errors in the compiled source code. The message is the full report
+# with the faulty lines, and the parts of the report are kept as attributes
+class CompileError(Exception):
+    message       = None
+    file_name     = None
+    line_number   = None
+    column_number = None
+
 class Logger:
     def __init__(self):
         self.log_level = "info"
         self.color     = True
-        self.lexpos    = None
+        self.stream    = None # Standard output when None
 
+    # The position is kept by the current compilation, see `context.py`
     def set_lexpos(self, lexpos):
-        self.lexpos = lexpos
-
-    def _remove_colors(self, text):
-        for color in all_colors:
-            text = text.replace(color, "")
-
-        return text
+        get_context().lexpos = lexpos
 
     def _print(self, *args, exit):
         text = " ".join(args)
 
         if not self.color:
-            text = self._remove_colors(text)
+            text = remove_colors(text)
 
         if exit: sys.exit(text)
-        print(text)
+        print(text, file=self.stream)
 
     def _log(self, type, text, exit=False):
         log_levels = list(log_prefixes.keys())
@@ -45,17 +55,23 @@ class Logger:
 
     def debug(self, text):             self._log("debug",   text)
     def info(self, text):              self._log("info",    text)
-    def warn(self, text):              self._log("warning", text)
+    def warn(self, text):              self._warn(text)
     def error(self, text, exit=False): self._log("error",   text, exit=exit)
 
+    # Warnings are also kept by the current compilation, see `context.py`
+    def _warn(self, text):
+        context = get_context()
+        context.warnings.append({"file": context.current_entry, "message": text.strip()})
+        self._log("warning", text)
+
     def code_error(self, text):
         from . import filestate # Lazy import
 
-        file_name = filestate.current_entry
+        file_name = filestate.current_file()
         source_code = filestate.read_file()
 
         split_lines = source_code.split("\n")
-        lexpos = self.lexpos
+        lexpos = get_context().lexpos
         text_index = lexpos if lexpos is not None else len(source_code.strip()) - 1
 
         # Show the faulty line of code as well as the previous few
@@ -76,7 +92,13 @@ class Logger:
         text_info_line3  = "-" * (len(text_info_line2) - 14) # Separator with the right size
         text_info = f"{text_info_line1}\n\n{text_info_line2}\n{text_info_line3}"
 
-        self._print(f"{text_info}\n{lines_to_show}\n{indented_arrow}", exit=True)
+        report = f"{text_info}\n{lines_to_show}\n{indented_arrow}"
+        exception = CompileError(report if self.color else remove_colors(report))
+        exception.message = text
+        exception.file_name = file_name
+        exception.line_number = line_number + 1
+        exception.column_number = column_number
+        raise exception
 
 
 logger = Logger()
@@ -88,3 +110,9 @@ error      = logger.error
 code_error = logger.code_error
 
 set_lexpos = logger.set_lexpos
+
+# Worker processes start with a fresh logger, so process pools run this with
+# the parent's `logger.log_level` and `logger.color` to carry its settings over
+def initialize_worker(log_level, color):
+    logger.log_level = log_level
+    logger.color     = color
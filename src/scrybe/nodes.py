@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+from .types import Types
+
+# AST nodes produced by both parsers. Node kinds are told apart by class,
+# so builders dispatch through dictionaries keyed on the node class.
+# Literals are plain Python values: numbers, strings, booleans and lists.
+
+node = dataclass(slots=True, eq=False)
+
+@node
+class Node:
+    lexpos: int
+
+# Program structure
+
+@node
+class Program:
+    declarations: list
+    statements:   list
+
+@node
+class MetaDeclaration(Node):
+    property: str
+    value:    object
+
+# Data and accessors
+
+@node
+class Variable(Node):
+    name: str
+
+@node
+class GetAttribute(Node):
+    object:    object  # "scratch", "this" or a `Variable`/`GetAttribute`/`Index`
+    attribute: str
+
+@node
+class Index(Node):
+    target: Node
+    index:  object
+
+# Operations
+
+@node
+class Concatenation(Node):
+    operands: list
+
+@node
+class NumericalOperation(Node):
+    operation: str
+    operands:  list
+
+@node
+class ComparisonOperation(Node):
+    condition: str
+    operands:  list
+
+@node
+class LogicalOperation(Node):
+    condition:  str
+    comparands: list
+
+# Statements
+
+@node
+class DeclareVariable(Node):
+    variable:      Variable
+    variable_type: Types
+    value:         object
+    constant:      bool
+
+@node
+class SetVariable(Node):
+    variable: Node
+    value:    object
+
+@node
+class InPlaceAssignment(Node):
+    operation: str
+    variable:  Node
+    operand:   object
+
+@node
+class FunctionCall(Node):
+    function:  Node
+    arguments: list
+
+@node
+class If(Node):
+    expression: object
+    body:       list
+
+@node
+class IfElse(Node):
+    expression: object
+    body_1:     list
+    body_2:     list
+
+@node
+class For(Node):
+    initializer:    Node
+    expression:     object
+    post_iteration: Node
+    body:           list
+
+@node
+class While(Node):
+    expression: object
+    body:       list
+
+@node
+class Return(Node):
+    expression: object
+
+# Statements only produced by optimization passes (see `optimizer`)
+
+@node
+class Forever(Node):
+    body: list
+
+# A `for` loop whose number of iterations is known before it starts. The
+# initializer and the body's last statement maintain the loop's counter,
+# which is left out if nothing reads it
+@node
+class Repeat(Node):
+    initializer: Node
+    times:       object
+    body:        list
+
+# A constant whose every use was replaced by its value. It's checked
+# like any declaration, but no Scratch variable is created for it
+@node
+class DeclareConstant(Node):
+    variable:      Variable
+    variable_type: Types
+    value:         object
+
+# Top-level statements
+
+@node
+class FunctionDeclaration(Node):
+    return_type: Types
+    name:        str
+    parameters:  list
+    warp:        bool
+    body:        list
+
+@node
+class Hat(Node):
+    event:     Node
+    arguments: list
+    body:      list
+
+# Setup files
+
+@node
+class SetupProgram:
+    file_declaration: object  # `FileDeclaration` or None
+    variables:        list
+
+@node
+class FileDeclaration:
+    project_name: str
+    filename:     str
+
+@node
+class SetupVariable(Node):
+    name:          str
+    variable_type: Types
+    value:         object
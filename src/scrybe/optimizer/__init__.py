@@ -0,0 +1 @@
+from .passmanager import PassManager, PASSES, PASS_NAMES, OPTIMIZATION_LEVELS, DEFAULT_LEVEL
@@ -0,0 +1,268 @@
+from .transformer import OptimizationPass, walk
+from .. import translations
+from .. import nodes
+from ..types import Types
+from dataclasses import replace
+import math
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def is_literal(value):
+    return isinstance(value, (int, float, str))
+
+# Results of folded operations, as long as they're numbers Scratch can store.
+# Whole numbers become integers so `10 / 2` shows up as 5 and not 5.0
+def normalize_number(value):
+    if not is_number(value):
+        return None
+
+    try:
+        if not math.isfinite(value):
+            return None
+    except OverflowError: # Integers too large for a float
+        return None
+
+    if isinstance(value, float) and value.is_integer() and abs(value) < 2 ** 53:
+        return int(value)
+    return value
+
+# How a literal is written in the reports
+def describe(value):
+    if isinstance(value, bool): return str(value).lower()
+    if isinstance(value, str):  return f'"{value}"'
+    return str(value)
+
+class FoldConstants(OptimizationPass):
+    name        = "fold-constants"
+    level       = 1
+    description = "Replace constants declared with a literal by their value and fold operations on literals"
+
+    def __init__(self, manager, projectbuilder=None):
+        super().__init__(manager, projectbuilder)
+
+        # Scopes: [
+        #     {
+        #         <variable name>: None for variables, or {
+        #             "value":       <literal value>,
+        #             "declaration": <declaration statement>,
+        #             "uses":        <number of uses replaced by the value>,
+        #             "needed":      <whether the Scratch variable is still needed>
+        #         },
+        #         ...
+        #     },
+        #     ...
+        # ]
+        # Like the builder's symbol table, each body is a scope
+        self.scopes = []
+
+    def run(self, statements):
+        # Variables declared at the top level are added before anything else is built
+        self.scopes.append({})
+        top_level = {
+            id(statement): self.visit(statement)
+            for statement in statements if isinstance(statement, nodes.DeclareVariable)
+        }
+        new_statements = [
+            top_level[id(statement)] if id(statement) in top_level else self.visit(statement)
+            for statement in statements
+        ]
+
+        return self.exit_scope(new_statements)
+
+    # Scopes
+
+    def visit_body(self, statements):
+        self.scopes.append({})
+        return self.exit_scope(super().visit_body(statements))
+
+    # Leave the innermost scope, whose `statements` are given, and replace the
+    # declarations of its constants that don't need a Scratch variable
+    def exit_scope(self, statements):
+        scope = self.scopes.pop()
+        unneeded = {}
+        for name, constant in scope.items():
+            if constant is None:
+                continue
+
+            declaration = constant["declaration"]
+            uses = f"{constant["uses"]} use{"" if constant["uses"] == 1 else "s"}"
+            if constant["needed"]:
+                if constant["uses"]:
+                    self.report(declaration, f"Replaced {uses} of constant `{name}` with its value")
+                continue
+
+            unneeded[id(declaration)] = nodes.DeclareConstant(
+                declaration.lexpos, declaration.variable, declaration.variable_type, constant["value"]
+            )
+            if constant["uses"]:
+                self.report(declaration, f"Replaced {uses} of constant `{name}` with its value and removed its variable")
+            else:
+                self.report(declaration, f"Removed unused constant `{name}`")
+
+        if not unneeded:
+            return statements
+        return [unneeded.get(id(statement), statement) for statement in statements]
+
+    def declare(self, name, constant=None):
+        self.scopes[-1][name] = constant
+
+    def resolve(self, name):
+        # Globals take precedence over the target's own variables
+        if self.projectbuilder and self.projectbuilder.symbols["global"].resolve(name) is not None:
+            return None
+
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+
+    # Variables in `tree` that are used as more than a value, like assignment
+    # targets or the owners of attributes, keep their Scratch variable
+    def keep_variables(self, tree):
+        for node in walk(tree):
+            if isinstance(node, nodes.Variable):
+                constant = self.resolve(node.name)
+                if constant: constant["needed"] = True
+
+    # Declarations
+
+    # The declared variable is a name being bound, not a use, so only the value
+    # is visited and the name is never replaced by a constant's value
+    def visit_DeclareVariable(self, node):
+        value = self.visit(node.value)
+        if value is not node.value:
+            node = replace(node, value=value)
+
+        # Only constants whose literal is exactly their declared type, so a `var`
+        # constant holding "5" can still be used as a number, as it could before
+        if node.constant and is_literal(value) and Types.get_type(value) == node.variable_type:
+            self.declare(node.variable.name, {"value": value, "declaration": node, "uses": 0, "needed": False})
+        else:
+            self.declare(node.variable.name)
+
+        return node
+
+    # Declared by this pass, with a literal value
+    def visit_DeclareConstant(self, node):
+        return node
+
+    def visit_FunctionDeclaration(self, node):
+        self.scopes.append({})
+        for parameter in node.parameters:
+            self.declare(parameter)
+
+        node = self.generic_visit(node)
+        self.scopes.pop()
+
+        return node
+
+    def visit_For(self, node):
+        self.scopes.append({})
+        node = self.generic_visit(node)
+        self.scopes.pop()
+
+        return node
+
+    def visit_Hat(self, node):
+        # The arguments of `on_broadcast` are a broadcast name and a variable name
+        if isinstance(node.event, nodes.GetAttribute) and node.event.attribute == "on_broadcast":
+            self.scopes.append({})
+            for argument in node.arguments[1:]:
+                self.declare(argument.name)
+
+            body = self.visit_body(node.body)
+            self.scopes.pop()
+
+            return node if body is node.body else nodes.Hat(node.lexpos, node.event, node.arguments, body)
+
+        arguments = self.visit(node.arguments)
+        body = self.visit_body(node.body)
+        if arguments is node.arguments and body is node.body:
+            return node
+        return nodes.Hat(node.lexpos, node.event, arguments, body)
+
+    # Assignments
+
+    def visit_assignment_target(self, target):
+        if isinstance(target, nodes.Index):
+            self.keep_variables(target.target)
+            index = self.visit(target.index)
+            return target if index is target.index else nodes.Index(target.lexpos, target.target, index)
+
+        self.keep_variables(target)
+        return target
+
+    def visit_SetVariable(self, node):
+        variable = self.visit_assignment_target(node.variable)
+        value = self.visit(node.value)
+        if variable is node.variable and value is node.value:
+            return node
+
+        return nodes.SetVariable(node.lexpos, variable, value)
+
+    def visit_InPlaceAssignment(self, node):
+        variable = self.visit_assignment_target(node.variable)
+        operand = self.visit(node.operand)
+        if variable is node.variable and operand is node.operand:
+            return node
+
+        return nodes.InPlaceAssignment(node.lexpos, node.operation, variable, operand)
+
+    # Expressions
+
+    def visit_Variable(self, node):
+        constant = self.resolve(node.name)
+        if not constant:
+            return node
+
+        constant["uses"] += 1
+        return constant["value"]
+
+    def visit_GetAttribute(self, node):
+        self.keep_variables(node)
+        return node
+
+    def visit_FunctionCall(self, node):
+        self.keep_variables(node.function)
+        arguments = self.visit(node.arguments)
+
+        return node if arguments is node.arguments else nodes.FunctionCall(node.lexpos, node.function, arguments)
+
+    def visit_NumericalOperation(self, node):
+        node = self.generic_visit(node)
+        if not all(map(is_number, node.operands)):
+            return node
+
+        try:
+            result = normalize_number(translations.numerical_operations[node.operation](*node.operands))
+        except (ZeroDivisionError, OverflowError):
+            result = None
+
+        if result is None: # Left for Scratch to calculate, like division by zero
+            return node
+
+        self.report(node, f"Folded a numerical operation to {describe(result)}")
+        return result
+
+    def visit_ComparisonOperation(self, node):
+        node = self.generic_visit(node)
+        x, y = node.operands
+
+        # Strings can only be compared for (in)equality
+        strings = isinstance(x, str) and isinstance(y, str) and node.condition in ("==", "!=")
+        if not (is_number(x) and is_number(y) or strings) or not translations._literal_comparands(x, y):
+            return node
+
+        result = translations.comparison_operations[node.condition](x, y)
+
+        self.report(node, f"Folded a comparison to {describe(result)}")
+        return result
+
+    def visit_Concatenation(self, node):
+        node = self.generic_visit(node)
+        x, y = node.operands
+        if not (isinstance(x, str) and isinstance(y, str)):
+            return node
+
+        self.report(node, f"Folded a concatenation to {describe(x + y)}")
+        return x + y
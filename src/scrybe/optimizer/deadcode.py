@@ -0,0 +1,251 @@
+from .transformer import OptimizationPass, StatementFilter, get_field_names, has_side_effects, walk
+from .. import nodes
+
+# Statements that control never passes to the next statement after
+TERMINATORS = (nodes.Return, nodes.Forever)
+
+def is_broadcast_hat(statement):
+    return (
+        isinstance(statement, nodes.Hat) and
+        isinstance(statement.event, nodes.GetAttribute) and
+        statement.event.attribute == "on_broadcast"
+    )
+
+# The name of the broadcast a `scratch.broadcast()` or `scratch.broadcast_and_wait()`
+# statement sends, or None for any other statement
+def get_sent_broadcast(statement):
+    if not (isinstance(statement, nodes.FunctionCall) and isinstance(statement.function, nodes.GetAttribute)):
+        return None
+
+    function = statement.function
+    if function.object != "scratch" or function.attribute not in ("broadcast", "broadcast_and_wait"):
+        return None
+    if not statement.arguments or not isinstance(statement.arguments[0], str):
+        return None
+
+    return statement.arguments[0]
+
+def declares_variables(statements):
+    return any(isinstance(statement, (nodes.DeclareVariable, nodes.DeclareConstant)) for statement in statements)
+
+# Adds the names of the variables `tree` reads to `reads`. Assigning to a variable
+# doesn't read it, and neither does calling a custom function by its name
+def collect_reads(tree, reads):
+    if isinstance(tree, list):
+        for item in tree:
+            collect_reads(item, reads)
+        return
+
+    if not isinstance(tree, nodes.Node) or isinstance(tree, nodes.DeclareConstant):
+        return
+
+    if isinstance(tree, nodes.Variable):
+        reads.add(tree.name)
+    elif isinstance(tree, nodes.DeclareVariable):
+        collect_reads(tree.value, reads)
+    elif isinstance(tree, (nodes.SetVariable, nodes.InPlaceAssignment)) and isinstance(tree.variable, nodes.Variable):
+        collect_reads(tree.value if isinstance(tree, nodes.SetVariable) else tree.operand, reads)
+    elif isinstance(tree, nodes.FunctionCall) and isinstance(tree.function, nodes.Variable):
+        collect_reads(tree.arguments, reads)
+    elif isinstance(tree, nodes.For):
+        # The loop needs its variable even if nothing else reads it
+        for statement in (tree.initializer, tree.post_iteration):
+            write = get_variable_write(statement)
+            if write: reads.add(write[0])
+
+        for field_name in get_field_names(tree):
+            collect_reads(getattr(tree, field_name), reads)
+    elif isinstance(tree, nodes.Hat):
+        # The arguments of `on_broadcast` are a broadcast name and a variable name
+        if not is_broadcast_hat(tree): collect_reads(tree.arguments, reads)
+        collect_reads(tree.body, reads)
+    else:
+        for field_name in get_field_names(tree):
+            collect_reads(getattr(tree, field_name), reads)
+
+# The name of the variable `statement` declares or assigns to and the value it
+# stores, or None for any other statement
+def get_variable_write(statement):
+    if isinstance(statement, nodes.DeclareVariable):
+        return statement.variable.name, statement.value
+    if isinstance(statement, (nodes.SetVariable, nodes.InPlaceAssignment)) and isinstance(statement.variable, nodes.Variable):
+        return statement.variable.name, statement.value if isinstance(statement, nodes.SetVariable) else statement.operand
+
+    return None
+
+class EliminateDeadCode(OptimizationPass):
+    name        = "dead-code"
+    level       = 1
+    description = "Remove unreachable statements, functions that are never called, unused variables and broadcasts nothing receives"
+
+    # Names of the broadcasts some target receives
+    @classmethod
+    def analyze_project(cls, projectbuilder):
+        targets = [projectbuilder.scripts["stage"], *projectbuilder.scripts["sprites"].values()]
+
+        return sorted({
+            statement.arguments[0]
+            for statements in targets for statement in statements
+            if is_broadcast_hat(statement) and statement.arguments and isinstance(statement.arguments[0], str)
+        })
+
+    def __init__(self, manager, projectbuilder=None):
+        super().__init__(manager, projectbuilder)
+
+        # Without the rest of the project, every broadcast might be received
+        received_broadcasts = manager.analyses.get(self.name)
+        self.received_broadcasts = None if received_broadcasts is None else set(received_broadcasts)
+
+    def run(self, statements):
+        statements = self.visit_body(statements)
+        statements = self.remove_uncalled_functions(statements)
+        return self.remove_unused_variables(statements)
+
+    # Unreachable statements
+
+    def visit_body(self, statements):
+        statements = super().visit_body(statements)
+
+        for index, statement in enumerate(statements):
+            if isinstance(statement, TERMINATORS) and index < len(statements) - 1:
+                unreachable = len(statements) - index - 1
+                self.report(statements[index + 1],
+                    f"Removed {unreachable} unreachable statement{"" if unreachable == 1 else "s"}")
+                statements = statements[:index + 1]
+                break
+
+        kept = [statement for statement in statements if not self.is_unreceived_broadcast(statement)]
+        return statements if len(kept) == len(statements) else kept
+
+    def is_unreceived_broadcast(self, statement):
+        broadcast_name = get_sent_broadcast(statement)
+        if broadcast_name is None or self.received_broadcasts is None or broadcast_name in self.received_broadcasts:
+            return False
+        if has_side_effects(statement.arguments):
+            return False
+
+        self.report(statement, f'Removed a broadcast of "{broadcast_name}", which nothing receives')
+        return True
+
+    # Replace a statement by the body that always runs. Bodies are scopes, so
+    # one that declares variables is kept as it is
+    def inline_body(self, node, body, message):
+        if declares_variables(body):
+            return node
+
+        self.report(node, message)
+        return body
+
+    def visit_If(self, node):
+        node = self.generic_visit(node)
+        if node.expression is False or (not node.body and not has_side_effects(node.expression)):
+            self.report(node, "Removed an `if` statement whose body never runs")
+            return None
+
+        if node.expression is True:
+            return self.inline_body(node, node.body, "Replaced `if (true)` with its body")
+        return node
+
+    def visit_IfElse(self, node):
+        node = self.generic_visit(node)
+        if node.expression is True:
+            return self.inline_body(node, node.body_1, "Replaced `if (true)` with its body and removed its `else`")
+        if node.expression is False:
+            return self.inline_body(node, node.body_2, "Replaced `if (false)` with its `else` body")
+
+        if not node.body_1 and not node.body_2 and not has_side_effects(node.expression):
+            self.report(node, "Removed an `if` statement with empty bodies")
+            return None
+        return node
+
+    def visit_While(self, node):
+        node = self.generic_visit(node)
+        if node.expression is not False:
+            return node
+
+        self.report(node, "Removed `while (false)`")
+        return None
+
+    # Expressions hold no statements
+    def visit_expression(self, node):
+        return node
+
+    visit_Variable = visit_GetAttribute = visit_Index = visit_FunctionCall = visit_expression
+
+    # Functions
+
+    # Functions only stay if a script calls them, directly or through other functions
+    def remove_uncalled_functions(self, statements):
+        functions = {
+            statement.name: statement
+            for statement in statements if isinstance(statement, nodes.FunctionDeclaration)
+        }
+        called = set()
+        pending = [statement for statement in statements if isinstance(statement, nodes.Hat)]
+
+        while pending:
+            for node in walk(pending.pop()):
+                if not (isinstance(node, nodes.FunctionCall) and isinstance(node.function, nodes.Variable)):
+                    continue
+
+                function_name = node.function.name
+                if function_name in functions and function_name not in called:
+                    called.add(function_name)
+                    pending.append(functions[function_name])
+
+        uncalled = [function for name, function in functions.items() if name not in called]
+        if not uncalled:
+            return statements
+
+        for function in uncalled:
+            self.report(function, f"Removed function `{function.name}`, which is never called")
+        return [statement for statement in statements if statement not in uncalled]
+
+    # Variables
+
+    # A variable that's declared but never read is removed along with every
+    # assignment to it, unless one of them could have side effects. Removing
+    # assignments can leave other variables unread, so repeat until none are
+    def remove_unused_variables(self, statements):
+        while True:
+            reads = set()
+            collect_reads(statements, reads)
+
+            # Writes: {<variable name>: [<assigned value>, ...]}
+            writes = {}
+            declared = set()
+            for node in walk(statements):
+                write = get_variable_write(node)
+                if write is None:
+                    continue
+
+                writes.setdefault(write[0], []).append(write[1])
+                if isinstance(node, nodes.DeclareVariable):
+                    declared.add(node.variable.name)
+
+            unused = {
+                name for name in declared
+                if name not in reads and not self.is_global(name) and not has_side_effects(writes[name])
+            }
+            if not unused:
+                return statements
+
+            for name in sorted(unused):
+                self.report(self.find_declaration(statements, name), f"Removed unused variable `{name}`")
+
+            new_statements = StatementFilter(
+                lambda statement: (get_variable_write(statement) or (None,))[0] in unused
+            ).visit_body(statements)
+            if new_statements is statements:
+                return statements
+            statements = new_statements
+
+    # Global variables are used by other targets too
+    def is_global(self, name):
+        return self.projectbuilder is not None and self.projectbuilder.symbols["global"].resolve(name) is not None
+
+    def find_declaration(self, statements, name):
+        return next(
+            node for node in walk(statements)
+            if isinstance(node, nodes.DeclareVariable) and node.variable.name == name
+        )
@@ -0,0 +1,58 @@
+from .transformer import OptimizationPass, has_side_effects
+from .. import nodes
+
+# Expressions that are booleans no matter what they contain. Other operands
+# are left alone, so the builder still reports them if they aren't booleans
+def is_boolean(expression):
+    return isinstance(expression, (bool, nodes.ComparisonOperation, nodes.LogicalOperation))
+
+class SimplifyLogic(OptimizationPass):
+    name        = "simplify-logic"
+    level       = 1
+    description = "Remove double negations and logical operations on `true`/`false`"
+
+    def visit_LogicalOperation(self, node):
+        node = self.generic_visit(node)
+        condition = node.condition
+        comparands = node.comparands
+
+        if condition == "not":
+            operand = comparands[0]
+            if isinstance(operand, bool):
+                self.report(node, f"Folded `not {str(operand).lower()}`")
+                return not operand
+
+            # not not x == x
+            if isinstance(operand, nodes.LogicalOperation) and operand.condition == "not" and is_boolean(operand.comparands[0]):
+                self.report(node, "Removed a double negation")
+                return operand.comparands[0]
+
+            return node
+
+        if condition not in ("and", "or") or not all(map(is_boolean, comparands)):
+            return node
+
+        x, y = comparands
+        if isinstance(x, bool) and isinstance(y, bool):
+            result = (x and y) if condition == "and" else (x or y)
+            self.report(node, f"Folded `{condition}` of two literals to {str(result).lower()}")
+            return result
+
+        if isinstance(x, bool):
+            literal, other = x, y
+        elif isinstance(y, bool):
+            literal, other = y, x
+        else:
+            return node
+
+        # x and true == x, x or false == x
+        if literal == (condition == "and"):
+            self.report(node, f"Removed `{condition} {str(literal).lower()}`")
+            return other
+
+        # x and false == false, x or true == true, unless evaluating x does something
+        if has_side_effects(other):
+            return node
+
+        self.report(node, f"Folded `{condition} {str(literal).lower()}` to {str(literal).lower()}")
+        return literal
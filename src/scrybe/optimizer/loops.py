@@ -0,0 +1,214 @@
+from .transformer import OptimizationPass, walk
+from .constants import describe, is_number
+from .. import nodes
+from ..types import Types
+import math
+
+# Comparisons with the loop variable on the right, flipped to have it on the left
+MIRRORED_CONDITIONS = {"<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+def is_integer(value):
+    return is_number(value) and float(value).is_integer()
+
+# Whether any statement in `statements` assigns to the variable `name`
+def assigns_variable(statements, name):
+    return any(
+        isinstance(node, (nodes.DeclareVariable, nodes.SetVariable, nodes.InPlaceAssignment)) and
+        isinstance(node.variable, nodes.Variable) and node.variable.name == name
+        for node in walk(statements)
+    )
+
+def reads_variable(statements, name):
+    return any(isinstance(node, nodes.Variable) and node.name == name for node in walk(statements))
+
+class ForeverLoops(OptimizationPass):
+    name        = "forever-loops"
+    level       = 1
+    description = "Build `while (true)` as a forever loop instead of checking the condition every iteration"
+
+    def visit_While(self, node):
+        node = self.generic_visit(node)
+        if node.expression is not True:
+            return node
+
+        self.report(node, "Turned `while (true)` into a forever loop")
+        return nodes.Forever(node.lexpos, node.body)
+
+class CountedLoops(OptimizationPass):
+    name        = "counted-loops"
+    level       = 1
+    description = "Build `for` loops that count from one number to another as repeat blocks, instead of comparing the counter every iteration"
+
+    def __init__(self, manager, projectbuilder=None):
+        super().__init__(manager, projectbuilder)
+
+        # Scopes: [{<variable name>: <declared type, or None for parameters>, ...}, ...]
+        # Only variables declared in scripts and functions, since the target's
+        # own variables can change whenever another script runs
+        self.scopes = []
+        self.functions = set()
+
+    def run(self, statements):
+        self.functions = {
+            statement.name for statement in statements if isinstance(statement, nodes.FunctionDeclaration)
+        }
+
+        return self.visit(statements)
+
+    # Scopes
+
+    def visit_body(self, statements):
+        self.scopes.append({})
+        statements = super().visit_body(statements)
+        self.scopes.pop()
+
+        return statements
+
+    def visit_DeclareVariable(self, node):
+        if self.scopes:
+            self.scopes[-1][node.variable.name] = node.variable_type
+        return node
+
+    def visit_FunctionDeclaration(self, node):
+        self.scopes.append(dict.fromkeys(node.parameters))
+        node = self.generic_visit(node)
+        self.scopes.pop()
+
+        return node
+
+    def visit_Hat(self, node):
+        # The arguments of `on_broadcast` are a broadcast name and a variable name
+        is_broadcast = isinstance(node.event, nodes.GetAttribute) and node.event.attribute == "on_broadcast"
+        self.scopes.append(dict.fromkeys(argument.name for argument in node.arguments[1:]) if is_broadcast else {})
+        node = self.generic_visit(node)
+        self.scopes.pop()
+
+        return node
+
+    # Whether `name` is a number variable declared by the script or function being visited
+    def is_local_number(self, name):
+        if self.projectbuilder and self.projectbuilder.symbols["global"].resolve(name) is not None:
+            return False
+
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name] == Types.NUMBER
+        return False
+
+    # Loops
+
+    def visit_For(self, node):
+        # The loop's own scope holds the counter it declares
+        self.scopes.append({})
+        node = self.lower_for(self.generic_visit(node))
+        self.scopes.pop()
+
+        return node
+
+    def lower_for(self, node):
+        initializer = node.initializer
+        if not (
+            isinstance(initializer, (nodes.DeclareVariable, nodes.SetVariable)) and
+            isinstance(initializer.variable, nodes.Variable) and
+            is_integer(initializer.value)
+        ):
+            return node
+        if isinstance(initializer, nodes.DeclareVariable) and initializer.variable_type != Types.NUMBER:
+            return node
+
+        counter = initializer.variable.name
+        start = initializer.value
+        step = self.get_step(node.post_iteration, counter)
+        bound = self.get_bound(node.expression, counter)
+        if step is None or bound is None:
+            return node
+
+        condition, end = bound
+        if (step > 0) != (condition in ("<", "<=")):
+            return node # Counts away from the end, so it never stops or never starts
+
+        # The counter and the end must only change between iterations, so they must
+        # be local variables that neither the body nor the functions it calls assign to
+        if not self.is_local_number(counter) or self.calls_functions(node.body):
+            return node
+        if assigns_variable(node.body, counter):
+            return node
+        if isinstance(end, nodes.Variable) and assigns_variable(node.body, end.name):
+            return node
+
+        times = self.get_times(start, step, condition, end)
+        # Scoped counters nothing reads don't need to be counted at all
+        keep_counter = isinstance(initializer, nodes.SetVariable) or reads_variable(node.body, counter)
+
+        if isinstance(times, int) and times <= 0:
+            self.report(node, "Removed a `for` loop that never runs")
+            return initializer if isinstance(initializer, nodes.SetVariable) else None
+
+        self.report(node,
+            f"Turned a `for` loop into a repeat block{"" if keep_counter else " without a counter"}"
+            f"{f" that runs {describe(times)} times" if isinstance(times, int) else ""}")
+        if keep_counter:
+            return nodes.Repeat(node.lexpos, initializer, times, [*node.body, node.post_iteration])
+        return nodes.Repeat(node.lexpos, None, times, node.body)
+
+    # How much `counter` changes every iteration, if it's `counter += <integer>` or `counter -= <integer>`
+    def get_step(self, post_iteration, counter):
+        if not (
+            isinstance(post_iteration, nodes.InPlaceAssignment) and
+            post_iteration.operation in ("+=", "-=") and
+            isinstance(post_iteration.variable, nodes.Variable) and
+            post_iteration.variable.name == counter and
+            is_integer(post_iteration.operand) and post_iteration.operand != 0
+        ):
+            return None
+
+        step = int(post_iteration.operand)
+        return step if post_iteration.operation == "+=" else -step
+
+    # The comparison and what `counter` is compared to, if the condition is one
+    # like `counter < end`. The end must be a number or a local number variable
+    def get_bound(self, expression, counter):
+        if not isinstance(expression, nodes.ComparisonOperation) or expression.condition not in MIRRORED_CONDITIONS:
+            return None
+
+        x, y = expression.operands
+        condition = expression.condition
+        if isinstance(y, nodes.Variable) and y.name == counter:
+            x, y = y, x
+            condition = MIRRORED_CONDITIONS[condition]
+        if not (isinstance(x, nodes.Variable) and x.name == counter):
+            return None
+
+        if is_number(y) or (isinstance(y, nodes.Variable) and y.name != counter and self.is_local_number(y.name)):
+            return condition, y
+        return None
+
+    # Scratch rounds the number of times to repeat, so the count must already be whole
+    def get_times(self, start, step, condition, end):
+        start = int(start)
+
+        if is_number(end):
+            distance = (end - start) / step
+            return max(math.ceil(distance) if condition in ("<", ">") else math.floor(distance) + 1, 0)
+
+        # The end stays on the left, since operations on two literals are folded and
+        # the builder only combines a literal with a block when the block comes first
+        lexpos = end.lexpos
+        distance = end if start == 0 else nodes.NumericalOperation(lexpos, "-", [end, start])
+        if step != 1:
+            distance = nodes.NumericalOperation(lexpos, "/", [distance, step])
+
+        if condition in ("<", ">"):
+            return self.math_call(lexpos, "ceil", distance)
+        return nodes.NumericalOperation(lexpos, "+", [self.math_call(lexpos, "floor", distance), 1])
+
+    def math_call(self, lexpos, function, argument):
+        return nodes.FunctionCall(lexpos, nodes.GetAttribute(lexpos, nodes.Variable(lexpos, "math"), function), [argument])
+
+    # Custom functions could change the script's variables, by recursing into it
+    def calls_functions(self, statements):
+        return any(
+            isinstance(node, nodes.FunctionCall) and
+            isinstance(node.function, nodes.Variable) and node.function.name in self.functions
+            for node in walk(statements)
+        )
@@ -0,0 +1,109 @@
+from .constants import FoldConstants
+from .logic import SimplifyLogic
+from .loops import ForeverLoops, CountedLoops
+from .deadcode import EliminateDeadCode
+from .warp import AutoWarp
+from .transformer import redeclares_variable
+from ..logger import debug, info
+from .. import filestate
+
+OPTIMIZATION_LEVELS = (0, 1, 2)
+DEFAULT_LEVEL = 1
+
+# Every pass, in the order they run. Earlier passes expose work to later ones,
+# like conditions that simplify to `true` before `while (true)` is recognized
+PASSES = (
+    FoldConstants,
+    SimplifyLogic,
+    ForeverLoops,
+    EliminateDeadCode,
+    CountedLoops,
+    AutoWarp
+)
+PASS_NAMES = tuple(optimization_pass.name for optimization_pass in PASSES)
+
+# Runs the optimization passes over the statements of each target between
+# parsing and building. Level 0 runs no passes, level 1 runs the ones that
+# are always worth it and level 2 runs every pass. Passes can also be enabled
+# or disabled by name regardless of the level
+class PassManager:
+    def __init__(self, level=DEFAULT_LEVEL, enabled=(), disabled=()):
+        self.level = level
+        self.passes = [
+            optimization_pass for optimization_pass in PASSES
+            if (optimization_pass.level <= level or optimization_pass.name in enabled)
+            and optimization_pass.name not in disabled
+        ]
+
+        # Changes: [
+        #     {
+        #         "pass":    <pass name>,
+        #         "file":    <relative filepath>,
+        #         "line":    <line number>,
+        #         "message": <what the pass changed>
+        #     },
+        #     ...
+        # ]
+        self.changes = []
+        # Notes: like changes, for what the passes didn't change and why
+        self.notes = []
+        # Analyses: {<pass name>: <what the pass knows about the whole project>, ...}
+        self.analyses = {}
+
+    # Identifies the passes that run, so scripts cached by builds with other passes aren't reused
+    @property
+    def fingerprint(self):
+        return ",".join(optimization_pass.name for optimization_pass in self.passes)
+
+    # Analyze the whole project before its targets are optimized. Returns a description
+    # of the analyses, since the optimized scripts of every target depend on them
+    def prepare(self, projectbuilder):
+        self.analyses = {
+            optimization_pass.name: optimization_pass.analyze_project(projectbuilder)
+            for optimization_pass in self.passes
+        }
+
+        return repr(sorted(self.analyses.items()))
+
+    # Returns the optimized statements of a target in `projectbuilder`. The given ones are left untouched
+    def optimize(self, statements, projectbuilder=None):
+        # The passes could remove a redeclaration or the uses that make it an error,
+        # so the statements are left for the builder to report it like it does at -O0
+        if redeclares_variable(statements):
+            return statements
+
+        for optimization_pass in self.passes:
+            statements = optimization_pass(self, projectbuilder).run(statements)
+
+        return statements
+
+    def record(self, optimization_pass, lexpos, message, changed=True):
+        file_path = filestate.current_file()
+        line_number = None
+        if file_path is not None and lexpos is not None:
+            line_number = filestate.read_file().count("\n", 0, lexpos) + 1
+
+        (self.changes if changed else self.notes).append({
+            "pass":    optimization_pass.name,
+            "file":    file_path,
+            "line":    line_number,
+            "message": message
+        })
+
+        log = info if optimization_pass.verbose else debug
+        log(f"    {optimization_pass.name}: {message} ({file_path}, line {line_number})")
+
+    # Log how many changes each pass made
+    def report(self):
+        counts = {}
+        for change in self.changes:
+            counts[change["pass"]] = counts.get(change["pass"], 0) + 1
+
+        if not counts:
+            return
+
+        summary = ", ".join(
+            f"{name} ({counts[name]} change{"" if counts[name] == 1 else "s"})"
+            for name in PASS_NAMES if name in counts
+        )
+        info(f"Optimized with -O{self.level}: {summary}")
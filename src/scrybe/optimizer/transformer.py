@@ -0,0 +1,177 @@
+from dataclasses import fields, replace
+from .. import nodes
+from .. import translations
+
+# Fields of statement nodes that hold lists of statements rather than expressions
+BODY_FIELDS = ("body", "body_1", "body_2")
+
+_field_names = {} # {<node class>: (<field name>, ...)}
+
+def get_field_names(node):
+    node_class = type(node)
+    if node_class not in _field_names:
+        _field_names[node_class] = tuple(field.name for field in fields(node_class) if field.name != "lexpos")
+
+    return _field_names[node_class]
+
+# Every node in `tree` (a node, a list of them or a literal), parents before children
+def walk(tree):
+    if isinstance(tree, list):
+        for item in tree:
+            yield from walk(item)
+
+    elif isinstance(tree, nodes.Node):
+        yield tree
+        for field_name in get_field_names(tree):
+            yield from walk(getattr(tree, field_name))
+
+# Whether evaluating `expression` could do more than report a value, i.e. it
+# calls something that isn't a builtin reporter, like a custom function
+def has_side_effects(expression):
+    return any(
+        isinstance(node, nodes.FunctionCall) and not translations.resolve_function_reporter(node.function)
+        for node in walk(expression)
+    )
+
+# Whether a variable in the statements of a target is declared while one with the
+# same name is in scope, which the builder reports as an error. Scopes are the
+# builder's: the target's top-level variables are declared before anything else,
+# and functions, `on_broadcast` hats, `for` loops and every body have their own
+def redeclares_variable(statements):
+    top_level = set()
+    for statement in statements:
+        if isinstance(statement, (nodes.DeclareVariable, nodes.DeclareConstant)):
+            if statement.variable.name in top_level:
+                return True
+            top_level.add(statement.variable.name)
+
+    return any(
+        _redeclares_variable(statement, top_level) for statement in statements
+        if not isinstance(statement, (nodes.DeclareVariable, nodes.DeclareConstant))
+    )
+
+# `names` are the names in scope, and declarations add theirs to it
+def _redeclares_variable(tree, names):
+    if isinstance(tree, list):
+        return any(_redeclares_variable(item, names) for item in tree)
+    if not isinstance(tree, nodes.Node):
+        return False
+
+    if isinstance(tree, (nodes.DeclareVariable, nodes.DeclareConstant)):
+        if tree.variable.name in names:
+            return True
+        names.add(tree.variable.name)
+        return False
+
+    if isinstance(tree, nodes.FunctionDeclaration):
+        return _redeclares_variable(tree.body, {*names, *tree.parameters})
+
+    if isinstance(tree, nodes.Hat):
+        # The arguments of `on_broadcast` are a broadcast name and a variable name
+        if isinstance(tree.event, nodes.GetAttribute) and tree.event.attribute == "on_broadcast":
+            return _redeclares_variable(tree.body, {*names, *(argument.name for argument in tree.arguments[1:])})
+        return _redeclares_variable(tree.body, set(names))
+
+    if isinstance(tree, (nodes.For, nodes.Repeat)):
+        # The loop's variable is in the same scope as its body
+        loop_names = set(names)
+        return any(
+            _redeclares_variable(getattr(tree, field_name), loop_names)
+            for field_name in ("initializer", "body", "post_iteration") if hasattr(tree, field_name)
+        )
+
+    return any(
+        _redeclares_variable(getattr(tree, field_name), set(names))
+        for field_name in BODY_FIELDS if hasattr(tree, field_name)
+    )
+
+# Rewrites an AST the way `ast.NodeTransformer` does: `visit_<node class>`
+# methods return the node to put in place of the one visited. Nodes are never
+# modified in place, since the build cache keeps the parsed ASTs between builds,
+# so a node is copied whenever one of its children changes.
+# A statement can also be replaced by a list of statements, or by None to remove it
+class Transformer:
+    def visit(self, tree):
+        if isinstance(tree, list):
+            new_items = [self.visit(item) for item in tree]
+            if all(new_item is item for new_item, item in zip(new_items, tree)):
+                return tree
+            return new_items
+
+        if not isinstance(tree, nodes.Node):
+            return tree
+
+        visitor = getattr(self, f"visit_{type(tree).__name__}", self.generic_visit)
+        return visitor(tree)
+
+    def generic_visit(self, node):
+        changes = {}
+        for field_name in get_field_names(node):
+            value = getattr(node, field_name)
+            new_value = self.visit_body(value) if field_name in BODY_FIELDS else self.visit(value)
+            if new_value is not value:
+                changes[field_name] = new_value
+
+        return replace(node, **changes) if changes else node
+
+    def visit_body(self, statements):
+        new_statements = []
+        changed = False
+
+        for statement in statements:
+            result = self.visit(statement)
+            if result is statement:
+                new_statements.append(statement)
+                continue
+
+            changed = True
+            if isinstance(result, list):
+                new_statements.extend(result)
+            elif result is not None:
+                new_statements.append(result)
+
+        return new_statements if changed else statements
+
+# Removes the statements `predicate` is true for, in every body of `statements`
+class StatementFilter(Transformer):
+    def __init__(self, predicate):
+        self.predicate = predicate
+
+    def visit_body(self, statements):
+        statements = super().visit_body(statements)
+        kept = [statement for statement in statements if not self.predicate(statement)]
+
+        return statements if len(kept) == len(statements) else kept
+
+# An optimization pass over the statements of one target. Subclasses set the
+# pass's name (used by `-enable` and `-disable`), the lowest optimization level
+# it runs at and a description, and report every change they make. Passes
+# whose every change is worth reading, even without `-log debug`, are verbose.
+# `projectbuilder` is the project being built, if any, for passes that need to
+# know about the rest of the project, like its globals
+class OptimizationPass(Transformer):
+    name        = None
+    level       = 1
+    description = None
+    verbose     = False
+
+    def __init__(self, manager, projectbuilder=None):
+        self.manager = manager
+        self.projectbuilder = projectbuilder
+
+    # Facts about the whole project the pass needs, gathered once before any target
+    # is optimized and kept in `manager.analyses`. Cached scripts are only reused
+    # while these stay the same, so they must have a stable `repr`
+    @classmethod
+    def analyze_project(cls, projectbuilder):
+        return None
+
+    def run(self, statements):
+        return self.visit_body(statements)
+
+    def report(self, node, message):
+        self.manager.record(self, node.lexpos, message)
+
+    # Explain why something wasn't changed
+    def note(self, node, message):
+        self.manager.record(self, node.lexpos, message, changed=False)
@@ -0,0 +1,113 @@
+from .transformer import OptimizationPass, walk
+from .. import nodes
+from dataclasses import replace
+
+# Builtin functions whose blocks wait, so the script they're in must yield
+YIELDING_FUNCTIONS = {
+    "scratch.ask",
+    "scratch.broadcast_and_wait",
+    "time.sleep",
+    "time.wait_until",
+    "glide_to",
+    "glide_to_pos",
+    "say_for_seconds",
+    "think_for_seconds",
+    "play_until_done"
+}
+
+# How a function is written in the source, like `time.sleep`, or None if it's an expression
+def get_dotted_name(function):
+    if isinstance(function, str):
+        return function
+    if isinstance(function, nodes.Variable):
+        return function.name
+    if isinstance(function, nodes.GetAttribute):
+        owner = get_dotted_name(function.object)
+        return owner and f"{owner}.{function.attribute}"
+
+    return None
+
+def assigned_names(statements):
+    return {
+        node.variable.name for node in walk(statements)
+        if isinstance(node, (nodes.DeclareVariable, nodes.SetVariable, nodes.InPlaceAssignment))
+        and isinstance(node.variable, nodes.Variable)
+    }
+
+class AutoWarp(OptimizationPass):
+    name        = "auto-warp"
+    level       = 2
+    description = "Run functions that never wait without screen refresh, as if they were declared with `warp`"
+    verbose     = True
+
+    def run(self, statements):
+        functions = {
+            statement.name: statement
+            for statement in statements if isinstance(statement, nodes.FunctionDeclaration)
+        }
+        # Calls: {<function name>: [<name of a function it calls>, ...]}
+        calls = {}
+        # Reasons: {<function name>: <why it can't run without screen refresh>}
+        reasons = {}
+
+        for name, function in functions.items():
+            calls[name] = []
+            for node in walk(function.body):
+                reason = self.get_reason(node, functions)
+                if reason and name not in reasons:
+                    reasons[name] = reason
+
+                if isinstance(node, nodes.FunctionCall):
+                    callee = get_dotted_name(node.function)
+                    if callee in functions: calls[name].append(callee)
+
+        # Warp functions don't yield for the functions they call, but the
+        # ones that aren't warp yield for every function that calls them
+        changed = True
+        while changed:
+            changed = False
+            for name, callees in calls.items():
+                if name in reasons:
+                    continue
+
+                for callee in callees:
+                    if callee in reasons and not functions[callee].warp:
+                        reasons[name] = f"it calls `{callee}`, which can't be warped"
+                        changed = True
+                        break
+
+        new_statements = []
+        for statement in statements:
+            if isinstance(statement, nodes.FunctionDeclaration) and not statement.warp:
+                if statement.name in reasons:
+                    self.note(statement, f"Didn't auto-warp function `{statement.name}`, since {reasons[statement.name]}")
+                else:
+                    self.report(statement, f"Auto-warped function `{statement.name}`")
+                    statement = replace(statement, warp=True)
+
+            new_statements.append(statement)
+
+        return new_statements
+
+    # Why `node` keeps the function it's in from running without screen refresh, if it does
+    def get_reason(self, node, functions):
+        if isinstance(node, nodes.FunctionCall):
+            function_name = get_dotted_name(node.function)
+            if function_name not in functions and function_name in YIELDING_FUNCTIONS:
+                return f"it waits with `{function_name}()`"
+
+        # Without screen refresh, a loop that never stops would freeze the project
+        if isinstance(node, nodes.Forever) or (isinstance(node, nodes.While) and node.expression is True):
+            return "it loops forever"
+
+        # Loops that wait for something outside of them to change, like a key press,
+        # would only be checked again when the project stops responding for a while
+        if isinstance(node, nodes.While):
+            condition_names = {
+                condition_node.name for condition_node in walk(node.expression)
+                if isinstance(condition_node, nodes.Variable)
+            }
+            if not condition_names & assigned_names(node.body):
+                return "it has a `while` loop waiting for something the loop doesn't change"
+
+        return None
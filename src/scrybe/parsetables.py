@@ -0,0 +1,68 @@
+# The LALR tables of both grammars are generated ahead of time and shipped
+# as `parsetab.py` in each parser package, so startup never has to build
+# them or write anything next to the source. After changing a grammar,
+# regenerate them with:
+#
+#     python -m scrybe.parsetables
+from ply import yacc
+from .logger import debug
+import importlib
+import os
+import sys
+
+def _tabmodule_name(module):
+    return f"{module.__package__}.parsetab"
+
+def _tables_up_to_date(module):
+    grammar = yacc.ParserReflect(vars(module), log=yacc.NullLogger())
+    grammar.get_all()
+
+    try:
+        tables = importlib.import_module(_tabmodule_name(module))
+    except ImportError:
+        return False
+
+    return getattr(tables, "_lr_signature", None) == grammar.signature()
+
+# Build the parser for the grammar defined in `module` from its shipped tables
+# Out of date tables still work, they just get rebuilt in memory on each start
+def load_parser(module):
+    if not _tables_up_to_date(module):
+        debug(f'  Parser tables of "{module.__name__}" are out of date, '
+               "regenerate them with `python -m scrybe.parsetables`")
+
+    return yacc.yacc(
+        module       = module,
+        tabmodule    = _tabmodule_name(module),
+        debug        = False,
+        write_tables = False,
+        errorlog     = yacc.NullLogger()
+    )
+
+def write_tables(module, output_directory=None):
+    output_directory = output_directory or os.path.dirname(module.__file__)
+    if _tables_up_to_date(module) and output_directory == os.path.dirname(module.__file__):
+        print(f"{module.__name__}: tables are up to date")
+        return
+
+    # Drop the stale tables so PLY doesn't reuse the imported module
+    sys.modules.pop(_tabmodule_name(module), None)
+
+    yacc.yacc(
+        module       = module,
+        tabmodule    = "parsetab",
+        debug        = False,
+        write_tables = True,
+        outputdir    = output_directory
+    )
+    print(f"{module.__name__}: wrote tables to {os.path.join(output_directory, 'parsetab.py')}")
+
+def main():
+    from .scriptparser import parser as script_parser
+    from .setupparser import parser as setup_parser
+
+    write_tables(script_parser)
+    write_tables(setup_parser)
+
+if __name__ == "__main__":
+    main()
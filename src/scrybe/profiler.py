@@ -0,0 +1,117 @@
+from contextlib import contextmanager
+import tracemalloc
+import time
+import json
+import os
+
+# Phases: [
+#     {
+#         "name":     <phase name>,
+#         "start":    <perf counter at the start>,
+#         "duration": <seconds>,
+#         "memory":   <traced bytes at the start>,
+#         "peak":     <peak traced bytes during the phase>
+#     },
+#     ...
+# ]
+phases = []
+enabled = False
+
+_stack = [] # Phases that haven't finished yet
+_start_time = None
+_total_time = None
+_cprofile = None
+
+def start(use_cprofile=False):
+    global phases, enabled, _start_time, _cprofile
+
+    phases = []
+    enabled = True
+    tracemalloc.start()
+    _start_time = time.perf_counter()
+
+    _cprofile = None
+    if use_cprofile:
+        import cProfile
+        _cprofile = cProfile.Profile()
+        _cprofile.enable()
+
+def stop():
+    global enabled, _total_time
+
+    if _cprofile:
+        _cprofile.disable()
+
+    _total_time = time.perf_counter() - _start_time
+    enabled = False
+    _stack.clear()
+    tracemalloc.stop()
+
+@contextmanager
+def phase(name):
+    if not enabled:
+        yield
+        return
+
+    # Peaks are tracked by one global counter, so remember the enclosing phase's peak
+    # before resetting it and hand this phase's peak back to it afterwards
+    if _stack:
+        _stack[-1]["peak"] = max(_stack[-1]["peak"], tracemalloc.get_traced_memory()[1])
+    tracemalloc.reset_peak()
+
+    entry = {
+        "name":   name,
+        "start":  time.perf_counter(),
+        "memory": tracemalloc.get_traced_memory()[0],
+        "peak":   0
+    }
+    _stack.append(entry)
+
+    try:
+        yield
+    finally:
+        entry["duration"] = time.perf_counter() - entry["start"]
+        entry["peak"] = max(entry["peak"], tracemalloc.get_traced_memory()[1])
+        phases.append(entry)
+
+        if _stack and _stack[-1] is entry:
+            _stack.pop()
+        if _stack:
+            _stack[-1]["peak"] = max(_stack[-1]["peak"], entry["peak"])
+
+def _format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024: return f"{size:.0f} {unit}"
+        size /= 1024
+
+    return f"{size:.1f} GB"
+
+# Print the phases from slowest to fastest, with the memory each allocated at its peak
+def report():
+    name_width = max([len(entry["name"]) for entry in phases] + [5])
+
+    print(f"{'Phase':<{name_width}} {'Seconds':>9} {'Share':>7} {'Peak memory':>12}")
+    for entry in sorted(phases, key=lambda entry: entry["duration"], reverse=True):
+        share = entry["duration"] / _total_time if _total_time else 0
+        peak = _format_bytes(entry["peak"] - entry["memory"])
+        print(f"{entry['name']:<{name_width}} {entry['duration']:>9.3f} {share:>7.1%} {peak:>12}")
+    print(f"{'Total':<{name_width}} {_total_time:>9.3f}")
+
+# Write the cProfile statistics (.prof) or a Chrome trace (.json, for chrome://tracing or Perfetto)
+def write_output(file_path):
+    if file_path.endswith(".prof"):
+        _cprofile.dump_stats(file_path)
+        return
+
+    events = [{
+        "name": entry["name"],
+        "ph":   "X",
+        "ts":   (entry["start"] - _start_time) * 1e6,
+        "dur":  entry["duration"] * 1e6,
+        "pid":  os.getpid(),
+        "tid":  0,
+        "args": {"peak_memory": entry["peak"] - entry["memory"]}
+    } for entry in phases]
+
+    with open(file_path, "w") as handle:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, handle)
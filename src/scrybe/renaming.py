@@ -0,0 +1,45 @@
+# Rename the block, variable/list and broadcast IDs of a serialized target,
+# including every place a block refers to one of them. Each rename function
+# takes an ID and returns its new ID (or the same ID to keep it)
+def rename_ids(target, rename_block, rename_data, rename_broadcast=lambda ID: ID):
+    def rename_input(value):
+        # The first item is the shadow type, not an ID
+        renamed = [value[0]]
+        for item in value[1:]:
+            # Variables and lists: [<type>, <name>, <ID>, ...]
+            if isinstance(item, list) and len(item) >= 3 and item[0] in (12, 13):
+                item = [item[0], item[1], rename_data(item[2]), *item[3:]]
+            # Broadcasts: [<type>, <name>, <ID>]
+            elif isinstance(item, list) and len(item) == 3 and item[0] == 11:
+                item = [item[0], item[1], rename_broadcast(item[2])]
+            elif isinstance(item, (str, int)):
+                item = rename_block(item)
+            renamed.append(item)
+
+        return renamed
+
+    def rename_field(key, value):
+        if key in ("VARIABLE", "LIST"):
+            return [value[0], rename_data(value[1])]
+        if key == "BROADCAST_OPTION":
+            return [value[0], rename_broadcast(value[1])]
+        return value
+
+    blocks = {}
+    for block_ID, block in target["blocks"].items():
+        block = dict(block)
+        block["next"] = block["next"] and rename_block(block["next"])
+        block["parent"] = block["parent"] and rename_block(block["parent"])
+        block["inputs"] = {key: rename_input(value) for key, value in block["inputs"].items()}
+        block["fields"] = {key: rename_field(key, value) for key, value in block["fields"].items()}
+        blocks[rename_block(block_ID)] = block
+
+    renamed = {
+        "variables": {rename_data(ID): value for ID, value in target["variables"].items()},
+        "lists":     {rename_data(ID): value for ID, value in target["lists"].items()},
+        "blocks":    blocks
+    }
+    if "broadcasts" in target:
+        renamed["broadcasts"] = {rename_broadcast(ID): name for ID, name in target["broadcasts"].items()}
+
+    return renamed
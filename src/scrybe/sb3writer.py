@@ -0,0 +1,127 @@
+from .renaming import rename_ids
+import zipfile
+import shutil
+import json
+import io
+
+CHUNK_SIZE = 1024 * 1024
+
+# The earliest time a zip entry can have
+ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Formats that are compressed already, so deflating them again only costs time
+COMPRESSED_FORMATS = ("png", "jpg", "jpeg", "gif", "webp", "mp3")
+
+# The characters of Blockly's own IDs, except the ones JSON strings or XML would have to escape.
+# Scratch puts block IDs into the workspace's XML as they are
+ID_CHARACTERS = "!#$%()*+,-./:;=?@[]^_`{|}~ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+def _short_ID(number):
+    ID = ID_CHARACTERS[number % len(ID_CHARACTERS)]
+    number //= len(ID_CHARACTERS)
+    while number:
+        number -= 1
+        ID = ID_CHARACTERS[number % len(ID_CHARACTERS)] + ID
+        number //= len(ID_CHARACTERS)
+
+    return ID
+
+# Replaces every ID in the project with the shortest unused one. IDs are
+# numbered in the order the targets and their blocks are serialized, which
+# follows the source files, so they don't depend on how many IDs were
+# generated while building (or which targets came from the build cache)
+class IDCompactor:
+    def __init__(self):
+        # Variables, lists and broadcasts share one namespace in the stage,
+        # so a data ID is renamed the same way wherever it appears. The stage
+        # comes first, so its IDs are the ones every sprite refers to
+        self.data_IDs = {}
+        # Blocks and data draw from one counter, like Scratch's random IDs never
+        # collide. The editor's flyout gives each variable reporter the ID of its
+        # variable, so a block with the same ID would confuse it
+        self.ID_count = 0
+
+    def next_ID(self):
+        self.ID_count += 1
+        return _short_ID(self.ID_count - 1)
+
+    def rename_data(self, ID):
+        if ID not in self.data_IDs:
+            self.data_IDs[ID] = self.next_ID()
+
+        return self.data_IDs[ID]
+
+    def compact(self, target):
+        block_IDs = {}
+        for block_ID in target["blocks"]:
+            block_IDs[str(block_ID)] = self.next_ID()
+
+        rename_block = lambda ID: block_IDs.get(str(ID), ID)
+
+        return {**target, **rename_ids(target, rename_block, self.rename_data, self.rename_data)}
+
+# Same JSON as `Project._serialize`, but only one target is serialized and
+# encoded at a time. Encoding whole targets keeps the fast C encoder in use
+def _write_json(project, stream, compact=False):
+    encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=not compact).encode
+    compactor = IDCompactor()
+
+    stream.write('{"targets":[')
+    for index, target in enumerate(project._targets):
+        serialized = compactor.compact(target._serialize())
+
+        if index: stream.write(",")
+        stream.write(encode(serialized))
+    stream.write("],")
+
+    stream.write(encode({
+        "monitors":   [monitor._serialize() for monitor in project._monitors],
+        "extensions": [extension.name for extension in project._extensions],
+        "meta":       project.meta
+    })[1:])
+
+# Assets from the registry (see `builder.assetregistry`) are read from their files.
+# Checked by method, since the builder imports this module
+def _open_asset(asset):
+    if hasattr(asset, "open"):
+        return asset.open()
+    return io.BytesIO(asset.data)
+
+# Entries get the same timestamp, permissions and host system on every
+# machine, so the same project always gives a byte-identical archive
+def _entry_info(name, compression, compresslevel):
+    info = zipfile.ZipInfo(name, date_time=ENTRY_DATE_TIME)
+    info.create_system = 3 # Unix
+    info.external_attr = 0o644 << 16
+    info.compress_type = compression
+    if hasattr(info, "compress_level"): # Python 3.13+
+        info.compress_level = compresslevel
+    else:
+        info._compresslevel = compresslevel
+
+    return info
+
+# Write a ScratchGen project to an .sb3 file without holding the archive,
+# the project JSON or the asset data in memory all at once. Every ID is
+# renumbered, so the same source always gives the same file, whether or not
+# targets came from the build cache. Compact projects also have non-ASCII
+# characters that aren't escaped. Assets are written in the order of their
+# names, followed by project.json
+def write_project(project, filename, compresslevel=5, store_media=False, compact=False):
+    assets = {}
+    for target in project._targets:
+        for asset in target._assets["images"] + target._assets["sounds"]:
+            assets.setdefault(asset.md5ext, asset)
+
+    with zipfile.ZipFile(filename, "w") as archive:
+        for name, asset in sorted(assets.items()):
+            store = store_media and asset.format.lower() in COMPRESSED_FORMATS
+            info = _entry_info(name, zipfile.ZIP_STORED if store else zipfile.ZIP_DEFLATED, compresslevel)
+
+            with _open_asset(asset) as source, archive.open(info, "w") as destination:
+                shutil.copyfileobj(source, destination, CHUNK_SIZE)
+
+        info = _entry_info("project.json", zipfile.ZIP_DEFLATED, compresslevel)
+        with archive.open(info, "w") as destination:
+            with io.TextIOWrapper(destination, encoding="utf-8") as stream:
+                _write_json(project, stream, compact)
@@ -1 +1,2 @@
 from .parser import parse_file
+from .parallel import parse_files
@@ -0,0 +1,26 @@
+from .parser import parse_file
+from .. import filestate
+from ..context import CompilationContext, activate
+from ..files import ProjectFiles
+from ..logger import logger, initialize_worker
+
+def _parse_path(root, file_path):
+    with activate(CompilationContext(ProjectFiles(root))):
+        filestate.open_file(file_path)
+        try:
+            return parse_file()
+        finally:
+            filestate.close_file()
+
+# Parse script files of the project in `root` in a process pool, returning the ASTs
+# in the same order as `file_paths` so the output doesn't depend on which worker
+# finishes first
+def parse_files(root, file_paths, jobs):
+    from concurrent.futures import ProcessPoolExecutor # Lazy import, it's slow to load
+
+    with ProcessPoolExecutor(
+        max_workers = jobs,
+        initializer = initialize_worker,
+        initargs    = (logger.log_level, logger.color)
+    ) as executor:
+        return list(executor.map(_parse_path, [root] * len(file_paths), file_paths))
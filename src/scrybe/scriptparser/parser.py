@@ -1,9 +1,12 @@
-from ply import yacc
 from .lexer import lexer, tokens, reserved
 from .. import filestate
 from .. import utils
-from ..logger import debug, code_error, set_lexpos
+from ..parsetables import load_parser
+from ..logger import debug, code_error, set_lexpos, CompileError
+from ..context import get_context
 from ..types import Types
+from .. import nodes
+import sys
 
 precedence = (
     ("left", "OR"),
@@ -38,20 +41,19 @@ def p_program(prod):
     else:
         declarations, statements = [], []
 
-    prod[0] = {
-        "declarations": declarations,
-        "statements":   statements
-    }
+    prod[0] = nodes.Program(declarations, statements)
+
+# List productions are left-recursive and append in place, so long lists are
+# built in linear time without growing the parser stack
 
 def p_meta_declaration_list(prod):
-    """meta_declaration_list : meta_declaration meta_declaration_list
+    """meta_declaration_list : meta_declaration_list meta_declaration
                              | meta_declaration"""
     if len(prod) == 3:
-        prod[0] = [prod[1]] + prod[2]
-    elif len(prod) == 2:
-        prod[0] = [prod[1]]
+        prod[1].append(prod[2])
+        prod[0] = prod[1]
     else:
-        prod[0] = []
+        prod[0] = [prod[1]]
 
 def p_meta_declaration(prod):
     """meta_declaration : SPRITENAMEDEC STRING
@@ -72,20 +74,16 @@ def p_meta_declaration(prod):
     else:
         value = prod[2]
 
-    prod[0] = {
-        "lexpos":   prod.lexpos(1),
-        "type":     "meta declaration",
-        "property": prod[1],
-        "value":    value
-    }
+    prod[0] = nodes.MetaDeclaration(prod.lexpos(1), prod[1], value)
 
 def p_top_level_statement_list(prod):
     """top_level_statement_list : top_level_statement
-                                | top_level_statement top_level_statement_list"""
+                                | top_level_statement_list top_level_statement"""
     if len(prod) == 2:
         prod[0] = [prod[1]]
     else:
-        prod[0] = [prod[1]] + prod[2]
+        prod[1].append(prod[2])
+        prod[0] = prod[1]
 
 def p_top_level_statement(prod):
     """top_level_statement : declare_variable SEMICOLON
@@ -114,11 +112,12 @@ def p_statement(prod):
 
 def p_statement_list(prod):
     """statement_list : statement
-                      | statement statement_list"""
+                      | statement_list statement"""
     if len(prod) == 2:
         prod[0] = [prod[1]]
     else:
-        prod[0] = [prod[1]] + prod[2]
+        prod[1].append(prod[2])
+        prod[0] = prod[1]
 
 def p_declare_variable(prod):
     """declare_variable : variable type_declaration EQUALS expression
@@ -128,33 +127,20 @@ def p_declare_variable(prod):
                         | CONST variable type_declaration EQUALS list
                         | CONST variable type_declaration"""
     if prod[1] == "const":
-        prod[0] = {
-            "lexpos":        prod.lexpos(1),
-            "type":          "declare variable",
-            "variable":      prod[2],
-            "variable type": prod[3],
-            "value":         prod[5] if len(prod) > 4 else None,
-            "constant":      True
-        }
+        prod[0] = nodes.DeclareVariable(
+            prod.lexpos(1), prod[2], prod[3],
+            prod[5] if len(prod) > 4 else None, True
+        )
     else:
-        prod[0] = {
-            "lexpos":        prod[1]["lexpos"],
-            "type":          "declare variable",
-            "variable":      prod[1],
-            "variable type": prod[2],
-            "value":         prod[4] if len(prod) > 3 else None,
-            "constant":      False
-        }
+        prod[0] = nodes.DeclareVariable(
+            prod[1].lexpos, prod[1], prod[2],
+            prod[4] if len(prod) > 3 else None, False
+        )
 
 def p_set_variable(prod):
     """set_variable : variable EQUALS expression
                     | variable EQUALS list"""
-    prod[0] = {
-        "lexpos":        prod[1]["lexpos"],
-        "type":          "set variable",
-        "variable":      prod[1],
-        "value":         prod[3]
-    }
+    prod[0] = nodes.SetVariable(prod[1].lexpos, prod[1], prod[3])
 
 def p_in_place_assignment(prod):
     """in_place_assignment : variable PLUSASSIGN expression
@@ -164,22 +150,11 @@ def p_in_place_assignment(prod):
                            | variable MODULOASSIGN expression
                            | variable EXPONENTASSIGN expression
                            | variable CONCATASSIGN expression"""
-    prod[0] = {
-        "lexpos":    prod[1]["lexpos"],
-        "type":      "in-place assignment",
-        "operation": prod[2],
-        "variable":  prod[1],
-        "operand":   prod[3]
-    }
+    prod[0] = nodes.InPlaceAssignment(prod[1].lexpos, prod[2], prod[1], prod[3])
 
 def p_function_call(prod):
     """function_call : variable function_arguments"""
-    prod[0] = {
-        "lexpos":    prod[1]["lexpos"],
-        "type":      "function call",
-        "function":  prod[1],
-        "arguments": prod[2]
-    }
+    prod[0] = nodes.FunctionCall(prod[1].lexpos, prod[1], prod[2])
 
 # Data and accessors
 
@@ -203,11 +178,12 @@ def p_list(prod):
 
 def p_variable_list(prod):
     """variable_list : VARIABLE
-                     | VARIABLE COMMA variable_list"""
+                     | variable_list COMMA VARIABLE"""
     if len(prod) == 2:
         prod[0] = [prod[1]]
     else:
-        prod[0] = [prod[1]] + prod[3]
+        prod[1].append(prod[3])
+        prod[0] = prod[1]
 
 def p_variable(prod):
     """variable : SCRATCH DOT VARIABLE
@@ -215,40 +191,26 @@ def p_variable(prod):
                 | variable DOT VARIABLE
                 | VARIABLE
                 | index"""
-    lexpos = prod[1]["lexpos"] if isinstance(prod[1], dict) else prod.lexpos(1)
+    lexpos = prod[1].lexpos if isinstance(prod[1], nodes.Node) else prod.lexpos(1)
 
     if len(prod) == 2:
-        if isinstance(prod[1], dict): prod[0] = prod[1]
-        else:
-            prod[0] = {
-            "lexpos":   lexpos,
-            "type":    "variable",
-            "variable": prod[1]
-        }
+        if isinstance(prod[1], nodes.Node): prod[0] = prod[1]
+        else: prod[0] = nodes.Variable(lexpos, prod[1])
     else:
-        prod[0] = {
-            "lexpos":    lexpos,
-            "type":      "get attribute",
-            "object":    prod[1],
-            "attribute": prod[3]
-        }
+        prod[0] = nodes.GetAttribute(lexpos, prod[1], prod[3])
 
 def p_index(prod):
     """index : variable LBRACKET expression RBRACKET"""
-    prod[0] = {
-        "lexpos": prod[1]["lexpos"],
-        "type":   "index",
-        "target": prod[1],
-        "index":  prod[3]
-    }
+    prod[0] = nodes.Index(prod[1].lexpos, prod[1], prod[3])
 
 def p_expression_list(prod):
     """expression_list : expression
-                       | expression COMMA expression_list"""
+                       | expression_list COMMA expression"""
     if len(prod) == 2:
         prod[0] = [prod[1]]
     else:
-        prod[0] = [prod[1]] + prod[3]
+        prod[1].append(prod[3])
+        prod[0] = prod[1]
 
 def p_expression(prod):
     """expression : number
@@ -292,11 +254,8 @@ def p_type_declaration(prod):
 
 def p_concatenation(prod):
     """concatenation : expression CONCAT expression"""
-    prod[0] = {
-        "lexpos":    prod[1]["lexpos"] if isinstance(prod[1], dict) else prod.lexpos(2),
-        "type":      "concatenation",
-        "operands":  [prod[1], prod[3]]
-    }
+    lexpos = prod[1].lexpos if isinstance(prod[1], nodes.Node) else prod.lexpos(2)
+    prod[0] = nodes.Concatenation(lexpos, [prod[1], prod[3]])
 
 def p_numerical_operation(prod):
     """numerical_operation : expression PLUS expression
@@ -306,12 +265,11 @@ def p_numerical_operation(prod):
                            | expression MODULO expression
                            | expression EXPONENT expression
                            | MINUS expression %prec UMINUS"""
-    prod[0] = {
-        "lexpos":    prod[1]["lexpos"] if isinstance(prod[1], dict) else prod.lexpos(2),
-        "type":      "numerical operation",
-        "operation": prod[2] if len(prod) == 4 else "negation",
-        "operands":  [prod[1], prod[3]] if len(prod) == 4 else [prod[2]]
-    }
+    lexpos = prod[1].lexpos if isinstance(prod[1], nodes.Node) else prod.lexpos(2)
+    if len(prod) == 4:
+        prod[0] = nodes.NumericalOperation(lexpos, prod[2], [prod[1], prod[3]])
+    else:
+        prod[0] = nodes.NumericalOperation(lexpos, "negation", [prod[2]])
 
 def p_comparison_operation(prod):
     """comparison_operation : expression LESSTHAN expression
@@ -320,27 +278,19 @@ def p_comparison_operation(prod):
                             | expression GREATERTHANEQUAL expression
                             | expression EQUALTO expression
                             | expression NOTEQUALTO expression"""
-    prod[0] = {
-        "lexpos":    prod[1]["lexpos"],
-        "type":      "comparison operation",
-        "condition": prod[2],
-        "operands":  [prod[1], prod[3]]
-    }
+    lexpos = prod[1].lexpos if isinstance(prod[1], nodes.Node) else prod.lexpos(2)
+    prod[0] = nodes.ComparisonOperation(lexpos, prod[2], [prod[1], prod[3]])
 
 def p_logical_operation(prod):
     """logical_operation : NOT expression
                          | expression AND expression
                          | expression OR expression
                          | expression IN expression"""
-    prod[0] = {"type": "logical operation"}
     if len(prod) == 3:
-        prod[0]["lexpos"] = prod.lexpos(1)
-        prod[0]["condition"] = prod[1]
-        prod[0]["comparands"] = [prod[2]]
+        prod[0] = nodes.LogicalOperation(prod.lexpos(1), prod[1], [prod[2]])
     else:
-        prod[0]["lexpos"] = prod[1]["lexpos"] if isinstance(prod[1], dict) else prod.lexpos(2)
-        prod[0]["condition"] = prod[2]
-        prod[0]["comparands"] = [prod[1], prod[3]]
+        lexpos = prod[1].lexpos if isinstance(prod[1], nodes.Node) else prod.lexpos(2)
+        prod[0] = nodes.LogicalOperation(lexpos, prod[2], [prod[1], prod[3]])
 
 # Control flow
 
@@ -357,42 +307,20 @@ def p_container_body(prod):
 
 def p_if(prod):
     """if : IF LPAREN expression RPAREN container_body"""
-    prod[0] = {
-        "lexpos":     prod.lexpos(1),
-        "type":       "if",
-        "expression": prod[3],
-        "body":       prod[5]
-    }
+    prod[0] = nodes.If(prod.lexpos(1), prod[3], prod[5])
 
 def p_if_else(prod):
     """if_else : if ELSE container_body"""
-    prod[0] = {
-        "lexpos":     prod[1]["lexpos"],
-        "type":       "if-else",
-        "expression": prod[1]["expression"],
-        "body 1":     prod[1]["body"],
-        "body 2":     prod[3]
-    }
+    prod[0] = nodes.IfElse(prod[1].lexpos, prod[1].expression, prod[1].body, prod[3])
 
 def p_for(prod):
-    """for : FOR LPAREN set_variable SEMICOLON expression SEMICOLON fundamental_statement RPAREN container_body"""
-    prod[0] = {
-        "lexpos":         prod.lexpos(1),
-        "type":           "for",
-        "initializer":    prod[3],
-        "expression":     prod[5],
-        "post-iteration": prod[7],
-        "body":           prod[9]
-    }
+    """for : FOR LPAREN declare_variable SEMICOLON expression SEMICOLON fundamental_statement RPAREN container_body
+           | FOR LPAREN set_variable SEMICOLON expression SEMICOLON fundamental_statement RPAREN container_body"""
+    prod[0] = nodes.For(prod.lexpos(1), prod[3], prod[5], prod[7], prod[9])
 
 def p_while(prod):
     """while : WHILE LPAREN expression RPAREN container_body"""
-    prod[0] = {
-        "lexpos":     prod.lexpos(1),
-        "type":       "while",
-        "expression": prod[3],
-        "body":       prod[5]
-    }
+    prod[0] = nodes.While(prod.lexpos(1), prod[3], prod[5])
 
 def p_return(prod):
     """return : RETURN SEMICOLON
@@ -402,11 +330,7 @@ def p_return(prod):
     else:
         expression = prod[2]
 
-    prod[0] = {
-        "lexpos":     prod.lexpos(1),
-        "type":       "return",
-        "expression": expression
-    }
+    prod[0] = nodes.Return(prod.lexpos(1), expression)
 
 # Functions
 
@@ -432,39 +356,27 @@ def p_function_dec(prod):
                     | WARP FUNCTION VARIABLE function_parameters container_body
                     | WARP type FUNCTION VARIABLE function_parameters container_body"""
     warp = prod[1] == "warp"
-    is_long = len(prod) == (7 if warp else 6)
-
-    return_type = prod[2] if warp and is_long else prod[1] if is_long else None
-    name        = prod[4] if warp and is_long else prod[3] if is_long or warp else prod[2]
-    parameters  = prod[5] if warp and is_long else prod[4] if is_long or warp else prod[3]
-    body        = prod[6] if warp and is_long else prod[5] if is_long else prod[4]
-
-    prod[0] = {
-        "lexpos":      prod.lexpos(1),
-        "type":        "function declaration",
-        "return type": return_type,
-        "name":        name,
-        "parameters":  parameters,
-        "warp":        warp,
-        "body":        body
-    }
+    # Skip the optional `warp` keyword, then the optional return type
+    index = 2 if warp else 1
+    return_type = None
+    if prod.slice[index].type == "type":
+        return_type = prod[index]
+        index += 1
+
+    name, parameters, body = prod[index + 1], prod[index + 2], prod[index + 3]
+    prod[0] = nodes.FunctionDeclaration(prod.lexpos(1), return_type, name, parameters, warp, body)
 
 def p_hat(prod):
     """hat : variable function_arguments container_body"""
-    prod[0] = {
-        "lexpos":     prod[1]["lexpos"],
-        "type":       "hat",
-        "event":      prod[1],
-        "arguments":  prod[2],
-        "body":       prod[3]
-    }
+    prod[0] = nodes.Hat(prod[1].lexpos, prod[1], prod[2], prod[3])
 
 # Parser setup
 
 def p_error(token):
-    stack = [sym.type for sym in parser.symstack[1:]]
-    state = parser.state
-    expected = parser.action[state].keys()
+    active_parser, _ = get_context().get_parser(parser, lexer)
+    stack = [sym.type for sym in active_parser.symstack[1:]]
+    state = active_parser.state
+    expected = active_parser.action[state].keys()
     current_token = token.type if token else "EOF"
     set_lexpos(token.lexpos if token else None)
 
@@ -517,17 +429,20 @@ def p_error(token):
     if current_token == "SEMICOLON":
         code_error("Unexpected semicolon")
 
-    print("Uncaught script parsing error, please report in the repository")
-    print("-" * 50)
-    print(f"Syntax error at line {token.lineno if token else 'EOF'}")
-    print(f"Token: {current_token}")
-    print(f"Expected: {', '.join(expected)}")
-    print(f"Symbol stack (state {state}): {stack}")
-
-    exit()
+    raise CompileError("\n".join((
+        "Uncaught script parsing error, please report in the repository",
+        "-" * 50,
+        f"Syntax error at line {token.lineno if token else 'EOF'}",
+        f"Token: {current_token}",
+        f"Expected: {', '.join(expected)}",
+        f"Symbol stack (state {state}): {stack}"
+    )))
 
 debug("Initializing script parser")
-parser = yacc.yacc(debug=True)
+parser = load_parser(sys.modules[__name__])
 
+# Parses the current file with the current compilation's own parser and lexer
 def parse_file():
-    return parser.parse(filestate.read_file(), lexer=lexer)
+    active_parser, active_lexer = get_context().get_parser(parser, lexer)
+    active_lexer.lineno = 1 # Otherwise line numbers carry on from the previously parsed file
+    return active_parser.parse(filestate.read_file(), lexer=active_lexer)
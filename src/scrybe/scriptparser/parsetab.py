@@ -0,0 +1,152 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftORleftANDrightNOTleftINleftEQUALTONOTEQUALTOleftLESSTHANGREATERTHANLESSTHANEQUALGREATERTHANEQUALleftPLUSMINUSleftTIMESDIVIDEDBYMODULOleftEXPONENTrightUMINUSAND BOOLTYPE COLON COMMA CONCAT CONCATASSIGN CONST COSTUMEDEC DECIMAL DIRECTIONDEC DIVIDEDBY DIVIDEDBYASSIGN DOT DRAGGABLEDEC ELSE EQUALS EQUALTO EXPONENT EXPONENTASSIGN FALSE FOR FUNCTION GREATERTHAN GREATERTHANEQUAL IF IN INTEGER LAYERDEC LBRACE LBRACKET LESSTHAN LESSTHANEQUAL LPAREN MINUS MINUSASSIGN MODULO MODULOASSIGN NOT NOTEQUALTO NUMTYPE OR PLUS PLUSASSIGN RBRACE RBRACKET RETURN ROTATIONSTYLEDEC RPAREN SCRATCH SEMICOLON SIZEDEC SOUNDDEC SPRITENAMEDEC STRING STRTYPE THIS TIMES TIMESASSIGN TRUE VARIABLE VARTYPE VISIBILITYDEC WARP WHILE XDEC YDECprogram : meta_declaration_list top_level_statement_list\n               | meta_declaration_list\n               | top_level_statement_list\n               | meta_declaration_list : meta_declaration_list meta_declaration\n                             | meta_declarationmeta_declaration : SPRITENAMEDEC STRING\n                        | COSTUMEDEC STRING\n                        | COSTUMEDEC list\n                        | SOUNDDEC STRING\n                        | SOUNDDEC list\n                        | VISIBILITYDEC boolean\n                        | XDEC number\n                        | YDEC number\n                        | SIZEDEC number\n                        | DIRECTIONDEC number\n                        | DRAGGABLEDEC boolean\n                        | ROTATIONSTYLEDEC STRING\n                        | LAYERDEC numbertop_level_statement_list : top_level_statement\n                                | top_level_statement_list top_level_statementtop_level_statement : declare_variable SEMICOLON\n                           | set_variable SEMICOLON\n                           | hat\n                           | function_decfundamental_statement : declare_variable\n                             | set_variable\n                             | in_place_assignment\n                             | function_callstatement : fundamental_statement SEMICOLON\n                 | if\n                 | if_else\n                 | for\n                 | while\n                 | returnstatement_list : statement\n                      | statement_list statementdeclare_variable : variable type_declaration EQUALS expression\n                        | variable type_declaration EQUALS list\n                        | variable type_declaration\n                        | CONST variable type_declaration EQUALS expression\n                        | CONST variable type_declaration EQUALS list\n                        | CONST variable type_declarationset_variable : variable EQUALS expression\n                    | variable EQUALS listin_place_assignment : variable PLUSASSIGN expression\n                           | variable MINUSASSIGN expression\n                           | variable TIMESASSIGN expression\n                           | variable DIVIDEDBYASSIGN expression\n                           | variable MODULOASSIGN expression\n                           | variable EXPONENTASSIGN expression\n                           | variable CONCATASSIGN expressionfunction_call : variable function_argumentsnumber : DECIMAL\n              | INTEGERboolean : TRUE\n               | FALSElist : LBRACKET expression_list RBRACKET\n            | LBRACKET RBRACKETvariable_list : VARIABLE\n                     | variable_list COMMA VARIABLEvariable : SCRATCH DOT VARIABLE\n                | THIS DOT VARIABLE\n                | variable DOT VARIABLE\n                | VARIABLE\n                | indexindex : variable LBRACKET expression RBRACKETexpression_list : expression\n                       | expression_list COMMA expressionexpression : number\n                  | STRING\n                  | boolean\n                  | variable\n                  | function_call\n                  | concatenation\n                  | numerical_operation\n                  | comparison_operation\n                  | logical_operation\n                  | LPAREN expression RPARENtype : NUMTYPE\n            | STRTYPE\n            | BOOLTYPE\n            | VARTYPEtype_declaration : COLON type\n                        | LBRACKET RBRACKETconcatenation : expression CONCAT expressionnumerical_operation : expression PLUS expression\n                           | expression MINUS expression\n                           | expression TIMES expression\n                           | expression DIVIDEDBY expression\n                           | expression MODULO expression\n                           | expression EXPONENT expression\n                           | MINUS expression %prec UMINUScomparison_operation : expression LESSTHAN expression\n                            | expression GREATERTHAN expression\n                            | expression LESSTHANEQUAL expression\n                            | expression GREATERTHANEQUAL expression\n                            | expression EQUALTO expression\n                            | expression NOTEQUALTO expressionlogical_operation : NOT expression\n                         | expression AND expression\n                         | expression OR expression\n                         | expression IN expressioncontainer_body : statement\n                      | LBRACE RBRACE\n                      | LBRACE statement_list RBRACEif : IF LPAREN expression RPAREN container_bodyif_else : if ELSE container_bodyfor : FOR LPAREN declare_variable SEMICOLON expression SEMICOLON fundamental_statement RPAREN container_body\n           | FOR LPAREN set_variable SEMICOLON expression SEMICOLON fundamental_statement RPAREN container_bodywhile : WHILE LPAREN expression RPAREN container_bodyreturn : RETURN SEMICOLON\n              | RETURN expression SEMICOLONfunction_arguments : LPAREN RPAREN\n                          | LPAREN expression_list RPARENfunction_parameters : LPAREN RPAREN\n                           | LPAREN variable_list RPARENfunction_dec : FUNCTION VARIABLE function_parameters container_body\n                    | type FUNCTION VARIABLE function_parameters container_body\n                    | WARP FUNCTION VARIABLE function_parameters container_body\n                    | WARP type FUNCTION VARIABLE function_parameters container_bodyhat : variable function_arguments container_body'
+    
+_lr_action_items = {'$end':([0,1,2,3,4,5,19,20,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,72,90,91,94,95,96,97,98,121,153,156,161,166,198,200,206,211,212,219,220,223,230,231,],[-4,0,-2,-3,-6,-20,-24,-25,-1,-5,-21,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,-59,-122,-104,-31,-32,-33,-34,-35,-58,-105,-30,-112,-118,-106,-108,-113,-119,-120,-121,-107,-111,-109,-110,]),'SPRITENAMEDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[6,6,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'COSTUMEDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[7,7,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'SOUNDDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[8,8,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'VISIBILITYDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[9,9,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'XDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[10,10,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'YDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[11,11,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'SIZEDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[12,12,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'DIRECTIONDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[13,13,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'DRAGGABLEDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[14,14,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'ROTATIONSTYLEDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[15,15,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'LAYERDEC':([0,2,4,35,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,72,121,],[16,16,-6,-5,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-59,-58,]),'CONST':([0,2,3,4,5,19,20,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,59,72,90,91,92,94,95,96,97,98,111,114,121,153,154,155,156,157,159,161,164,166,167,170,171,198,199,200,206,209,211,212,213,214,217,219,220,223,224,225,228,229,230,231,],[22,22,22,-6,-20,-24,-25,22,-5,-21,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,22,-59,-122,-104,22,-31,-32,-33,-34,-35,-114,22,-58,-105,22,-36,-30,22,22,-112,-115,-118,-116,22,22,-106,-37,-108,-113,-117,-119,-120,22,22,22,-121,-107,-111,22,22,22,22,-109,-110,]),'FUNCTION':([0,2,3,4,5,19,20,25,26,30,31,32,33,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,68,72,90,91,94,95,96,97,98,121,153,156,161,166,198,200,206,211,212,219,220,223,230,231,],[23,23,23,-6,-20,-24,-25,66,67,-80,-81,-82,-83,23,-5,-21,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,118,-59,-122,-104,-31,-32,-33,-34,-35,-58,-105,-30,-112,-118,-106,-108,-113,-119,-120,-121,-107,-111,-109,-110,]),'WARP':([0,2,3,4,5,19,20,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,72,90,91,94,95,96,97,98,121,153,156,161,166,198,200,206,211,212,219,220,223,230,231,],[26,26,26,-6,-20,-24,-25,26,-5,-21,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,-59,-122,-104,-31,-32,-33,-34,-35,-58,-105,-30,-112,-118,-106,-108,-113,-119,-120,-121,-107,-111,-109,-110,]),'SCRATCH':([0,2,3,4,5,19,20,22,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,61,63,72,83,84,85,86,90,91,92,94,95,96,97,98,106,111,114,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,164,165,166,167,170,171,198,199,200,206,209,211,212,213,214,215,216,217,219,220,223,224,225,228,229,230,231,],[27,27,27,-6,-20,-24,-25,27,27,-5,-21,-7,-8,-9,27,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,27,27,27,27,-59,27,27,27,27,-122,-104,27,-31,-32,-33,-34,-35,27,-114,27,-58,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-105,27,-36,-30,27,27,27,27,-112,-115,27,-118,-116,27,27,-106,-37,-108,-113,-117,-119,-120,27,27,27,27,27,-121,-107,-111,27,27,27,27,-109,-110,]),'THIS':([0,2,3,4,5,19,20,22,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,61,63,72,83,84,85,86,90,91,92,94,95,96,97,98,106,111,114,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,164,165,166,167,170,171,198,199,200,206,209,211,212,213,214,215,216,217,219,220,223,224,225,228,229,230,231,],[28,28,28,-6,-20,-24,-25,28,28,-5,-21,-7,-8,-9,28,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,28,28,28,28,-59,28,28,28,28,-122,-104,28,-31,-32,-33,-34,-35,28,-114,28,-58,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-105,28,-36,-30,28,28,28,28,-112,-115,28,-118,-116,28,28,-106,-37,-108,-113,-117,-119,-120,28,28,28,28,28,-121,-107,-111,28,28,28,28,-109,-110,]),'VARIABLE':([0,2,3,4,5,19,20,22,23,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,58,59,60,61,63,66,67,69,70,72,83,84,85,86,90,91,92,94,95,96,97,98,106,111,114,115,118,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,164,165,166,167,170,171,198,199,200,206,209,210,211,212,213,214,215,216,217,219,220,223,224,225,228,229,230,231,],[24,24,24,-6,-20,-24,-25,24,65,24,-5,-21,-7,-8,-9,24,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,24,24,107,24,24,116,117,119,120,-59,24,24,24,24,-122,-104,24,-31,-32,-33,-34,-35,24,-114,24,169,172,-58,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-105,24,-36,-30,24,24,24,24,-112,-115,24,-118,-116,24,24,-106,-37,-108,-113,-117,218,-119,-120,24,24,24,24,24,-121,-107,-111,24,24,24,24,-109,-110,]),'NUMTYPE':([0,2,3,4,5,19,20,26,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,62,72,90,91,94,95,96,97,98,121,153,156,161,166,198,200,206,211,212,219,220,223,230,231,],[30,30,30,-6,-20,-24,-25,30,30,-5,-21,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,30,-59,-122,-104,-31,-32,-33,-34,-35,-58,-105,-30,-112,-118,-106,-108,-113,-119,-120,-121,-107,-111,-109,-110,]),'STRTYPE':([0,2,3,4,5,19,20,26,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,62,72,90,91,94,95,96,97,98,121,153,156,161,166,198,200,206,211,212,219,220,223,230,231,],[31,31,31,-6,-20,-24,-25,31,31,-5,-21,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,31,-59,-122,-104,-31,-32,-33,-34,-35,-58,-105,-30,-112,-118,-106,-108,-113,-119,-120,-121,-107,-111,-109,-110,]),'BOOLTYPE':([0,2,3,4,5,19,20,26,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,62,72,90,91,94,95,96,97,98,121,153,156,161,166,198,200,206,211,212,219,220,223,230,231,],[32,32,32,-6,-20,-24,-25,32,32,-5,-21,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,32,-59,-122,-104,-31,-32,-33,-34,-35,-58,-105,-30,-112,-118,-106,-108,-113,-119,-120,-121,-107,-111,-109,-110,]),'VARTYPE':([0,2,3,4,5,19,20,26,34,35,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,62,72,90,91,94,95,96,97,98,121,153,156,161,166,198,200,206,211,212,219,220,223,230,231,],[33,33,33,-6,-20,-24,-25,33,33,-5,-21,-7,-8,-9,-10,-11,-12,-56,-57,-13,-54,-55,-14,-15,-16,-17,-18,-19,-22,-23,33,-59,-122,-104,-31,-32,-33,-34,-35,-58,-105,-30,-112,-118,-106,-108,-113,-119,-120,-121,-107,-111,-109,-110,]),'STRING':([6,7,8,15,40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[37,38,41,53,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'LBRACKET':([7,8,21,24,29,58,64,77,86,89,107,119,120,163,165,204,],[40,40,61,-65,-66,40,61,140,40,61,-64,-62,-63,-67,40,61,]),'TRUE':([9,14,40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'FALSE':([9,14,40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'DECIMAL':([10,11,12,13,16,40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'INTEGER':([10,11,12,13,16,40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'SEMICOLON':([17,18,24,29,30,31,32,33,44,45,47,48,57,72,74,75,76,77,78,79,80,81,82,87,88,93,99,100,101,102,106,107,109,110,111,113,119,120,121,139,142,143,144,145,162,163,164,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,202,203,207,208,221,222,],[55,56,-65,-66,-80,-81,-82,-83,-56,-57,-54,-55,-40,-59,-70,-71,-72,-73,-74,-75,-76,-77,-78,-44,-45,156,-26,-27,-28,-29,161,-64,-85,-84,-114,-43,-62,-63,-58,-53,-93,-100,-38,-39,206,-67,-115,-86,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,-98,-99,-101,-102,-103,-79,-46,-47,-48,-49,-50,-51,-52,215,216,-41,-42,224,225,]),'EQUALS':([21,24,29,30,31,32,33,57,89,107,109,110,113,119,120,163,204,],[58,-65,-66,-80,-81,-82,-83,86,58,-64,-85,-84,165,-62,-63,-67,58,]),'DOT':([21,24,27,28,29,64,77,89,107,119,120,163,204,],[60,-65,69,70,-66,60,60,60,-64,-62,-63,-67,60,]),'COLON':([21,24,29,64,89,107,119,120,163,204,],[62,-65,-66,62,62,-64,-62,-63,-67,62,]),'LPAREN':([21,24,29,40,58,61,63,65,77,83,84,85,86,89,103,104,105,106,107,116,117,119,120,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,163,165,172,215,216,],[63,-65,-66,83,83,83,83,115,63,83,83,83,83,63,158,159,160,83,-64,115,115,-62,-63,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-67,83,115,83,83,]),'CONCAT':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,123,-70,-71,-72,-73,-74,-75,-76,-77,-78,123,-64,123,-114,-62,-63,-53,123,-93,-100,123,123,-67,-115,123,123,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,-98,-99,-101,-102,-103,-79,123,123,123,123,123,123,123,123,123,123,123,123,]),'PLUS':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,124,-70,-71,-72,-73,-74,-75,-76,-77,-78,124,-64,124,-114,-62,-63,-53,124,-93,124,124,124,-67,-115,124,124,-87,-88,-89,-90,-91,-92,124,124,124,124,124,124,124,124,124,-79,124,124,124,124,124,124,124,124,124,124,124,124,]),'MINUS':([24,29,40,44,45,47,48,58,61,63,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,106,107,108,111,119,120,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,146,147,148,149,150,151,152,158,160,162,163,164,165,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,215,216,221,222,],[-65,-66,84,-56,-57,-54,-55,84,84,84,125,-70,-71,-72,-73,-74,-75,-76,-77,-78,84,84,84,84,125,84,-64,125,-114,-62,-63,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-53,84,125,-93,125,125,84,84,84,84,84,84,84,84,84,125,-67,-115,84,125,125,-87,-88,-89,-90,-91,-92,125,125,125,125,125,125,125,125,125,-79,125,125,125,125,125,125,125,125,125,125,84,84,125,125,]),'TIMES':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,126,-70,-71,-72,-73,-74,-75,-76,-77,-78,126,-64,126,-114,-62,-63,-53,126,-93,126,126,126,-67,-115,126,126,126,126,-89,-90,-91,-92,126,126,126,126,126,126,126,126,126,-79,126,126,126,126,126,126,126,126,126,126,126,126,]),'DIVIDEDBY':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,127,-70,-71,-72,-73,-74,-75,-76,-77,-78,127,-64,127,-114,-62,-63,-53,127,-93,127,127,127,-67,-115,127,127,127,127,-89,-90,-91,-92,127,127,127,127,127,127,127,127,127,-79,127,127,127,127,127,127,127,127,127,127,127,127,]),'MODULO':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,128,-70,-71,-72,-73,-74,-75,-76,-77,-78,128,-64,128,-114,-62,-63,-53,128,-93,128,128,128,-67,-115,128,128,128,128,-89,-90,-91,-92,128,128,128,128,128,128,128,128,128,-79,128,128,128,128,128,128,128,128,128,128,128,128,]),'EXPONENT':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,129,-70,-71,-72,-73,-74,-75,-76,-77,-78,129,-64,129,-114,-62,-63,-53,129,-93,129,129,129,-67,-115,129,129,129,129,129,129,129,-92,129,129,129,129,129,129,129,129,129,-79,129,129,129,129,129,129,129,129,129,129,129,129,]),'LESSTHAN':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,130,-70,-71,-72,-73,-74,-75,-76,-77,-78,130,-64,130,-114,-62,-63,-53,130,-93,130,130,130,-67,-115,130,130,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,130,130,130,130,130,-79,130,130,130,130,130,130,130,130,130,130,130,130,]),'GREATERTHAN':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,131,-70,-71,-72,-73,-74,-75,-76,-77,-78,131,-64,131,-114,-62,-63,-53,131,-93,131,131,131,-67,-115,131,131,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,131,131,131,131,131,-79,131,131,131,131,131,131,131,131,131,131,131,131,]),'LESSTHANEQUAL':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,132,-70,-71,-72,-73,-74,-75,-76,-77,-78,132,-64,132,-114,-62,-63,-53,132,-93,132,132,132,-67,-115,132,132,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,132,132,132,132,132,-79,132,132,132,132,132,132,132,132,132,132,132,132,]),'GREATERTHANEQUAL':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,133,-70,-71,-72,-73,-74,-75,-76,-77,-78,133,-64,133,-114,-62,-63,-53,133,-93,133,133,133,-67,-115,133,133,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,133,133,133,133,133,-79,133,133,133,133,133,133,133,133,133,133,133,133,]),'EQUALTO':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,134,-70,-71,-72,-73,-74,-75,-76,-77,-78,134,-64,134,-114,-62,-63,-53,134,-93,134,134,134,-67,-115,134,134,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,-98,-99,134,134,134,-79,134,134,134,134,134,134,134,134,134,134,134,134,]),'NOTEQUALTO':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,135,-70,-71,-72,-73,-74,-75,-76,-77,-78,135,-64,135,-114,-62,-63,-53,135,-93,135,135,135,-67,-115,135,135,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,-98,-99,135,135,135,-79,135,135,135,135,135,135,135,135,135,135,135,135,]),'AND':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,136,-70,-71,-72,-73,-74,-75,-76,-77,-78,136,-64,136,-114,-62,-63,-53,136,-93,-100,136,136,-67,-115,136,136,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,-98,-99,-101,136,-103,-79,136,136,136,136,136,136,136,136,136,136,136,136,]),'OR':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,137,-70,-71,-72,-73,-74,-75,-76,-77,-78,137,-64,137,-114,-62,-63,-53,137,-93,-100,137,137,-67,-115,137,137,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,-98,-99,-101,-102,-103,-79,137,137,137,137,137,137,137,137,137,137,137,137,]),'IN':([24,29,44,45,47,48,73,74,75,76,77,78,79,80,81,82,87,107,108,111,119,120,139,141,142,143,144,162,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,221,222,],[-65,-66,-56,-57,-54,-55,138,-70,-71,-72,-73,-74,-75,-76,-77,-78,138,-64,138,-114,-62,-63,-53,138,-93,138,138,138,-67,-115,138,138,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,-98,-99,138,138,-103,-79,138,138,138,138,138,138,138,138,138,138,138,138,]),'RBRACKET':([24,29,40,44,45,47,48,61,71,73,74,75,76,77,78,79,80,81,82,107,108,111,119,120,139,142,143,163,164,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,],[-65,-66,72,-56,-57,-54,-55,109,121,-68,-70,-71,-72,-73,-74,-75,-76,-77,-78,-64,163,-114,-62,-63,-53,-93,-100,-67,-115,-69,-86,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,-98,-99,-101,-102,-103,-79,]),'COMMA':([24,29,44,45,47,48,71,73,74,75,76,77,78,79,80,81,82,107,111,112,119,120,139,142,143,163,164,168,169,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,218,],[-65,-66,-56,-57,-54,-55,122,-68,-70,-71,-72,-73,-74,-75,-76,-77,-78,-64,-114,122,-62,-63,-53,-93,-100,-67,-115,210,-60,-69,-86,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,-98,-99,-101,-102,-103,-79,-61,]),'RPAREN':([24,29,30,31,32,33,44,45,47,48,57,63,72,73,74,75,76,77,78,79,80,81,82,87,88,99,100,101,102,107,109,110,111,112,113,115,119,120,121,139,141,142,143,144,145,163,164,168,169,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,201,205,207,208,218,226,227,],[-65,-66,-80,-81,-82,-83,-56,-57,-54,-55,-40,111,-59,-68,-70,-71,-72,-73,-74,-75,-76,-77,-78,-44,-45,-26,-27,-28,-29,-64,-85,-84,-114,164,-43,167,-62,-63,-58,-53,190,-93,-100,-38,-39,-67,-115,209,-60,-69,-86,-87,-88,-89,-90,-91,-92,-94,-95,-96,-97,-98,-99,-101,-102,-103,-79,-46,-47,-48,-49,-50,-51,-52,214,217,-41,-42,-61,228,229,]),'PLUSASSIGN':([24,29,89,107,119,120,163,],[-65,-66,146,-64,-62,-63,-67,]),'MINUSASSIGN':([24,29,89,107,119,120,163,],[-65,-66,147,-64,-62,-63,-67,]),'TIMESASSIGN':([24,29,89,107,119,120,163,],[-65,-66,148,-64,-62,-63,-67,]),'DIVIDEDBYASSIGN':([24,29,89,107,119,120,163,],[-65,-66,149,-64,-62,-63,-67,]),'MODULOASSIGN':([24,29,89,107,119,120,163,],[-65,-66,150,-64,-62,-63,-67,]),'EXPONENTASSIGN':([24,29,89,107,119,120,163,],[-65,-66,151,-64,-62,-63,-67,]),'CONCATASSIGN':([24,29,89,107,119,120,163,],[-65,-66,152,-64,-62,-63,-67,]),'NOT':([40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,]),'LBRACE':([59,111,114,157,164,167,170,171,209,213,214,217,228,229,],[92,-114,92,92,-115,-116,92,92,-117,92,92,92,92,92,]),'IF':([59,91,92,94,95,96,97,98,111,114,153,154,155,156,157,161,164,167,170,171,198,199,200,206,209,213,214,217,220,223,228,229,230,231,],[103,-104,103,-31,-32,-33,-34,-35,-114,103,-105,103,-36,-30,103,-112,-115,-116,103,103,-106,-37,-108,-113,-117,103,103,103,-107,-111,103,103,-109,-110,]),'FOR':([59,91,92,94,95,96,97,98,111,114,153,154,155,156,157,161,164,167,170,171,198,199,200,206,209,213,214,217,220,223,228,229,230,231,],[104,-104,104,-31,-32,-33,-34,-35,-114,104,-105,104,-36,-30,104,-112,-115,-116,104,104,-106,-37,-108,-113,-117,104,104,104,-107,-111,104,104,-109,-110,]),'WHILE':([59,91,92,94,95,96,97,98,111,114,153,154,155,156,157,161,164,167,170,171,198,199,200,206,209,213,214,217,220,223,228,229,230,231,],[105,-104,105,-31,-32,-33,-34,-35,-114,105,-105,105,-36,-30,105,-112,-115,-116,105,105,-106,-37,-108,-113,-117,105,105,105,-107,-111,105,105,-109,-110,]),'RETURN':([59,91,92,94,95,96,97,98,111,114,153,154,155,156,157,161,164,167,170,171,198,199,200,206,209,213,214,217,220,223,228,229,230,231,],[106,-104,106,-31,-32,-33,-34,-35,-114,106,-105,106,-36,-30,106,-112,-115,-116,106,106,-106,-37,-108,-113,-117,106,106,106,-107,-111,106,106,-109,-110,]),'RBRACE':([91,92,94,95,96,97,98,153,154,155,156,161,198,199,200,206,220,223,230,231,],[-104,153,-31,-32,-33,-34,-35,-105,198,-36,-30,-112,-106,-37,-108,-113,-107,-111,-109,-110,]),'ELSE':([91,94,95,96,97,98,153,156,161,198,200,206,220,223,230,231,],[-104,157,-32,-33,-34,-35,-105,-30,-112,-106,-108,-113,-107,-111,-109,-110,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'meta_declaration_list':([0,],[2,]),'top_level_statement_list':([0,2,],[3,34,]),'meta_declaration':([0,2,],[4,35,]),'top_level_statement':([0,2,3,34,],[5,5,36,36,]),'declare_variable':([0,2,3,34,59,92,114,154,157,159,170,171,213,214,217,224,225,228,229,],[17,17,17,17,99,99,99,99,99,202,99,99,99,99,99,99,99,99,99,]),'set_variable':([0,2,3,34,59,92,114,154,157,159,170,171,213,214,217,224,225,228,229,],[18,18,18,18,100,100,100,100,100,203,100,100,100,100,100,100,100,100,100,]),'hat':([0,2,3,34,],[19,19,19,19,]),'function_dec':([0,2,3,34,],[20,20,20,20,]),'variable':([0,2,3,22,34,40,58,59,61,63,83,84,85,86,92,106,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,154,157,158,159,160,165,170,171,213,214,215,216,217,224,225,228,229,],[21,21,21,64,21,77,77,89,77,77,77,77,77,77,89,77,89,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,89,89,77,204,77,77,89,89,89,89,77,77,89,89,89,89,89,]),'type':([0,2,3,26,34,62,],[25,25,25,68,25,110,]),'index':([0,2,3,22,34,40,58,59,61,63,83,84,85,86,92,106,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,154,157,158,159,160,165,170,171,213,214,215,216,217,224,225,228,229,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'list':([7,8,58,86,165,],[39,42,88,145,208,]),'boolean':([9,14,40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[43,52,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'number':([10,11,12,13,16,40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[46,49,50,51,54,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'type_declaration':([21,64,89,204,],[57,113,57,57,]),'function_arguments':([21,77,89,],[59,139,139,]),'expression_list':([40,63,],[71,112,]),'expression':([40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[73,87,108,73,141,142,143,144,162,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,108,191,192,193,194,195,196,197,201,205,207,221,222,]),'function_call':([40,58,59,61,63,83,84,85,86,92,106,114,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,154,157,158,160,165,170,171,213,214,215,216,217,224,225,228,229,],[78,78,102,78,78,78,78,78,78,102,78,102,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,102,102,78,78,78,102,102,102,102,78,78,102,102,102,102,102,]),'concatenation':([40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'numerical_operation':([40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'comparison_operation':([40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'logical_operation':([40,58,61,63,83,84,85,86,106,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,140,146,147,148,149,150,151,152,158,160,165,215,216,],[82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,]),'container_body':([59,114,157,170,171,213,214,217,228,229,],[90,166,200,211,212,219,220,223,230,231,]),'statement':([59,92,114,154,157,170,171,213,214,217,228,229,],[91,155,91,199,91,91,91,91,91,91,91,91,]),'fundamental_statement':([59,92,114,154,157,170,171,213,214,217,224,225,228,229,],[93,93,93,93,93,93,93,93,93,93,226,227,93,93,]),'if':([59,92,114,154,157,170,171,213,214,217,228,229,],[94,94,94,94,94,94,94,94,94,94,94,94,]),'if_else':([59,92,114,154,157,170,171,213,214,217,228,229,],[95,95,95,95,95,95,95,95,95,95,95,95,]),'for':([59,92,114,154,157,170,171,213,214,217,228,229,],[96,96,96,96,96,96,96,96,96,96,96,96,]),'while':([59,92,114,154,157,170,171,213,214,217,228,229,],[97,97,97,97,97,97,97,97,97,97,97,97,]),'return':([59,92,114,154,157,170,171,213,214,217,228,229,],[98,98,98,98,98,98,98,98,98,98,98,98,]),'in_place_assignment':([59,92,114,154,157,170,171,213,214,217,224,225,228,229,],[101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'function_parameters':([65,116,117,172,],[114,170,171,213,]),'statement_list':([92,],[154,]),'variable_list':([115,],[168,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> meta_declaration_list top_level_statement_list','program',2,'p_program','parser.py',27),
+  ('program -> meta_declaration_list','program',1,'p_program','parser.py',28),
+  ('program -> top_level_statement_list','program',1,'p_program','parser.py',29),
+  ('program -> <empty>','program',0,'p_program','parser.py',30),
+  ('meta_declaration_list -> meta_declaration_list meta_declaration','meta_declaration_list',2,'p_meta_declaration_list','parser.py',50),
+  ('meta_declaration_list -> meta_declaration','meta_declaration_list',1,'p_meta_declaration_list','parser.py',51),
+  ('meta_declaration -> SPRITENAMEDEC STRING','meta_declaration',2,'p_meta_declaration','parser.py',59),
+  ('meta_declaration -> COSTUMEDEC STRING','meta_declaration',2,'p_meta_declaration','parser.py',60),
+  ('meta_declaration -> COSTUMEDEC list','meta_declaration',2,'p_meta_declaration','parser.py',61),
+  ('meta_declaration -> SOUNDDEC STRING','meta_declaration',2,'p_meta_declaration','parser.py',62),
+  ('meta_declaration -> SOUNDDEC list','meta_declaration',2,'p_meta_declaration','parser.py',63),
+  ('meta_declaration -> VISIBILITYDEC boolean','meta_declaration',2,'p_meta_declaration','parser.py',64),
+  ('meta_declaration -> XDEC number','meta_declaration',2,'p_meta_declaration','parser.py',65),
+  ('meta_declaration -> YDEC number','meta_declaration',2,'p_meta_declaration','parser.py',66),
+  ('meta_declaration -> SIZEDEC number','meta_declaration',2,'p_meta_declaration','parser.py',67),
+  ('meta_declaration -> DIRECTIONDEC number','meta_declaration',2,'p_meta_declaration','parser.py',68),
+  ('meta_declaration -> DRAGGABLEDEC boolean','meta_declaration',2,'p_meta_declaration','parser.py',69),
+  ('meta_declaration -> ROTATIONSTYLEDEC STRING','meta_declaration',2,'p_meta_declaration','parser.py',70),
+  ('meta_declaration -> LAYERDEC number','meta_declaration',2,'p_meta_declaration','parser.py',71),
+  ('top_level_statement_list -> top_level_statement','top_level_statement_list',1,'p_top_level_statement_list','parser.py',80),
+  ('top_level_statement_list -> top_level_statement_list top_level_statement','top_level_statement_list',2,'p_top_level_statement_list','parser.py',81),
+  ('top_level_statement -> declare_variable SEMICOLON','top_level_statement',2,'p_top_level_statement','parser.py',89),
+  ('top_level_statement -> set_variable SEMICOLON','top_level_statement',2,'p_top_level_statement','parser.py',90),
+  ('top_level_statement -> hat','top_level_statement',1,'p_top_level_statement','parser.py',91),
+  ('top_level_statement -> function_dec','top_level_statement',1,'p_top_level_statement','parser.py',92),
+  ('fundamental_statement -> declare_variable','fundamental_statement',1,'p_fundamental_statement','parser.py',98),
+  ('fundamental_statement -> set_variable','fundamental_statement',1,'p_fundamental_statement','parser.py',99),
+  ('fundamental_statement -> in_place_assignment','fundamental_statement',1,'p_fundamental_statement','parser.py',100),
+  ('fundamental_statement -> function_call','fundamental_statement',1,'p_fundamental_statement','parser.py',101),
+  ('statement -> fundamental_statement SEMICOLON','statement',2,'p_statement','parser.py',105),
+  ('statement -> if','statement',1,'p_statement','parser.py',106),
+  ('statement -> if_else','statement',1,'p_statement','parser.py',107),
+  ('statement -> for','statement',1,'p_statement','parser.py',108),
+  ('statement -> while','statement',1,'p_statement','parser.py',109),
+  ('statement -> return','statement',1,'p_statement','parser.py',110),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',114),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',115),
+  ('declare_variable -> variable type_declaration EQUALS expression','declare_variable',4,'p_declare_variable','parser.py',123),
+  ('declare_variable -> variable type_declaration EQUALS list','declare_variable',4,'p_declare_variable','parser.py',124),
+  ('declare_variable -> variable type_declaration','declare_variable',2,'p_declare_variable','parser.py',125),
+  ('declare_variable -> CONST variable type_declaration EQUALS expression','declare_variable',5,'p_declare_variable','parser.py',126),
+  ('declare_variable -> CONST variable type_declaration EQUALS list','declare_variable',5,'p_declare_variable','parser.py',127),
+  ('declare_variable -> CONST variable type_declaration','declare_variable',3,'p_declare_variable','parser.py',128),
+  ('set_variable -> variable EQUALS expression','set_variable',3,'p_set_variable','parser.py',141),
+  ('set_variable -> variable EQUALS list','set_variable',3,'p_set_variable','parser.py',142),
+  ('in_place_assignment -> variable PLUSASSIGN expression','in_place_assignment',3,'p_in_place_assignment','parser.py',146),
+  ('in_place_assignment -> variable MINUSASSIGN expression','in_place_assignment',3,'p_in_place_assignment','parser.py',147),
+  ('in_place_assignment -> variable TIMESASSIGN expression','in_place_assignment',3,'p_in_place_assignment','parser.py',148),
+  ('in_place_assignment -> variable DIVIDEDBYASSIGN expression','in_place_assignment',3,'p_in_place_assignment','parser.py',149),
+  ('in_place_assignment -> variable MODULOASSIGN expression','in_place_assignment',3,'p_in_place_assignment','parser.py',150),
+  ('in_place_assignment -> variable EXPONENTASSIGN expression','in_place_assignment',3,'p_in_place_assignment','parser.py',151),
+  ('in_place_assignment -> variable CONCATASSIGN expression','in_place_assignment',3,'p_in_place_assignment','parser.py',152),
+  ('function_call -> variable function_arguments','function_call',2,'p_function_call','parser.py',156),
+  ('number -> DECIMAL','number',1,'p_number','parser.py',162),
+  ('number -> INTEGER','number',1,'p_number','parser.py',163),
+  ('boolean -> TRUE','boolean',1,'p_boolean','parser.py',167),
+  ('boolean -> FALSE','boolean',1,'p_boolean','parser.py',168),
+  ('list -> LBRACKET expression_list RBRACKET','list',3,'p_list','parser.py',172),
+  ('list -> LBRACKET RBRACKET','list',2,'p_list','parser.py',173),
+  ('variable_list -> VARIABLE','variable_list',1,'p_variable_list','parser.py',180),
+  ('variable_list -> variable_list COMMA VARIABLE','variable_list',3,'p_variable_list','parser.py',181),
+  ('variable -> SCRATCH DOT VARIABLE','variable',3,'p_variable','parser.py',189),
+  ('variable -> THIS DOT VARIABLE','variable',3,'p_variable','parser.py',190),
+  ('variable -> variable DOT VARIABLE','variable',3,'p_variable','parser.py',191),
+  ('variable -> VARIABLE','variable',1,'p_variable','parser.py',192),
+  ('variable -> index','variable',1,'p_variable','parser.py',193),
+  ('index -> variable LBRACKET expression RBRACKET','index',4,'p_index','parser.py',203),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','parser.py',207),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','parser.py',208),
+  ('expression -> number','expression',1,'p_expression','parser.py',216),
+  ('expression -> STRING','expression',1,'p_expression','parser.py',217),
+  ('expression -> boolean','expression',1,'p_expression','parser.py',218),
+  ('expression -> variable','expression',1,'p_expression','parser.py',219),
+  ('expression -> function_call','expression',1,'p_expression','parser.py',220),
+  ('expression -> concatenation','expression',1,'p_expression','parser.py',221),
+  ('expression -> numerical_operation','expression',1,'p_expression','parser.py',222),
+  ('expression -> comparison_operation','expression',1,'p_expression','parser.py',223),
+  ('expression -> logical_operation','expression',1,'p_expression','parser.py',224),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','parser.py',225),
+  ('type -> NUMTYPE','type',1,'p_type','parser.py',235),
+  ('type -> STRTYPE','type',1,'p_type','parser.py',236),
+  ('type -> BOOLTYPE','type',1,'p_type','parser.py',237),
+  ('type -> VARTYPE','type',1,'p_type','parser.py',238),
+  ('type_declaration -> COLON type','type_declaration',2,'p_type_declaration','parser.py',246),
+  ('type_declaration -> LBRACKET RBRACKET','type_declaration',2,'p_type_declaration','parser.py',247),
+  ('concatenation -> expression CONCAT expression','concatenation',3,'p_concatenation','parser.py',256),
+  ('numerical_operation -> expression PLUS expression','numerical_operation',3,'p_numerical_operation','parser.py',261),
+  ('numerical_operation -> expression MINUS expression','numerical_operation',3,'p_numerical_operation','parser.py',262),
+  ('numerical_operation -> expression TIMES expression','numerical_operation',3,'p_numerical_operation','parser.py',263),
+  ('numerical_operation -> expression DIVIDEDBY expression','numerical_operation',3,'p_numerical_operation','parser.py',264),
+  ('numerical_operation -> expression MODULO expression','numerical_operation',3,'p_numerical_operation','parser.py',265),
+  ('numerical_operation -> expression EXPONENT expression','numerical_operation',3,'p_numerical_operation','parser.py',266),
+  ('numerical_operation -> MINUS expression','numerical_operation',2,'p_numerical_operation','parser.py',267),
+  ('comparison_operation -> expression LESSTHAN expression','comparison_operation',3,'p_comparison_operation','parser.py',275),
+  ('comparison_operation -> expression GREATERTHAN expression','comparison_operation',3,'p_comparison_operation','parser.py',276),
+  ('comparison_operation -> expression LESSTHANEQUAL expression','comparison_operation',3,'p_comparison_operation','parser.py',277),
+  ('comparison_operation -> expression GREATERTHANEQUAL expression','comparison_operation',3,'p_comparison_operation','parser.py',278),
+  ('comparison_operation -> expression EQUALTO expression','comparison_operation',3,'p_comparison_operation','parser.py',279),
+  ('comparison_operation -> expression NOTEQUALTO expression','comparison_operation',3,'p_comparison_operation','parser.py',280),
+  ('logical_operation -> NOT expression','logical_operation',2,'p_logical_operation','parser.py',285),
+  ('logical_operation -> expression AND expression','logical_operation',3,'p_logical_operation','parser.py',286),
+  ('logical_operation -> expression OR expression','logical_operation',3,'p_logical_operation','parser.py',287),
+  ('logical_operation -> expression IN expression','logical_operation',3,'p_logical_operation','parser.py',288),
+  ('container_body -> statement','container_body',1,'p_container_body','parser.py',298),
+  ('container_body -> LBRACE RBRACE','container_body',2,'p_container_body','parser.py',299),
+  ('container_body -> LBRACE statement_list RBRACE','container_body',3,'p_container_body','parser.py',300),
+  ('if -> IF LPAREN expression RPAREN container_body','if',5,'p_if','parser.py',309),
+  ('if_else -> if ELSE container_body','if_else',3,'p_if_else','parser.py',313),
+  ('for -> FOR LPAREN declare_variable SEMICOLON expression SEMICOLON fundamental_statement RPAREN container_body','for',9,'p_for','parser.py',317),
+  ('for -> FOR LPAREN set_variable SEMICOLON expression SEMICOLON fundamental_statement RPAREN container_body','for',9,'p_for','parser.py',318),
+  ('while -> WHILE LPAREN expression RPAREN container_body','while',5,'p_while','parser.py',322),
+  ('return -> RETURN SEMICOLON','return',2,'p_return','parser.py',326),
+  ('return -> RETURN expression SEMICOLON','return',3,'p_return','parser.py',327),
+  ('function_arguments -> LPAREN RPAREN','function_arguments',2,'p_function_arguments','parser.py',338),
+  ('function_arguments -> LPAREN expression_list RPAREN','function_arguments',3,'p_function_arguments','parser.py',339),
+  ('function_parameters -> LPAREN RPAREN','function_parameters',2,'p_function_parameters','parser.py',346),
+  ('function_parameters -> LPAREN variable_list RPAREN','function_parameters',3,'p_function_parameters','parser.py',347),
+  ('function_dec -> FUNCTION VARIABLE function_parameters container_body','function_dec',4,'p_function_dec','parser.py',354),
+  ('function_dec -> type FUNCTION VARIABLE function_parameters container_body','function_dec',5,'p_function_dec','parser.py',355),
+  ('function_dec -> WARP FUNCTION VARIABLE function_parameters container_body','function_dec',5,'p_function_dec','parser.py',356),
+  ('function_dec -> WARP type FUNCTION VARIABLE function_parameters container_body','function_dec',6,'p_function_dec','parser.py',357),
+  ('hat -> variable function_arguments container_body','hat',3,'p_hat','parser.py',370),
+]
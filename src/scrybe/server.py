@@ -0,0 +1,229 @@
+from .buildcache import BuildCache
+from .compiler import Compiler
+from .files import ProjectFiles, VirtualFiles
+from .logger import debug, info, remove_colors, CompileError
+from .optimizer import PassManager, OPTIMIZATION_LEVELS, DEFAULT_LEVEL
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+import threading
+import binascii
+import base64
+import json
+import time
+import sys
+import os
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR      = -32700
+INVALID_REQUEST  = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS   = -32602
+INTERNAL_ERROR   = -32603
+
+class RequestError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+# Compiles the projects sent to `scrybe serve`. The parsers and translation
+# tables stay loaded between requests, as do the build caches of projects
+# compiled from the disk
+class CompileService:
+    def __init__(self):
+        # Projects: {<absolute project path>: (<lock>, <build cache>), ...}
+        self.projects = {}
+        self.lock = threading.Lock()
+
+    # Projects on the disk are compiled one request at a time, since they share a build cache
+    def get_project(self, path):
+        with self.lock:
+            if path not in self.projects:
+                self.projects[path] = (threading.Lock(), BuildCache(os.path.join(path, ".scrybe_cache")))
+
+            return self.projects[path]
+
+    # Params: {
+    #     "sources":       {<relative filepath>: <source code>, ...},
+    #     "assets":        {<relative filepath>: <base64 file content>, ...},
+    #     "name":          <project name>,
+    #     or
+    #     "path":          <project directory on the server's disk>,
+    #     "output":        <.sb3 file to write instead of returning it>,
+    #
+    #     "compression":   <deflate level>,
+    #     "compact":       <whether to write the smallest project.json>,
+    #     "optimization":  <optimization level>
+    # }
+    # Result: {
+    #     "success":       <whether the project compiled>,
+    #     "sb3":           <base64 .sb3 file, unless it failed or was written to "output">,
+    #     "diagnostics":   [{"severity", "message", "file", "line", "column"}, ...],
+    #     "optimizations": [{"pass", "file", "line", "message"}, ...],
+    #     "seconds":       <compilation time>
+    # }
+    def compile(self, params):
+        if not isinstance(params, dict):
+            raise RequestError(INVALID_PARAMS, "Params must be an object")
+
+        # JSON numbers like 5.0 and booleans compare equal to integers, so check the type too
+        compression = params.get("compression", 5)
+        if type(compression) is not int or compression not in range(10):
+            raise RequestError(INVALID_PARAMS, "Compression must be an integer from 0 to 9")
+
+        level = params.get("optimization", DEFAULT_LEVEL)
+        if type(level) is not int or level not in OPTIMIZATION_LEVELS:
+            raise RequestError(INVALID_PARAMS, f"Optimization must be one of {", ".join(map(str, OPTIMIZATION_LEVELS))}")
+        optimizer = PassManager(level)
+
+        if "path" in params:
+            path = os.path.abspath(params["path"])
+            if not os.path.isdir(path):
+                raise RequestError(INVALID_PARAMS, f'Project directory "{params["path"]}" not found')
+
+            lock, cache = self.get_project(path)
+            compiler = Compiler(ProjectFiles(path), cache, optimizer=optimizer)
+
+        elif "sources" in params:
+            if not isinstance(params["sources"], dict) or not all(isinstance(source, str) for source in params["sources"].values()):
+                raise RequestError(INVALID_PARAMS, "Sources must be an object of strings")
+
+            try:
+                assets = {
+                    file_path: base64.b64decode(content, validate=True)
+                    for file_path, content in params.get("assets", {}).items()
+                }
+            except (binascii.Error, TypeError, AttributeError):
+                raise RequestError(INVALID_PARAMS, "Assets must be an object of base64 strings")
+
+            lock = None
+            compiler = Compiler(VirtualFiles(params["sources"], assets, params.get("name", "project")), optimizer=optimizer)
+
+        else:
+            raise RequestError(INVALID_PARAMS, 'Either "path" or "sources" is required')
+
+        result = {"success": False, "diagnostics": []}
+        start_time = time.perf_counter()
+
+        if lock: lock.acquire()
+        try:
+            compiler.compile()
+            if "output" in params:
+                result["output"] = compiler.save(params["output"], compression, compact=params.get("compact", False))
+            else:
+                data = compiler.to_bytes(compression, compact=params.get("compact", False))
+                result["sb3"] = base64.b64encode(data).decode()
+            result["success"] = True
+
+        except CompileError as exception:
+            result["diagnostics"].append({
+                "severity": "error",
+                "message":  remove_colors(exception.message or str(exception)),
+                "file":     exception.file_name,
+                "line":     exception.line_number,
+                "column":   exception.column_number
+            })
+
+        finally:
+            if lock: lock.release()
+
+        result["diagnostics"][:0] = [
+            {"severity": "warning", "message": warning["message"], "file": warning["file"], "line": None, "column": None}
+            for warning in compiler.context.warnings
+        ]
+        result["optimizations"] = optimizer.changes
+        result["seconds"] = time.perf_counter() - start_time
+        return result
+
+    # Answer one JSON-RPC request. Returns None for notifications, which get no answer
+    def handle(self, request):
+        if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" or "method" not in request:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": INVALID_REQUEST, "message": "Invalid request"}}
+
+        try:
+            if request["method"] != "compile":
+                raise RequestError(METHOD_NOT_FOUND, f'Method "{request["method"]}" not found')
+
+            response = {"result": self.compile(request.get("params", {}))}
+
+        except RequestError as exception:
+            response = {"error": {"code": exception.code, "message": str(exception)}}
+
+        except Exception as exception:
+            response = {"error": {"code": INTERNAL_ERROR, "message": f"{type(exception).__name__}: {exception}"}}
+
+        if "id" not in request: return None
+        return {"jsonrpc": "2.0", "id": request["id"], **response}
+
+    # Answer a JSON-RPC request in its text form. Returns None if there's no answer
+    def handle_text(self, text):
+        try:
+            request = json.loads(text)
+        except ValueError:
+            return json.dumps({"jsonrpc": "2.0", "id": None, "error": {"code": PARSE_ERROR, "message": "Parse error"}})
+
+        response = self.handle(request)
+        return response and json.dumps(response)
+
+# HTTP server that handles connections in a bounded pool of worker threads
+class PooledHTTPServer(ThreadingMixIn, HTTPServer):
+    def __init__(self, address, handler, service, workers):
+        super().__init__(address, handler)
+        self.service = service
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrybe-serve")
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown()
+
+# Every POST request is one JSON-RPC request
+class RequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        response = self.server.service.handle_text(self.rfile.read(length)) or ""
+
+        body = response.encode()
+        self.send_response(200 if body else 204)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        debug(f"  {self.address_string()} {format % args}")
+
+def serve_http(host, port, workers):
+    server = PooledHTTPServer((host, port), RequestHandler, CompileService(), workers)
+    info(f"Serving on http://{host}:{server.server_address[1]} with {workers} workers (press Ctrl+C to stop)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        info("Stopped serving")
+    finally:
+        server.server_close()
+
+# One JSON-RPC request per line on standard input, answered on standard output
+# in the order they finish. Logs go to standard error to keep the output clean
+def serve_stdio(workers):
+    from .logger import logger
+    logger.stream = sys.stderr
+
+    service = CompileService()
+    output_lock = threading.Lock()
+
+    def answer(line):
+        response = service.handle_text(line)
+        if response is None: return
+
+        with output_lock:
+            sys.stdout.write(response + "\n")
+            sys.stdout.flush()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrybe-serve") as executor:
+        for line in sys.stdin:
+            if line.strip():
+                executor.submit(answer, line)
@@ -1,11 +1,14 @@
-from ply import yacc
 from .lexer import lexer, tokens
 from .. import filestate
 from .. import utils
-from ..logger import debug, code_error, set_lexpos
+from .. import nodes
+from ..parsetables import load_parser
+from ..logger import debug, code_error, set_lexpos, CompileError
+from ..context import get_context
 from ..scriptparser.parser import (p_number, p_boolean, p_list, p_expression_list,
                                    p_type, p_type_declaration,
                                    p_concatenation, p_numerical_operation, p_comparison_operation, p_logical_operation)
+import sys
 
 precedence = (
     ("left", "OR"),
@@ -31,15 +34,12 @@ def p_program(prod):
             file_declaration = prod[1]
             variables = []
         elif prod.slice[1].type == "variable_declarations":
-            file_declaration = {}
+            file_declaration = None
             variables = prod[1]
     else:
         file_declaration, variables = None, []
 
-    prod[0] = {
-        "file declaration": file_declaration,
-        "variables":        variables
-    }
+    prod[0] = nodes.SetupProgram(file_declaration, variables)
 
 def p_file_declaration(prod):
     """file_declaration : PROJECTDEC STRING SEMICOLON
@@ -49,26 +49,20 @@ def p_file_declaration(prod):
     else:
         filename = prod[4]
 
-    prod[0] = {
-        "project name": prod[2],
-        "filename":     filename
-    }
+    prod[0] = nodes.FileDeclaration(prod[2], filename)
 
 def p_variable_declarations(prod):
-    """variable_declarations : set_variable variable_declarations
+    """variable_declarations : variable_declarations set_variable
                              | set_variable"""
     if len(prod) == 3:
-        prod[0] = [prod[1]] + prod[2]
+        prod[1].append(prod[2])
+        prod[0] = prod[1]
     else:
         prod[0] = [prod[1]]
 
 def p_variable(prod):
     """variable : VARIABLE"""
-    prod[0] = {
-        "lexpos":  prod.lexpos(1),
-        "type":    "variable",
-        "variable": prod[1]
-    }
+    prod[0] = nodes.Variable(prod.lexpos(1), prod[1])
 
 def p_expression(prod):
     """expression : number
@@ -89,17 +83,13 @@ def p_expression(prod):
 def p_set_variable(prod):
     """set_variable : VARIABLE type_declaration EQUALS expression SEMICOLON
                     | VARIABLE type_declaration EQUALS list SEMICOLON"""
-    prod[0] = {
-        "lexpos": prod.lexpos(1),
-        "name":   prod[1],
-        "type":   prod[2],
-        "value":  prod[4]
-    }
+    prod[0] = nodes.SetupVariable(prod.lexpos(1), prod[1], prod[2], prod[4])
 
 def p_error(token):
-    stack = [sym.type for sym in parser.symstack[1:]]
-    state = parser.state
-    expected = parser.action[state].keys()
+    active_parser, _ = get_context().get_parser(parser, lexer)
+    stack = [sym.type for sym in active_parser.symstack[1:]]
+    state = active_parser.state
+    expected = active_parser.action[state].keys()
     current_token = token.type if token else "EOF"
     set_lexpos(token.lexpos if token else None)
 
@@ -118,17 +108,20 @@ def p_error(token):
     if "VARIABLE" in stack:
         code_error("Unexpected variable")
 
-    print("Uncaught setup parsing error, please report in the repository")
-    print("-" * 50)
-    print(f"Syntax error at line {token.lineno if token else 'EOF'}")
-    print(f"Token: {current_token}")
-    print(f"Expected: {', '.join(expected)}")
-    print(f"Symbol stack (state {state}): {stack}")
-
-    exit()
+    raise CompileError("\n".join((
+        "Uncaught setup parsing error, please report in the repository",
+        "-" * 50,
+        f"Syntax error at line {token.lineno if token else 'EOF'}",
+        f"Token: {current_token}",
+        f"Expected: {', '.join(expected)}",
+        f"Symbol stack (state {state}): {stack}"
+    )))
 
 debug("Initializing setup parser")
-parser = yacc.yacc(debug=False, optimize=True)
+parser = load_parser(sys.modules[__name__])
 
+# Parses the current file with the current compilation's own parser and lexer
 def parse_file():
-    return parser.parse(filestate.read_file(), lexer=lexer)
+    active_parser, active_lexer = get_context().get_parser(parser, lexer)
+    active_lexer.lineno = 1 # Otherwise line numbers carry on from the previously parsed file
+    return active_parser.parse(filestate.read_file(), lexer=active_lexer)
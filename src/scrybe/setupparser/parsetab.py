@@ -0,0 +1,82 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftORleftANDleftEQUALTONOTEQUALTOleftLESSTHANGREATERTHANLESSTHANEQUALGREATERTHANEQUALleftPLUSMINUSleftTIMESDIVIDEDBYMODULOleftEXPONENTrightUMINUSAND BOOLTYPE COLON COMMA CONCAT CONCATASSIGN CONST DECIMAL DIVIDEDBY DIVIDEDBYASSIGN DOT EQUALS EQUALTO EXPONENT EXPONENTASSIGN FALSE FILENAMEDEC GREATERTHAN GREATERTHANEQUAL IN INTEGER LBRACKET LESSTHAN LESSTHANEQUAL LPAREN MINUS MINUSASSIGN MODULO MODULOASSIGN NOT NOTEQUALTO NUMTYPE OR PLUS PLUSASSIGN PROJECTDEC RBRACKET RPAREN SEMICOLON STRING STRTYPE TIMES TIMESASSIGN TRUE VARIABLE VARTYPEprogram : file_declaration variable_declarations\n               | file_declaration\n               | variable_declarations\n               | file_declaration : PROJECTDEC STRING SEMICOLON\n                        | PROJECTDEC STRING FILENAMEDEC STRING SEMICOLONvariable_declarations : variable_declarations set_variable\n                             | set_variablevariable : VARIABLEexpression : number\n                  | STRING\n                  | boolean\n                  | variable\n                  | concatenation\n                  | numerical_operation\n                  | comparison_operation\n                  | logical_operation\n                  | LPAREN expression RPARENset_variable : VARIABLE type_declaration EQUALS expression SEMICOLON\n                    | VARIABLE type_declaration EQUALS list SEMICOLONnumber : DECIMAL\n              | INTEGERboolean : TRUE\n               | FALSElist : LBRACKET expression_list RBRACKET\n            | LBRACKET RBRACKETexpression_list : expression\n                       | expression_list COMMA expressiontype : NUMTYPE\n            | STRTYPE\n            | BOOLTYPE\n            | VARTYPEtype_declaration : COLON type\n                        | LBRACKET RBRACKETconcatenation : expression CONCAT expressionnumerical_operation : expression PLUS expression\n                           | expression MINUS expression\n                           | expression TIMES expression\n                           | expression DIVIDEDBY expression\n                           | expression MODULO expression\n                           | expression EXPONENT expression\n                           | MINUS expression %prec UMINUScomparison_operation : expression LESSTHAN expression\n                            | expression GREATERTHAN expression\n                            | expression LESSTHANEQUAL expression\n                            | expression GREATERTHANEQUAL expression\n                            | expression EQUALTO expression\n                            | expression NOTEQUALTO expressionlogical_operation : NOT expression\n                         | expression AND expression\n                         | expression OR expression\n                         | expression IN expression'
+    
+_lr_action_items = {'$end':([0,1,2,3,5,7,8,13,42,43,60,],[-4,0,-2,-3,-8,-1,-7,-5,-6,-19,-20,]),'PROJECTDEC':([0,],[4,]),'VARIABLE':([0,2,3,5,7,8,13,15,34,35,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,85,],[6,6,6,-8,6,-7,-5,23,23,23,23,23,-6,-19,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,-20,23,]),'STRING':([4,14,15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[9,22,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'COLON':([6,],[11,]),'LBRACKET':([6,15,],[12,35,]),'SEMICOLON':([9,22,23,24,25,26,27,28,29,30,31,32,33,36,37,38,39,63,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,],[13,42,-9,43,60,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,-26,-42,-49,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,-47,-48,-50,-51,-52,-18,-25,]),'FILENAMEDEC':([9,],[14,]),'EQUALS':([10,16,17,18,19,20,21,],[15,-33,-29,-30,-31,-32,-34,]),'NUMTYPE':([11,],[17,]),'STRTYPE':([11,],[18,]),'BOOLTYPE':([11,],[19,]),'VARTYPE':([11,],[20,]),'RBRACKET':([12,23,26,27,28,29,30,31,32,33,35,36,37,38,39,62,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[21,-9,-10,-11,-12,-13,-14,-15,-16,-17,63,-21,-22,-23,-24,84,-27,-42,-49,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,-47,-48,-50,-51,-52,-18,-28,]),'LPAREN':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'DECIMAL':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'INTEGER':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'TRUE':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'FALSE':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'MINUS':([15,23,24,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,85,86,],[40,-9,46,-10,-11,-12,-13,-14,-15,-16,-17,40,40,-21,-22,-23,-24,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,46,46,-42,46,46,-36,-37,-38,-39,-40,-41,46,46,46,46,46,46,46,46,46,-18,40,46,]),'NOT':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'CONCAT':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,44,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,44,44,-42,44,44,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,-47,-48,-50,-51,44,-18,44,]),'PLUS':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,45,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,45,45,-42,45,45,-36,-37,-38,-39,-40,-41,45,45,45,45,45,45,45,45,45,-18,45,]),'TIMES':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,47,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,47,47,-42,47,47,47,47,-38,-39,-40,-41,47,47,47,47,47,47,47,47,47,-18,47,]),'DIVIDEDBY':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,48,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,48,48,-42,48,48,48,48,-38,-39,-40,-41,48,48,48,48,48,48,48,48,48,-18,48,]),'MODULO':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,49,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,49,49,-42,49,49,49,49,-38,-39,-40,-41,49,49,49,49,49,49,49,49,49,-18,49,]),'EXPONENT':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,50,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,50,50,-42,50,50,50,50,50,50,50,-41,50,50,50,50,50,50,50,50,50,-18,50,]),'LESSTHAN':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,51,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,51,51,-42,51,51,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,51,51,51,51,51,-18,51,]),'GREATERTHAN':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,52,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,52,52,-42,52,52,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,52,52,52,52,52,-18,52,]),'LESSTHANEQUAL':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,53,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,53,53,-42,53,53,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,53,53,53,53,53,-18,53,]),'GREATERTHANEQUAL':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,54,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,54,54,-42,54,54,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,54,54,54,54,54,-18,54,]),'EQUALTO':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,55,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,55,55,-42,55,55,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,-47,-48,55,55,55,-18,55,]),'NOTEQUALTO':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,56,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,56,56,-42,56,56,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,-47,-48,56,56,56,-18,56,]),'AND':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,57,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,57,57,-42,57,57,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,-47,-48,-50,57,57,-18,57,]),'OR':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,58,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,58,58,-42,58,58,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,-47,-48,-50,-51,58,-18,58,]),'IN':([23,24,26,27,28,29,30,31,32,33,36,37,38,39,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,59,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,59,59,-42,59,59,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,-47,-48,-50,-51,59,-18,59,]),'RPAREN':([23,26,27,28,29,30,31,32,33,36,37,38,39,61,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,],[-9,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,83,-42,-49,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,-47,-48,-50,-51,-52,-18,]),'COMMA':([23,26,27,28,29,30,31,32,33,36,37,38,39,62,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,86,],[-9,-10,-11,-12,-13,-14,-15,-16,-17,-21,-22,-23,-24,85,-27,-42,-49,-35,-36,-37,-38,-39,-40,-41,-43,-44,-45,-46,-47,-48,-50,-51,-52,-18,-28,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'file_declaration':([0,],[2,]),'variable_declarations':([0,2,],[3,7,]),'set_variable':([0,2,3,7,],[5,5,8,8,]),'type_declaration':([6,],[10,]),'type':([11,],[16,]),'expression':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[24,61,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,86,]),'list':([15,],[25,]),'number':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'boolean':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'variable':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'concatenation':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'numerical_operation':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'comparison_operation':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'logical_operation':([15,34,35,40,41,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'expression_list':([35,],[62,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> file_declaration variable_declarations','program',2,'p_program','parser.py',23),
+  ('program -> file_declaration','program',1,'p_program','parser.py',24),
+  ('program -> variable_declarations','program',1,'p_program','parser.py',25),
+  ('program -> <empty>','program',0,'p_program','parser.py',26),
+  ('file_declaration -> PROJECTDEC STRING SEMICOLON','file_declaration',3,'p_file_declaration','parser.py',46),
+  ('file_declaration -> PROJECTDEC STRING FILENAMEDEC STRING SEMICOLON','file_declaration',5,'p_file_declaration','parser.py',47),
+  ('variable_declarations -> variable_declarations set_variable','variable_declarations',2,'p_variable_declarations','parser.py',59),
+  ('variable_declarations -> set_variable','variable_declarations',1,'p_variable_declarations','parser.py',60),
+  ('variable -> VARIABLE','variable',1,'p_variable','parser.py',68),
+  ('expression -> number','expression',1,'p_expression','parser.py',76),
+  ('expression -> STRING','expression',1,'p_expression','parser.py',77),
+  ('expression -> boolean','expression',1,'p_expression','parser.py',78),
+  ('expression -> variable','expression',1,'p_expression','parser.py',79),
+  ('expression -> concatenation','expression',1,'p_expression','parser.py',80),
+  ('expression -> numerical_operation','expression',1,'p_expression','parser.py',81),
+  ('expression -> comparison_operation','expression',1,'p_expression','parser.py',82),
+  ('expression -> logical_operation','expression',1,'p_expression','parser.py',83),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','parser.py',84),
+  ('set_variable -> VARIABLE type_declaration EQUALS expression SEMICOLON','set_variable',5,'p_set_variable','parser.py',92),
+  ('set_variable -> VARIABLE type_declaration EQUALS list SEMICOLON','set_variable',5,'p_set_variable','parser.py',93),
+  ('number -> DECIMAL','number',1,'p_number','parser.py',192),
+  ('number -> INTEGER','number',1,'p_number','parser.py',193),
+  ('boolean -> TRUE','boolean',1,'p_boolean','parser.py',197),
+  ('boolean -> FALSE','boolean',1,'p_boolean','parser.py',198),
+  ('list -> LBRACKET expression_list RBRACKET','list',3,'p_list','parser.py',202),
+  ('list -> LBRACKET RBRACKET','list',2,'p_list','parser.py',203),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','parser.py',252),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','parser.py',253),
+  ('type -> NUMTYPE','type',1,'p_type','parser.py',280),
+  ('type -> STRTYPE','type',1,'p_type','parser.py',281),
+  ('type -> BOOLTYPE','type',1,'p_type','parser.py',282),
+  ('type -> VARTYPE','type',1,'p_type','parser.py',283),
+  ('type_declaration -> COLON type','type_declaration',2,'p_type_declaration','parser.py',291),
+  ('type_declaration -> LBRACKET RBRACKET','type_declaration',2,'p_type_declaration','parser.py',292),
+  ('concatenation -> expression CONCAT expression','concatenation',3,'p_concatenation','parser.py',301),
+  ('numerical_operation -> expression PLUS expression','numerical_operation',3,'p_numerical_operation','parser.py',309),
+  ('numerical_operation -> expression MINUS expression','numerical_operation',3,'p_numerical_operation','parser.py',310),
+  ('numerical_operation -> expression TIMES expression','numerical_operation',3,'p_numerical_operation','parser.py',311),
+  ('numerical_operation -> expression DIVIDEDBY expression','numerical_operation',3,'p_numerical_operation','parser.py',312),
+  ('numerical_operation -> expression MODULO expression','numerical_operation',3,'p_numerical_operation','parser.py',313),
+  ('numerical_operation -> expression EXPONENT expression','numerical_operation',3,'p_numerical_operation','parser.py',314),
+  ('numerical_operation -> MINUS expression','numerical_operation',2,'p_numerical_operation','parser.py',315),
+  ('comparison_operation -> expression LESSTHAN expression','comparison_operation',3,'p_comparison_operation','parser.py',324),
+  ('comparison_operation -> expression GREATERTHAN expression','comparison_operation',3,'p_comparison_operation','parser.py',325),
+  ('comparison_operation -> expression LESSTHANEQUAL expression','comparison_operation',3,'p_comparison_operation','parser.py',326),
+  ('comparison_operation -> expression GREATERTHANEQUAL expression','comparison_operation',3,'p_comparison_operation','parser.py',327),
+  ('comparison_operation -> expression EQUALTO expression','comparison_operation',3,'p_comparison_operation','parser.py',328),
+  ('comparison_operation -> expression NOTEQUALTO expression','comparison_operation',3,'p_comparison_operation','parser.py',329),
+  ('logical_operation -> NOT expression','logical_operation',2,'p_logical_operation','parser.py',338),
+  ('logical_operation -> expression AND expression','logical_operation',3,'p_logical_operation','parser.py',339),
+  ('logical_operation -> expression OR expression','logical_operation',3,'p_logical_operation','parser.py',340),
+  ('logical_operation -> expression IN expression','logical_operation',3,'p_logical_operation','parser.py',341),
+]
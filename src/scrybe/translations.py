@@ -3,9 +3,11 @@ from ScratchGen.datacontainer import DataContainer
 from ScratchGen import constants
 from ScratchGen.datacontainer import List
 import operator
+import re
 from .logger import code_error
 from .types import Types
 from .utils import get_depth, set_type
+from . import nodes
 
 def _chain_multiply(base, exponent):
     if exponent == 2:
@@ -50,23 +52,79 @@ def _scrybe_exp(base, exponent):
     sign_part = Add(Multiply(Multiply(LessThan(Modulo(Add(exponent, 1), 2), 1), Multiply(-1, LessThan(base, 0))), 2), 1)
     return Multiply(exponent_part, sign_part)
 
+# Literals divided by zero are left for Scratch, which reports infinity or NaN instead of failing
+def _scrybe_divide(x, y):
+    if isinstance(x, (int, float)) and isinstance(y, (int, float)) and y == 0:
+        return Divide(x, y)
+    return x / y
+
+def _scrybe_modulo(x, y):
+    if isinstance(x, (int, float)) and isinstance(y, (int, float)) and y == 0:
+        return Modulo(x, y)
+    return x % y
+
 numerical_operations = {
     "+":        operator.add,
     "-":        operator.sub,
     "*":        operator.mul,
-    "/":        operator.truediv,
-    "%":        operator.mod,
+    "/":        _scrybe_divide,
+    "%":        _scrybe_modulo,
     "**":       _scrybe_exp,
     "negation": operator.neg
 }
 
+# Strings that Scratch certainly reads as numbers when comparing them
+_number_pattern = re.compile(r"\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*")
+
+# A literal the way Scratch compares it: numbers (and strings of numbers) by their
+# value, other strings without case. None if it's unclear how Scratch reads it,
+# like "0x10" or "Infinity"
+def _as_comparand(literal):
+    if isinstance(literal, bool) or not isinstance(literal, (int, float, str)):
+        return None
+    if isinstance(literal, (int, float)):
+        return literal
+
+    if _number_pattern.fullmatch(literal):
+        return float(literal)
+    if not any(character.isdigit() for character in literal) and "infinity" not in literal.lower():
+        return literal.lower()
+
+# Two literals to compare at compile time, or None if the comparison must be left to Scratch
+# Scratch only compares two values as numbers if both are numbers
+def _literal_comparands(x, y):
+    x_comparand, y_comparand = _as_comparand(x), _as_comparand(y)
+    if x_comparand is None or y_comparand is None:
+        return None
+
+    if isinstance(x_comparand, str) or isinstance(y_comparand, str):
+        if not (isinstance(x, str) and isinstance(y, str)):
+            return None
+        return x.lower(), y.lower()
+
+    return x_comparand, y_comparand
+
+# Comparisons of two literals are folded like Scratch would compare them. Blocks
+# are compared with their operators, or with `block_operation` if there isn't one
+def _comparison(operation, block_operation=None):
+    def compare(x, y):
+        comparands = _literal_comparands(x, y)
+        if comparands:
+            return operation(*comparands)
+
+        if block_operation and (isinstance(x, (Block, DataContainer)) or isinstance(y, (Block, DataContainer))):
+            return block_operation(x, y)
+        return operation(x, y)
+
+    return compare
+
 comparison_operations = {
-    "<":   operator.lt,
-    ">":   operator.gt,
-    "<=":  operator.le,
-    ">=":  operator.ge,
-    "==":  operator.eq,
-    "!=":  operator.ne
+    "<":   _comparison(operator.lt),
+    ">":   _comparison(operator.gt),
+    "<=":  _comparison(operator.le),
+    ">=":  _comparison(operator.ge),
+    "==":  _comparison(operator.eq),
+    "!=":  _comparison(operator.ne, lambda x, y: Not(Equals(x, y))) # Blocks have no `!=` operator
 }
 
 def _scrybe_not(x):
@@ -87,9 +145,9 @@ def _scrybe_and(x, y):
         return Equals(int(x and y), 1)
 
     # x and true == x
-    # x and false == not x
-    if x_is_bool: return y if x else Not(y)
-    if y_is_bool: return x if y else Not(x)
+    # x and false == false
+    if x_is_bool: return y if x else Equals(0, 1)
+    if y_is_bool: return x if y else Equals(0, 1)
 
     return And(x, y)
 
@@ -423,16 +481,14 @@ list_functions = {
 # For example: `this.x` -> `{... AST exp. ...}` -> `XPosition`
 def _resolve(attribute, nested_dict):
     try:
-        if not isinstance(attribute, dict):
+        if not isinstance(attribute, nodes.Node):
             return nested_dict[attribute]
 
-        if attribute["type"] == "variable":
-            return nested_dict[attribute["variable"]]
+        if isinstance(attribute, nodes.Variable):
+            return nested_dict[attribute.name]
 
-        object = attribute["object"]
-        possible_attributes = _resolve(object, nested_dict)
-        attribute = attribute["attribute"]
-        return possible_attributes[attribute]
+        possible_attributes = _resolve(attribute.object, nested_dict)
+        return possible_attributes[attribute.attribute]
 
     except:
         return None
@@ -2,7 +2,7 @@ from enum import Flag, auto
 from .logger import code_error
 from ScratchGen.blocks import Block, Reporter, Boolean
 from ScratchGen.datacontainer import DataContainer, Variable, List
-from ScratchGen import *
+from ScratchGen.blocks import *  # Not `ScratchGen`, whose `__all__` overwrites module dunders
 
 class Types(Flag):
     NUMBER  = auto()
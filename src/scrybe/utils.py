@@ -1,5 +1,5 @@
 from ply.yacc import PlyLogger
-from copy import deepcopy
+from copy import copy
 
 forbidden_chars = r'<>:"/\|?*'
 
@@ -23,8 +23,11 @@ def get_depth(object):
         return 1
     return sum(map(get_depth, object.contained_blocks)) + 1
 
+# Get a view of a block or variable that Scrybe treats as a different type
+# A shallow copy is enough: it shares its ID, inputs and contained blocks with
+# the original, and only the copy is ever attached to a parent block
 def set_type(object, type):
-    copy = deepcopy(object)
-    copy.type = type
+    typed_object = copy(object)
+    typed_object.type = type
 
-    return copy
+    return typed_object